@@ -1,6 +1,7 @@
 import logging
+from pathlib import Path
 from PySide6.QtCore import QUrl, QTimer
-from PySide6.QtMultimedia import QSoundEffect
+from backend.telemetry.tones import ToneBank
 try:
     import winsound
 except Exception:
@@ -8,53 +9,96 @@ except Exception:
 
 
 class AlertManager:
-    def __init__(self, backend):
+    def __init__(self, backend, fast_startup=False):
         self.backend = backend
-        self.sound = QSoundEffect()
-        self._looping = False
+        self.tones = getattr(backend, 'tones', None) or ToneBank(Path(__file__).resolve().parent / "assets")
+        self.sounds = {}
+        self._sounds_ready = False
+        # severity of the tone currently looping and the unacknowledged
+        # (id, severity) set it was chosen for
+        self._severity = None
+        self._unacked = frozenset()
         self._beep_timer = QTimer()
-        self._beep_timer.setInterval(800)
         self._beep_timer.timeout.connect(self._play_once)
 
-        sound_path = backend.getAlertSoundPath()
-        if sound_path:
-            self.sound.setSource(QUrl.fromLocalFile(sound_path))
-            self.sound.setVolume(0.9)
-            self._sound_path = sound_path
-        
-        backend.warningRaised.connect(self._update)
+        # QtMultimedia is slow to initialise; in fast startup mode it is
+        # only loaded when the first alert needs to be played
+        if not fast_startup:
+            self._ensure_sounds()
+
+        # every raise, clear or acknowledgement arrives as one diff carrying
+        # the active set, so nothing is refetched from the backend
         backend.activeWarningsUpdated.connect(self._update)
-    
-    def _update(self, _=None):
-        has_unacked = any(not w.get('acknowledged') 
-                         for w in self.backend.getActiveWarnings())
-        logging.debug("AlertManager._update called; has_unacked=%s", has_unacked)
-        
-        if has_unacked and not self._looping:
-            # Start repeating short beeps
+
+    def _ensure_sounds(self):
+        if self._sounds_ready:
+            return
+        self._sounds_ready = True
+        try:
+            from PySide6.QtMultimedia import QSoundEffect
+        except Exception:
+            logging.exception("QtMultimedia unavailable; alerts fall back to winsound")
+            return
+        # QSoundEffect decodes the whole file on setSource, so every play()
+        # afterwards comes from an in-memory buffer
+        for severity in self.tones.PRIORITY:
+            try:
+                effect = QSoundEffect()
+                # the first alert may arrive on the MQTT thread; keep the
+                # effects owned by the GUI thread like the beep timer
+                effect.moveToThread(self._beep_timer.thread())
+                effect.setSource(QUrl.fromLocalFile(self.tones.path(severity)))
+                effect.setVolume(0.9)
+                self.sounds[severity] = effect
+            except Exception:
+                logging.exception("Failed preparing %s alert tone", severity)
+
+    def _update(self, diff=None):
+        active = diff.get('active', ()) if diff else self.backend.getActiveWarnings()
+        unacked = frozenset((w.get('id'), self.tones.severity_of(w))
+                            for w in active
+                            if not w.get('acknowledged'))
+        if unacked == self._unacked:
+            return
+        self._unacked = unacked
+        severity = self.tones.select(sev for _, sev in unacked)
+        logging.debug("AlertManager._update: %d unacked, tone=%s", len(unacked), severity)
+        if severity == self._severity:
+            return
+        self._severity = severity
+
+        if severity is not None:
+            # (re)start the single scheduler at the cadence of the most severe tone
+            self._beep_timer.setInterval(self.tones.tone(severity).interval_ms)
             self._play_once()
             self._beep_timer.start()
-            self._looping = True
-        elif not has_unacked and self._looping:
+        else:
             self._beep_timer.stop()
-            try:
-                self.sound.stop()
-            except Exception:
-                logging.exception("QSoundEffect stop failed")
+            for effect in self.sounds.values():
+                try:
+                    effect.stop()
+                except Exception:
+                    logging.exception("QSoundEffect stop failed")
             try:
                 if winsound is not None:
                     winsound.PlaySound(None, winsound.SND_ASYNC)
             except Exception:
                 logging.exception("winsound stop failed")
-            self._looping = False
 
     def _play_once(self):
+        severity = self._severity
+        if severity is None:
+            return
         try:
-            self.sound.play()
+            self._ensure_sounds()
+            effect = self.sounds.get(severity) or self.sounds.get("critical")
+            if effect is None:
+                raise RuntimeError("no sound effect available")
+            effect.play()
         except Exception:
             logging.exception("QSoundEffect play failed; attempting winsound fallback")
-            if winsound is not None and getattr(self, '_sound_path', None):
+            if winsound is not None:
                 try:
-                    winsound.PlaySound(self._sound_path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+                    winsound.PlaySound(self.tones.path(severity), winsound.SND_FILENAME | winsound.SND_ASYNC)
                 except Exception:
                     logging.exception("winsound PlaySound failed")
@@ -0,0 +1,178 @@
+import threading
+import time
+from typing import Optional
+
+
+class Clock:
+    """Time source used by the ticking components.
+
+    `time()` is wall-clock epoch seconds (timestamps), `monotonic()` measures
+    intervals and `sleep()` paces loops. Components take an optional clock
+    and fall back to `SYSTEM_CLOCK`, so simulations and soak runs can swap
+    in a `VirtualClock`.
+    """
+
+    def time(self) -> float:
+        raise NotImplementedError
+
+    def monotonic(self) -> float:
+        raise NotImplementedError
+
+    def sleep(self, seconds: float):
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+
+SYSTEM_CLOCK = SystemClock()
+
+
+class VirtualClock(Clock):
+    """Simulated time, either scaled or stepped.
+
+    With a `speed`, virtual time runs continuously at `speed` times real
+    time and `sleep` blocks for the scaled-down real duration.
+
+    Without one the clock is stepped: time only moves when the driver calls
+    `advance`, `step` or `run_for`. `step` first waits until every thread
+    it woke is sleeping again (or `settle` seconds pass), then jumps straight
+    to the earliest pending wake-up, so a loop sleeping one second per tick
+    runs as fast as its body allows while ticks still happen in order.
+
+    `stop()` releases all sleepers and makes later sleeps return at once,
+    which lets loops that check a running flag exit.
+    """
+
+    def __init__(self, start: Optional[float] = None, speed: Optional[float] = None, settle: float = 1.0):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self.settle = settle
+        self._epoch = time.time() if start is None else float(start)
+        self._now = 0.0
+        self._real_base = time.monotonic()
+        self._cond = threading.Condition()
+        self._deadlines = []
+        # threads woken by a step that have not gone back to sleep yet
+        self._running = 0
+        self._awake = threading.local()
+        self._stopped = False
+
+    def _elapsed(self) -> float:
+        if self.speed is None:
+            return self._now
+        return self._now + (time.monotonic() - self._real_base) * self.speed
+
+    def time(self) -> float:
+        return self._epoch + self._elapsed()
+
+    def monotonic(self) -> float:
+        return self._elapsed()
+
+    def sleep(self, seconds: float):
+        with self._cond:
+            if getattr(self._awake, "flag", False):
+                self._awake.flag = False
+                self._running = max(0, self._running - 1)
+                self._cond.notify_all()
+            if self._stopped:
+                return
+            # [deadline, released by the driver]
+            entry = [self._elapsed() + max(0.0, seconds), False]
+            self._deadlines.append(entry)
+            self._cond.notify_all()
+            try:
+                while not self._stopped:
+                    remaining = entry[0] - self._elapsed()
+                    if remaining <= 0:
+                        break
+                    if self.speed is None:
+                        self._cond.wait()
+                    else:
+                        self._cond.wait(remaining / self.speed)
+            finally:
+                self._deadlines.remove(entry)
+            # the driver counted this thread as running when it released it
+            self._awake.flag = entry[1]
+
+    def _release_due(self):
+        # called with the condition held after moving time forward
+        for entry in self._deadlines:
+            if not entry[1] and entry[0] <= self._now:
+                entry[1] = True
+                self._running += 1
+        self._cond.notify_all()
+
+    def advance(self, seconds: float):
+        """Move virtual time forward and wake the sleepers that are due."""
+        with self._cond:
+            self._now += max(0.0, seconds)
+            if self.speed is None:
+                self._release_due()
+            else:
+                self._cond.notify_all()
+
+    def _settle(self):
+        # called with the condition held
+        deadline = time.monotonic() + self.settle
+        while self._running > 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # a woken thread left its loop without sleeping again
+                self._running = 0
+                break
+            self._cond.wait(remaining)
+
+    def step(self) -> bool:
+        """Jump to the next pending wake-up; False if nobody is sleeping."""
+        if self.speed is not None:
+            raise RuntimeError("step() needs a stepped clock (speed=None)")
+        with self._cond:
+            self._settle()
+            if not self._deadlines:
+                return False
+            self._now = max(self._now, min(entry[0] for entry in self._deadlines))
+            self._release_due()
+            return True
+
+    def run_for(self, seconds: float):
+        """Step through `seconds` of virtual time as fast as the sleepers allow."""
+        if self.speed is not None:
+            time.sleep(seconds / self.speed)
+            return
+        target = self._now + seconds
+        while True:
+            with self._cond:
+                self._settle()
+                due = [entry[0] for entry in self._deadlines if entry[0] <= target]
+                if not due:
+                    self._now = max(self._now, target)
+                    self._release_due()
+                    return
+                self._now = max(self._now, min(due))
+                self._release_due()
+
+    def wait_for_sleepers(self, count: int, timeout: float = 5.0) -> bool:
+        """Block until `count` threads are sleeping, e.g. before the first step."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while len(self._deadlines) < count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
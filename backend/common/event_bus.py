@@ -0,0 +1,254 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# what publish does when a subscriber's queue is full
+DROP_OLDEST = "drop_oldest"   # discard the oldest queued event (freshest data wins)
+DROP_NEWEST = "drop_newest"   # discard the event being published
+BLOCK = "block"               # wait for room, up to the subscription's block_timeout
+
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+# smoothing factor of the average lag and handler time
+_EWMA = 0.05
+
+
+class Subscription:
+    """One subscriber: a bounded queue, its overflow policy and a worker.
+
+    The worker is a daemon thread, or a task on `loop` when one is given.
+    It calls `handler(topic, payload)`; with a loop the handler may also be
+    a coroutine function. Lag is measured from publish to the handler call.
+    """
+
+    def __init__(self, bus: "EventBus", topic: str, handler: Callable, name: str, maxsize: int, overflow: str,
+                 block_timeout: Optional[float], loop: Optional[asyncio.AbstractEventLoop]):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.bus = bus
+        self.topic = topic
+        self.handler = handler
+        self.name = name
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.loop = loop
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        # asyncio worker parked on this event while the queue is empty
+        self._wakeup: Optional[asyncio.Event] = None
+        self._waiting = False
+
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self.lag_avg = 0.0
+        self.handler_avg = 0.0
+
+        if loop is None:
+            self._worker = threading.Thread(target=self._run_thread, name=f"bus-{name}", daemon=True)
+            self._worker.start()
+        else:
+            self._worker = asyncio.run_coroutine_threadsafe(self._run_async(), loop)
+
+    def matches(self, topic: str) -> bool:
+        pattern = self.topic
+        if pattern == "#":
+            return True
+        if pattern.endswith("/#"):
+            return topic == pattern[:-2] or topic.startswith(pattern[:-1])
+        return topic == pattern
+
+    def offer(self, topic: str, payload: Any) -> bool:
+        """Queue an event; returns False if it was dropped instead."""
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._queue) >= self.maxsize:
+                if self.overflow == DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.overflow == DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+                    while len(self._queue) >= self.maxsize and not self._closed:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self.dropped += 1
+                            return False
+                        self._cond.wait(remaining)
+                    if self._closed:
+                        return False
+            self._queue.append((time.monotonic(), topic, payload))
+            self.enqueued += 1
+            depth = len(self._queue)
+            if depth > self.max_depth:
+                self.max_depth = depth
+            if self.loop is None:
+                self._cond.notify_all()
+            elif self._waiting:
+                self._waiting = False
+                try:
+                    self.loop.call_soon_threadsafe(self._wakeup.set)
+                except RuntimeError:
+                    # the loop has been closed under us
+                    pass
+        return True
+
+    def _take(self):
+        # called with the condition held and a non-empty queue
+        item = self._queue.popleft()
+        if self.overflow == BLOCK:
+            self._cond.notify_all()
+        return item
+
+    def _deliver(self, item):
+        enqueued_at, topic, payload = item
+        started = time.monotonic()
+        lag = started - enqueued_at
+        self.lag_last = lag
+        if lag > self.lag_max:
+            self.lag_max = lag
+        self.lag_avg += (lag - self.lag_avg) * _EWMA
+        return started, topic, payload
+
+    def _finish(self, started):
+        self.delivered += 1
+        self.handler_avg += (time.monotonic() - started - self.handler_avg) * _EWMA
+
+    def _run_thread(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                item = self._take()
+            started, topic, payload = self._deliver(item)
+            try:
+                self.handler(topic, payload)
+            except Exception:
+                self.errors += 1
+                logger.exception("Error in event bus subscriber %s", self.name)
+            self._finish(started)
+
+    async def _run_async(self):
+        self._wakeup = asyncio.Event()
+        while True:
+            with self._cond:
+                if not self._queue:
+                    if self._closed:
+                        return
+                    self._wakeup.clear()
+                    self._waiting = True
+                    item = None
+                else:
+                    item = self._take()
+            if item is None:
+                await self._wakeup.wait()
+                continue
+            started, topic, payload = self._deliver(item)
+            try:
+                result = self.handler(topic, payload)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                self.errors += 1
+                logger.exception("Error in event bus subscriber %s", self.name)
+            self._finish(started)
+
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def close(self, timeout: Optional[float] = 1.0):
+        """Stop accepting events; the worker drains what is queued, then exits."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            if self.loop is not None and self._waiting and not self.loop.is_closed():
+                self._waiting = False
+                try:
+                    self.loop.call_soon_threadsafe(self._wakeup.set)
+                except RuntimeError:
+                    pass
+        if self.loop is None and self._worker is not threading.current_thread():
+            self._worker.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "topic": self.topic,
+            "overflow": self.overflow,
+            "maxsize": self.maxsize,
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "lag_ms": round(self.lag_last * 1000.0, 3),
+            "lag_avg_ms": round(self.lag_avg * 1000.0, 3),
+            "lag_max_ms": round(self.lag_max * 1000.0, 3),
+            "handler_avg_ms": round(self.handler_avg * 1000.0, 3),
+        }
+
+
+class EventBus:
+    """In-process publish/subscribe with a bounded queue per subscriber.
+
+    `publish` only appends to the queues of matching subscriptions, so the
+    publishing thread (e.g. paho's network loop) never runs consumer code
+    and a slow consumer only backs up its own queue. Topics match exactly,
+    `prefix/#` matches a prefix and `#` matches everything.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: List[Subscription] = []
+
+    def subscribe(self, topic: str, handler: Callable, name: Optional[str] = None, maxsize: int = 1024,
+                  overflow: str = DROP_OLDEST, block_timeout: Optional[float] = 1.0,
+                  loop: Optional[asyncio.AbstractEventLoop] = None) -> Subscription:
+        """Start delivering `topic` events to `handler(topic, payload)` on its own worker."""
+        sub = Subscription(self, topic, handler, name or getattr(handler, "__name__", topic), maxsize, overflow,
+                           block_timeout, loop)
+        with self._lock:
+            self._subscriptions = self._subscriptions + [sub]
+        return sub
+
+    def unsubscribe(self, sub: Subscription, timeout: Optional[float] = 1.0):
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s is not sub]
+        sub.close(timeout)
+
+    def publish(self, topic: str, payload: Any = None) -> int:
+        """Queue `payload` for every matching subscriber; returns how many took it."""
+        taken = 0
+        # the list is replaced, never mutated, so iterate without the lock
+        for sub in self._subscriptions:
+            if sub.matches(topic) and sub.offer(topic, payload):
+                taken += 1
+        return taken
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-subscriber queue depth, drop counts and publish-to-handler lag."""
+        return {sub.name: sub.stats() for sub in self._subscriptions}
+
+    def close(self, timeout: Optional[float] = 1.0):
+        with self._lock:
+            subs, self._subscriptions = self._subscriptions, []
+        for sub in subs:
+            sub.close(timeout)
@@ -0,0 +1,40 @@
+import logging
+import threading
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+
+class Signal:
+    """Minimal Qt-free signal: `connect` callables, `emit` calls them in order.
+
+    Slots run synchronously on the emitting thread, like a Qt direct
+    connection; an exception in one slot is logged and does not stop the
+    others. Callers that need another thread or an event loop wrap the slot
+    themselves (e.g. with `loop.call_soon_threadsafe`).
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._slots: List[Callable] = []
+        self._lock = threading.Lock()
+
+    def connect(self, slot: Callable):
+        with self._lock:
+            if slot not in self._slots:
+                self._slots = self._slots + [slot]
+
+    def disconnect(self, slot: Callable):
+        with self._lock:
+            self._slots = [s for s in self._slots if s != slot]
+
+    def emit(self, *args):
+        # the slot list is replaced, never mutated, so iterate without the lock
+        for slot in self._slots:
+            try:
+                slot(*args)
+            except Exception:
+                logger.exception("Error in %s slot %r", self.name or "signal", slot)
+
+    def __len__(self):
+        return len(self._slots)
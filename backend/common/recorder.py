@@ -0,0 +1,175 @@
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "recordings.db")
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS telemetry (
+        ts REAL NOT NULL,
+        suit_id TEXT,
+        o2 REAL,
+        battery REAL,
+        co2 REAL,
+        leak INTEGER,
+        suit_temp REAL,
+        external_temp REAL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_telemetry_ts ON telemetry (ts)",
+    "CREATE INDEX IF NOT EXISTS idx_telemetry_suit_ts ON telemetry (suit_id, ts)",
+    """CREATE TABLE IF NOT EXISTS mission_events (
+        ts REAL NOT NULL,
+        mission_id TEXT NOT NULL,
+        name TEXT,
+        op TEXT NOT NULL,
+        detail TEXT,
+        started INTEGER,
+        paused INTEGER,
+        elapsed_seconds INTEGER,
+        progress REAL,
+        completed_tasks INTEGER,
+        task_count INTEGER
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_mission_events_ts ON mission_events (ts)",
+    "CREATE INDEX IF NOT EXISTS idx_mission_events_mid_ts ON mission_events (mission_id, ts)",
+)
+
+_INSERT = {
+    "telemetry": "INSERT INTO telemetry (ts, suit_id, o2, battery, co2, leak, suit_temp, external_temp) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    "mission_events": ("INSERT INTO mission_events (ts, mission_id, name, op, detail, started, paused, elapsed_seconds, "
+                       "progress, completed_tasks, task_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"),
+}
+
+_STOP = object()
+
+
+class Recorder:
+    """Append-only SQLite recording of telemetry samples and mission events.
+
+    Same shape as `WarningEventLog`: the record methods only enqueue and a
+    single writer thread batches inserts and applies retention. The tables
+    are read back by `python -m backend.export`.
+    """
+
+    TABLES = ("telemetry", "mission_events")
+
+    def __init__(self, path: str = DEFAULT_PATH, max_age_seconds: Optional[float] = 7 * 24 * 3600,
+                 batch_size: int = 512, prune_interval: float = 300.0, queue_size: int = 50000):
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self.batch_size = batch_size
+        self.prune_interval = prune_interval
+        self.dropped = 0
+        self.written = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+
+        d = os.path.dirname(path)
+        if d and not os.path.exists(d):
+            os.makedirs(d, exist_ok=True)
+        conn = self._connect()
+        try:
+            for stmt in _SCHEMA:
+                conn.execute(stmt)
+            conn.commit()
+        finally:
+            conn.close()
+        self._writer = threading.Thread(target=self._writer_loop, name="recorder", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _put(self, table: str, row: tuple):
+        try:
+            self._queue.put_nowait((table, row))
+        except queue.Full:
+            self.dropped += 1
+
+    def record_telemetry(self, record):
+        leak = record.get("leak")
+        self._put("telemetry", (
+            record.get("timestamp") or time.time(), record.get("suit_id"), record.get("o2"), record.get("battery"),
+            record.get("co2"), None if leak is None else int(bool(leak)), record.get("suit_temp"),
+            record.get("external_temp"),
+        ))
+
+    def record_mission(self, op: str, mission, detail: Optional[str] = None):
+        s = mission.summary()
+        self._put("mission_events", (
+            time.time(), s["id"], s["name"], op, detail, int(s["started"]), int(s["paused"]), s["elapsed_seconds"],
+            s["progress"], s["completed_tasks"], s["task_count"],
+        ))
+
+    def _writer_loop(self):
+        conn = self._connect()
+        last_prune = 0.0
+        try:
+            while True:
+                item = self._queue.get()
+                stop = item is _STOP
+                items = [] if stop else [item]
+                while not stop and len(items) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    items.append(item)
+                if items:
+                    by_table = {}
+                    for table, row in items:
+                        by_table.setdefault(table, []).append(row)
+                    try:
+                        for table, rows in by_table.items():
+                            conn.executemany(_INSERT[table], rows)
+                        conn.commit()
+                        self.written += len(items)
+                    except Exception:
+                        logger.exception("Failed recording %d rows", len(items))
+                    for _ in items:
+                        self._queue.task_done()
+                now = time.monotonic()
+                if stop or now - last_prune >= self.prune_interval:
+                    last_prune = now
+                    self._prune(conn)
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _prune(self, conn: sqlite3.Connection):
+        if self.max_age_seconds is None:
+            return
+        try:
+            cutoff = time.time() - self.max_age_seconds
+            for table in self.TABLES:
+                conn.execute(f"DELETE FROM {table} WHERE ts < ?", (cutoff,))
+            conn.commit()
+        except Exception:
+            logger.exception("Failed pruning recordings")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = 5.0):
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Recorder queue full on close; pending rows dropped")
+        self._writer.join(timeout)
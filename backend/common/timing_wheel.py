@@ -0,0 +1,79 @@
+import math
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .clock import SYSTEM_CLOCK
+
+
+class TimingWheel:
+    """Hashed timing wheel for many resettable deadlines.
+
+    Time is cut into ticks counted from the wheel's creation. A deadline
+    due at tick `t` lives in slot `t % slots` together with the number of
+    times the cursor will pass that slot before it is due. Each slot is a
+    dict keyed by the timer key and the wheel keeps a key -> slot map, so
+    `schedule` (which also resets), `cancel` and expiry are O(1) per timer.
+    `advance` moves the cursor up to the current tick and only visits the
+    slots it passes.
+
+    Deadlines are rounded up to whole ticks. The wheel does no locking;
+    callers serialise access.
+    """
+
+    def __init__(self, tick: float = 0.5, slots: int = 512, clock=None):
+        if tick <= 0 or slots <= 0:
+            raise ValueError("tick and slots must be positive")
+        self.tick = tick
+        self.clock = clock or SYSTEM_CLOCK
+        self._slots: List[Dict[Hashable, list]] = [{} for _ in range(slots)]
+        self._where: Dict[Hashable, int] = {}
+        self._origin = self.clock.monotonic()
+        # last tick whose slot has been processed
+        self._current = 0
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, key) -> bool:
+        return key in self._where
+
+    def schedule(self, key: Hashable, delay: float, value: Any = None, now: Optional[float] = None):
+        """Arm (or re-arm) `key` to expire `delay` seconds from now."""
+        self.cancel(key)
+        now = self.clock.monotonic() if now is None else now
+        due = max(self._current + 1, math.ceil((now - self._origin + delay) / self.tick))
+        size = len(self._slots)
+        index = due % size
+        # [cursor passes left before it is due, value]
+        self._slots[index][key] = [(due - self._current - 1) // size, value]
+        self._where[key] = index
+
+    def cancel(self, key: Hashable) -> bool:
+        index = self._where.pop(key, None)
+        if index is None:
+            return False
+        del self._slots[index][key]
+        return True
+
+    def advance(self, now: Optional[float] = None) -> List[Tuple[Hashable, Any]]:
+        """Move to `now` (default: the clock) and return the expired (key, value)s."""
+        now = self.clock.monotonic() if now is None else now
+        target = int((now - self._origin) / self.tick)
+        size = len(self._slots)
+        expired = []
+        while self._current < target:
+            if not self._where:
+                # nothing armed: skip straight to the target tick
+                self._current = target
+                break
+            self._current += 1
+            slot = self._slots[self._current % size]
+            if not slot:
+                continue
+            for key, entry in list(slot.items()):
+                if entry[0] > 0:
+                    entry[0] -= 1
+                    continue
+                del slot[key]
+                del self._where[key]
+                expired.append((key, entry[1]))
+        return expired
@@ -1,3 +1,9 @@
 TRICORDER_TELEMETRY = "tricorder/telemetry"
+# batched binary frames (backend/telemetry/frames.py)
+TRICORDER_TELEMETRY_FRAMES = "tricorder/telemetry/frames"
 TRICORDER_MISSION_COMMANDS = "tricorder/mission/commands"
 TRICORDER_MISSION_STATE = "tricorder/mission/state"
+TRICORDER_MISSION_ACKS = "tricorder/mission/acks"
+TRICORDER_MISSION_CATALOG = "tricorder/mission/catalog"
+TRICORDER_MISSION_SYNC = "tricorder/mission/sync"
+TRICORDER_FORECAST = "tricorder/forecast"
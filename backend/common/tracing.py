@@ -0,0 +1,165 @@
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_args", "_start", "_sampled")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Optional[Dict[str, Any]]):
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+
+    def __enter__(self):
+        local = self._tracer._local
+        depth = getattr(local, "depth", 0)
+        if depth == 0:
+            # the sampling decision is taken once per root span so that a
+            # sampled trace always contains all of its children
+            local.sampled = self._tracer._should_sample()
+        local.depth = depth + 1
+        self._sampled = local.sampled
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        self._tracer._local.depth -= 1
+        if self._sampled:
+            self._tracer._record(self._name, self._start, end, self._args)
+        return False
+
+
+class Tracer:
+    """Records nested spans into a bounded in-memory ring buffer.
+
+    When disabled, `span()` returns a shared no-op context manager and
+    `traced()` wrappers call straight through, so instrumentation left in
+    hot paths costs a single attribute check.
+    """
+
+    def __init__(self, capacity: int = 65536, sample_rate: float = 1.0, enabled: bool = False):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self._events = deque(maxlen=capacity)
+        self._threads: Dict[int, str] = {}
+        self._local = threading.local()
+
+    def configure(self, enabled: Optional[bool] = None, sample_rate: Optional[float] = None, capacity: Optional[int] = None):
+        if capacity is not None and capacity != self._events.maxlen:
+            self._events = deque(self._events, maxlen=capacity)
+        if sample_rate is not None:
+            self.sample_rate = max(0.0, min(1.0, float(sample_rate)))
+        if enabled is not None:
+            self.enabled = bool(enabled)
+
+    def span(self, name: str, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args or None)
+
+    def traced(self, name: Optional[str] = None):
+        def decorator(fn):
+            label = name or fn.__qualname__
+
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _Span(self, label, None):
+                    return fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def _should_sample(self) -> bool:
+        rate = self.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def _record(self, name: str, start_ns: int, end_ns: int, args: Optional[Dict[str, Any]]):
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        # deque.append is atomic, so recording needs no lock
+        self._events.append((name, start_ns, end_ns, tid, args))
+
+    def clear(self):
+        self._events.clear()
+
+    def events(self) -> List[tuple]:
+        return list(self._events)
+
+    def to_chrome(self) -> Dict[str, Any]:
+        pid = os.getpid()
+        trace_events = []
+        for tid, thread_name in list(self._threads.items()):
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+        for name, start_ns, end_ns, tid, args in list(self._events):
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": start_ns / 1000.0,
+                "dur": (end_ns - start_ns) / 1000.0,
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = {k: v if isinstance(v, (int, float, str, bool)) or v is None else str(v) for k, v in args.items()}
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def dump_chrome(self, path: str) -> int:
+        data = self.to_chrome()
+        d = os.path.dirname(path)
+        if d and not os.path.exists(d):
+            os.makedirs(d, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        return len(data["traceEvents"])
+
+
+# process-wide tracer used by the instrumented hot paths
+tracer = Tracer()
+
+
+def configure_from_env(environ=None) -> Optional[str]:
+    """Enable the global tracer from HELIOS_TRACE* environment variables.
+
+    HELIOS_TRACE is the Chrome trace output path, HELIOS_TRACE_SAMPLE_RATE
+    the fraction of root spans to keep and HELIOS_TRACE_CAPACITY the ring
+    buffer size. Returns the output path when tracing was enabled.
+    """
+    env = os.environ if environ is None else environ
+    path = env.get("HELIOS_TRACE")
+    if not path:
+        return None
+    try:
+        rate = float(env.get("HELIOS_TRACE_SAMPLE_RATE", "1.0"))
+    except ValueError:
+        rate = 1.0
+    try:
+        capacity = int(env.get("HELIOS_TRACE_CAPACITY", "65536"))
+    except ValueError:
+        capacity = 65536
+    tracer.configure(enabled=True, sample_rate=rate, capacity=capacity)
+    return path
@@ -0,0 +1,246 @@
+"""Stream recorded telemetry, mission history and warnings to CSV, JSON lines
+or Arrow IPC.
+
+    python -m backend.export telemetry --since 2025-01-01T00:00 --suit suit-1 -o telemetry.csv
+    python -m backend.export missions --format jsonl -o missions.jsonl
+    python -m backend.export warnings --format arrow -o warnings.arrow
+
+Rows are read with `fetchmany` and written chunk by chunk, so memory stays
+flat however large the recording is. Arrow output needs pyarrow.
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+_repo_root = Path(__file__).resolve().parents[1]
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from backend.common.recorder import DEFAULT_PATH as RECORDINGS
+
+logger = logging.getLogger("helios.export")
+
+WARNINGS_DB = str(_repo_root / "backend" / "telemetry" / "warning_events.db")
+MISSIONS_FILE = str(_repo_root / "backend" / "mission" / "missions.json")
+
+# dataset -> (table, columns, suit column or None, id column or None)
+DATASETS = {
+    "telemetry": ("telemetry",
+                  ("ts", "suit_id", "o2", "battery", "co2", "leak", "suit_temp", "external_temp"),
+                  "suit_id", None),
+    "missions": ("mission_events",
+                 ("ts", "mission_id", "name", "op", "detail", "started", "paused", "elapsed_seconds", "progress",
+                  "completed_tasks", "task_count"),
+                 None, "mission_id"),
+    "warnings": ("warning_events",
+                 ("seq", "ts", "kind", "warning_id", "severity", "suit_id", "message", "data"),
+                 "suit_id", "warning_id"),
+}
+TASK_COLUMNS = ("mission_id", "mission_name", "task_id", "title", "description", "projected_seconds", "completed")
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds or an ISO 8601 timestamp (naive means local time)."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def iter_query(db_path: str, dataset: str, since=None, until=None, suits: Sequence[str] = (),
+               ids: Sequence[str] = (), chunk_size: int = 5000) -> Iterator[List[tuple]]:
+    table, columns, suit_col, id_col = DATASETS[dataset]
+    clauses, params = [], []
+    if since is not None:
+        clauses.append("ts >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("ts < ?")
+        params.append(until)
+    if suits:
+        if suit_col is None:
+            raise ValueError(f"{dataset} has no suit column")
+        clauses.append(f"{suit_col} IN ({','.join('?' * len(suits))})")
+        params.extend(suits)
+    if ids:
+        if id_col is None:
+            raise ValueError(f"{dataset} cannot be filtered by id")
+        clauses.append(f"{id_col} IN ({','.join('?' * len(ids))})")
+        params.extend(ids)
+    sql = f"SELECT {', '.join(columns)} FROM {table}"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY ts"
+    # read-only, so an export never blocks or locks out the running app
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        cur = conn.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    finally:
+        conn.close()
+
+
+def iter_tasks(path: str, ids: Sequence[str] = (), chunk_size: int = 5000) -> Iterator[List[tuple]]:
+    from backend.mission.persistence import PersistenceManager
+
+    wanted = set(ids)
+    chunk = []
+    # missions are parsed one at a time, so memory does not grow with the catalog
+    for m in PersistenceManager(path).iter_missions():
+        if wanted and m.id not in wanted:
+            continue
+        for t in m.tasks:
+            chunk.append((m.id, m.name, t.id, t.title, t.description, t.projected_seconds, t.completed))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+class CsvSink:
+    def __init__(self, stream, columns):
+        self.stream = stream
+        self._writer = csv.writer(stream)
+        self._writer.writerow(columns)
+
+    def write(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self.stream.flush()
+
+
+class JsonlSink:
+    def __init__(self, stream, columns):
+        self.stream = stream
+        self.columns = columns
+
+    def write(self, rows):
+        cols = self.columns
+        self.stream.write("".join(json.dumps(dict(zip(cols, row)), separators=(",", ":")) + "\n" for row in rows))
+
+    def close(self):
+        self.stream.flush()
+
+
+class ArrowSink:
+    def __init__(self, stream, columns):
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc
+        except ImportError:
+            raise RuntimeError("Arrow output requires pyarrow (pip install pyarrow)") from None
+        self._pa = pa
+        self.columns = columns
+        self.stream = stream
+        self._writer = None
+
+    def write(self, rows):
+        pa = self._pa
+        arrays = [pa.array(col) for col in zip(*rows)]
+        batch = pa.RecordBatch.from_arrays(arrays, names=list(self.columns))
+        if self._writer is None:
+            # schema is inferred from the first chunk
+            self._writer = pa.ipc.new_stream(self.stream, batch.schema)
+        elif batch.schema != self._writer.schema:
+            batch = batch.cast(self._writer.schema)
+        self._writer.write_batch(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self.stream.flush()
+
+
+SINKS = {"csv": CsvSink, "jsonl": JsonlSink, "arrow": ArrowSink}
+
+
+def export(chunks: Iterator[List[tuple]], sink) -> int:
+    count = 0
+    try:
+        for rows in chunks:
+            sink.write(rows)
+            count += len(rows)
+    finally:
+        sink.close()
+    return count
+
+
+def _open_output(path: Optional[str], binary: bool):
+    if not path or path == "-":
+        return sys.stdout.buffer if binary else sys.stdout, False
+    return (open(path, "wb") if binary else open(path, "w", encoding="utf-8", newline="")), True
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Export Helios recordings")
+    parser.add_argument("dataset", choices=sorted(DATASETS) + ["tasks"])
+    parser.add_argument("-f", "--format", choices=sorted(SINKS), default=None,
+                        help="output format (default: from the output extension, else csv)")
+    parser.add_argument("-o", "--output", default="-", help="output file ('-' for stdout)")
+    parser.add_argument("--db", default=None, help="database to read (default depends on the dataset)")
+    parser.add_argument("--since", default=None, help="start time, epoch seconds or ISO 8601 (inclusive)")
+    parser.add_argument("--until", default=None, help="end time, epoch seconds or ISO 8601 (exclusive)")
+    parser.add_argument("--suit", action="append", default=[], help="only these suit ids (repeatable)")
+    parser.add_argument("--id", action="append", default=[], help="only these mission/warning ids (repeatable)")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+    fmt = args.format
+    if fmt is None:
+        ext = os.path.splitext(args.output)[1].lower().lstrip(".")
+        fmt = {"jsonl": "jsonl", "ndjson": "jsonl", "arrow": "arrow", "arrows": "arrow", "ipc": "arrow"}.get(ext, "csv")
+
+    if fmt == "arrow":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.error("Arrow output requires pyarrow (pip install pyarrow)")
+            return 2
+
+    if args.dataset == "tasks":
+        columns = TASK_COLUMNS
+        chunks = iter_tasks(args.db or MISSIONS_FILE, args.id, args.chunk_size)
+    else:
+        columns = DATASETS[args.dataset][1]
+        db = args.db or (WARNINGS_DB if args.dataset == "warnings" else RECORDINGS)
+        if not os.path.exists(db):
+            logger.error("No recordings at %s", db)
+            return 1
+        chunks = iter_query(db, args.dataset, parse_time(args.since), parse_time(args.until),
+                            args.suit, args.id, args.chunk_size)
+
+    stream, owned = _open_output(args.output, binary=(fmt == "arrow"))
+    start = time.perf_counter()
+    try:
+        count = export(chunks, SINKS[fmt](stream, columns))
+    finally:
+        if owned:
+            stream.close()
+    elapsed = time.perf_counter() - start
+    logger.info("Exported %d %s rows in %.2fs (%.0f rows/s)", count, args.dataset, elapsed,
+                count / elapsed if elapsed > 0 else 0.0)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
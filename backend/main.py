@@ -1,10 +1,15 @@
+import time
+_START = time.perf_counter()
+
 import sys
+import os
+import argparse
 import logging
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
 from PySide6.QtQuickControls2 import QQuickStyle
 from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import QUrl, QTimer
 from pathlib import Path as _Path
 import sys as _sys
 
@@ -16,24 +21,57 @@ from backend.alert_manager import AlertManager
 from backend.telemetry.suit import TricorderBackend
 from backend.mission.mission import MissionBackend
 from backend.simulator.simulator import SimulatorBackend
+from backend.common.tracing import tracer, configure_from_env
+from backend.common.recorder import Recorder
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Helios suit monitoring system")
+    parser.add_argument("--fast-startup", action="store_true",
+                        default=os.environ.get("HELIOS_FAST_STARTUP", "") not in ("", "0"),
+                        help="show the window first; connect MQTT, load missions and audio in the background")
+    parser.add_argument("--engine-process", action="store_true",
+                        default=os.environ.get("HELIOS_ENGINE_PROCESS", "") not in ("", "0"),
+                        help="run MQTT ingest and the warning engine in a separate process")
+    parser.add_argument("--no-record", action="store_true",
+                        default=os.environ.get("HELIOS_RECORD", "1") in ("", "0"),
+                        help="do not record telemetry and mission events for export")
+    parser.add_argument("--exit-after-first-frame", action="store_true",
+                        help="quit as soon as the first frame is rendered (startup benchmark)")
+    # unknown arguments are passed through to Qt
+    return parser.parse_known_args(argv[1:])
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
+    trace_path = configure_from_env()
+    args, qt_args = _parse_args(sys.argv)
+    fast = args.fast_startup
 
     try:
         QQuickStyle.setStyle('Basic')
     except Exception:
         pass
-    app = QApplication(sys.argv)
-    backend = TricorderBackend()
-    alert_mgr = AlertManager(backend)
+    app = QApplication([sys.argv[0]] + qt_args)
+    recorder = None
+    if not args.no_record:
+        try:
+            recorder = Recorder()
+        except Exception:
+            logging.exception("Failed to open recordings; telemetry will not be recorded")
+    backend = TricorderBackend(fast_startup=fast, engine_process=args.engine_process, recorder=recorder)
+    alert_mgr = AlertManager(backend, fast_startup=fast)
 
-    mission_backend = MissionBackend()
+    mission_backend = MissionBackend(fast_startup=fast, recorder=recorder)
     # mission adapter removed; QML uses `mission` directly
 
     simulator_backend = SimulatorBackend()
 
+    # depletion forecasts are compared against the time left in the mission
+    def _sync_mission_time():
+        backend.setMissionTimeRemaining(mission_backend.getMissionTimeRemaining())
+    mission_backend.missionsUpdated.connect(_sync_mission_time)
+
     engine = QQmlApplicationEngine()
     engine.rootContext().setContextProperty("backend", backend)
     # Expose the mission adapter under a single, clear name used by QML
@@ -45,6 +83,25 @@ if __name__ == "__main__":
     
     if not engine.rootObjects():
         sys.exit(-1)
+
+    first_frame_seen = []
+
+    def _on_first_frame():
+        if first_frame_seen:
+            return
+        first_frame_seen.append(True)
+        elapsed_ms = (time.perf_counter() - _START) * 1000.0
+        logging.info("Time to first frame: %.1f ms (fast_startup=%s)", elapsed_ms, fast)
+        if args.exit_after_first_frame:
+            # machine-readable line consumed by benchmarks/startup.py
+            print(f"STARTUP first_frame_ms={elapsed_ms:.1f} fast_startup={int(fast)}", flush=True)
+            QTimer.singleShot(0, app.quit)
+
+    try:
+        engine.rootObjects()[0].frameSwapped.connect(_on_first_frame)
+    except Exception:
+        logging.exception("Could not hook first-frame signal")
+
     try:
         app.aboutToQuit.connect(backend.shutdown)
     except Exception:
@@ -57,5 +114,15 @@ if __name__ == "__main__":
         app.aboutToQuit.connect(simulator_backend.shutdown)
     except Exception:
         pass
+    if recorder is not None:
+        app.aboutToQuit.connect(recorder.close)
+    if trace_path:
+        def _dump_trace():
+            try:
+                count = tracer.dump_chrome(trace_path)
+                logging.info("Wrote %d trace events to %s", count, trace_path)
+            except Exception:
+                logging.exception("Failed writing trace to %s", trace_path)
+        app.aboutToQuit.connect(_dump_trace)
 
     sys.exit(app.exec())
@@ -0,0 +1,186 @@
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .models import Mission
+
+logger = logging.getLogger(__name__)
+
+# zstd from the standard library (Python 3.14+), then the zstandard
+# package, then gzip
+try:
+    from compression import zstd as _zstd
+
+    CODEC = "zstd"
+    _EXT = ".jsonl.zst"
+
+    def _compress(data: bytes) -> bytes:
+        return _zstd.compress(data)
+
+    def _decompress(data: bytes) -> bytes:
+        return _zstd.decompress(data)
+except ImportError:
+    try:
+        import zstandard as _zstandard
+
+        CODEC = "zstd"
+        _EXT = ".jsonl.zst"
+
+        def _compress(data: bytes) -> bytes:
+            return _zstandard.ZstdCompressor(level=10).compress(data)
+
+        def _decompress(data: bytes) -> bytes:
+            return _zstandard.ZstdDecompressor().decompress(data)
+    except ImportError:
+        CODEC = "gzip"
+        _EXT = ".jsonl.gz"
+
+        def _compress(data: bytes) -> bytes:
+            return gzip.compress(data, compresslevel=6)
+
+        def _decompress(data: bytes) -> bytes:
+            return gzip.decompress(data)
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS archived_missions (
+        id TEXT PRIMARY KEY,
+        name TEXT,
+        segment TEXT NOT NULL,
+        line INTEGER NOT NULL,
+        archived_at REAL NOT NULL,
+        summary TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_archived_name ON archived_missions (name)",
+    "CREATE INDEX IF NOT EXISTS idx_archived_at ON archived_missions (archived_at)",
+    "CREATE INDEX IF NOT EXISTS idx_archived_segment ON archived_missions (segment)",
+)
+
+
+class MissionArchive:
+    """Cold storage for finished missions.
+
+    Each `archive` call writes one immutable compressed JSON-lines segment
+    and indexes its missions (id, name, summary) in SQLite, so queries never
+    decompress anything. Reading or restoring a mission decompresses only
+    its segment; a segment file is deleted once none of its missions remain.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, "index.db"), check_same_thread=False, timeout=10.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for stmt in _SCHEMA:
+            self._conn.execute(stmt)
+        self._conn.commit()
+
+    def archive(self, missions: List[Mission]) -> Optional[str]:
+        """Write `missions` to a new segment; returns the segment name."""
+        if not missions:
+            return None
+        now = time.time()
+        segment = f"segment-{int(now * 1000):013d}-{os.getpid()}{_EXT}"
+        body = "".join(json.dumps(m.to_dict(), separators=(",", ":")) + "\n" for m in missions).encode("utf-8")
+        path = os.path.join(self.directory, segment)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_compress(body))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        rows = [(m.id, m.name, segment, i, now, json.dumps(m.summary(), separators=(",", ":")))
+                for i, m in enumerate(missions)]
+        with self._lock:
+            # INSERT OR REPLACE: a mission archived again after a restore moves segments
+            old = self._segments_of([m.id for m in missions])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO archived_missions (id, name, segment, line, archived_at, summary) VALUES (?, ?, ?, ?, ?, ?)",
+                rows)
+            self._conn.commit()
+            self._drop_empty_segments(old)
+        logger.info("Archived %d missions to %s (%s, %d -> %d bytes)", len(missions), segment, CODEC,
+                    len(body), os.path.getsize(path))
+        return segment
+
+    def _segments_of(self, ids: List[str]) -> set:
+        found = set()
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            sql = f"SELECT DISTINCT segment FROM archived_missions WHERE id IN ({','.join('?' * len(chunk))})"
+            found.update(row[0] for row in self._conn.execute(sql, chunk))
+        return found
+
+    def _drop_empty_segments(self, segments):
+        for segment in segments:
+            if self._conn.execute("SELECT 1 FROM archived_missions WHERE segment = ? LIMIT 1", (segment,)).fetchone():
+                continue
+            try:
+                os.remove(os.path.join(self.directory, segment))
+            except FileNotFoundError:
+                pass
+
+    def __contains__(self, mission_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM archived_missions WHERE id = ?", (mission_id,)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM archived_missions").fetchone()[0]
+
+    def query(self, name_prefix: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None,
+              limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Summaries of archived missions, newest first; reads only the index."""
+        clauses, params = [], []
+        if name_prefix:
+            # range scan on the name index instead of LIKE
+            clauses.append("name >= ? AND name < ?")
+            params += [name_prefix, name_prefix + "\U0010ffff"]
+        if since is not None:
+            clauses.append("archived_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("archived_at < ?")
+            params.append(until)
+        sql = "SELECT summary, archived_at FROM archived_missions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY archived_at DESC, id LIMIT ? OFFSET ?"
+        params += [int(limit), int(offset)]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [{**json.loads(summary), "archived_at": archived_at} for summary, archived_at in rows]
+
+    def get(self, mission_id: str) -> Optional[Mission]:
+        with self._lock:
+            row = self._conn.execute("SELECT segment, line FROM archived_missions WHERE id = ?", (mission_id,)).fetchone()
+        if row is None:
+            return None
+        segment, line = row
+        try:
+            with open(os.path.join(self.directory, segment), "rb") as f:
+                lines = _decompress(f.read()).split(b"\n")
+            return Mission.from_dict(json.loads(lines[line]))
+        except Exception:
+            logger.exception("Failed reading archived mission %s from %s", mission_id, segment)
+            return None
+
+    def remove(self, mission_id: str):
+        """Drop a mission from the archive (after it was restored)."""
+        with self._lock:
+            segments = self._segments_of([mission_id])
+            self._conn.execute("DELETE FROM archived_missions WHERE id = ?", (mission_id,))
+            self._conn.commit()
+            self._drop_empty_segments(segments)
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
@@ -0,0 +1,42 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class CommandCache:
+    """Bounded LRU cache of processed command ids with a time-to-live.
+
+    Lookups and inserts are O(1); the least recently used id is evicted
+    once `capacity` is reached and entries older than `ttl` seconds are
+    treated as unseen.
+    """
+
+    def __init__(self, capacity: int = 4096, ttl: float = 600.0, clock=time.monotonic):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, command_id) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(command_id)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < self._clock():
+                del self._entries[command_id]
+                return None
+            self._entries.move_to_end(command_id)
+            return result
+
+    def put(self, command_id, result: dict):
+        with self._lock:
+            self._entries[command_id] = (self._clock() + self.ttl, result)
+            self._entries.move_to_end(command_id)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,146 @@
+import heapq
+import json
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+STATUSES = ("running", "paused", "idle", "finished")
+
+_MAX_CHAR = "\U0010ffff"
+
+
+def mission_status(mission) -> str:
+    """One of STATUSES for a `Mission` or `MissionSummary`."""
+    if mission.started:
+        return "paused" if mission.paused else "running"
+    return "finished" if mission.is_finished() else "idle"
+
+
+def _sort_key(mission) -> Tuple[str, str]:
+    return ((mission.name or "").casefold(), mission.id)
+
+
+def _run(bucket, start, end, descending):
+    # lazily walk bucket[start:end] without copying it
+    indices = range(end - 1, start - 1, -1) if descending else range(start, end)
+    for i in indices:
+        yield bucket[i]
+
+
+class MissionIndex:
+    """Sorted secondary indexes over the mission catalog.
+
+    Missions are bucketed by (status, over_max) and every bucket is a list
+    of (casefolded name, id) kept sorted with bisect, so a status or
+    over-max filter selects buckets, a name prefix or cursor is a bisect,
+    and a page is a lazy merge of the selected buckets. A query costs
+    O(buckets * log n + page size) however large the catalog is; keeping
+    the index current costs one bisect remove and insert per change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, bool], List[Tuple[str, str]]] = {
+            (status, over_max): [] for status in STATUSES for over_max in (False, True)}
+        # mission id -> (bucket, sort key) currently indexed
+        self._entries: Dict[str, Tuple[Tuple[str, bool], Tuple[str, str]]] = {}
+        # ids of missions with every task done, started or not (the header's
+        # COMPLETED count, which "finished" alone would undercount)
+        self._completed = set()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def update(self, mission):
+        entry = ((mission_status(mission), mission.is_over_max()), _sort_key(mission))
+        with self._lock:
+            if mission.progress() >= 100:
+                self._completed.add(mission.id)
+            else:
+                self._completed.discard(mission.id)
+            old = self._entries.get(mission.id)
+            if old == entry:
+                return
+            if old is not None:
+                self._discard(old)
+            insort(self._buckets[entry[0]], entry[1])
+            self._entries[mission.id] = entry
+
+    def remove(self, mission_id: str):
+        with self._lock:
+            old = self._entries.pop(mission_id, None)
+            self._completed.discard(mission_id)
+            if old is not None:
+                self._discard(old)
+
+    def _discard(self, entry):
+        bucket = self._buckets[entry[0]]
+        i = bisect_left(bucket, entry[1])
+        if i < len(bucket) and bucket[i] == entry[1]:
+            del bucket[i]
+
+    def counts(self) -> Dict[str, int]:
+        """Missions per status plus "over_max", "completed" and "total"."""
+        with self._lock:
+            counts = {status: 0 for status in STATUSES}
+            over = 0
+            for (status, over_max), bucket in self._buckets.items():
+                counts[status] += len(bucket)
+                if over_max:
+                    over += len(bucket)
+            counts["over_max"] = over
+            counts["completed"] = len(self._completed)
+            counts["total"] = len(self._entries)
+        return counts
+
+    def query(self, status: Union[None, str, Iterable[str]] = None, name_prefix: Optional[str] = None,
+              over_max: Optional[bool] = None, descending: bool = False, limit: int = 50,
+              cursor: Optional[str] = None) -> Tuple[List[str], Optional[str], int]:
+        """Return (mission ids, next cursor, total matches) for one page.
+
+        `status` is one status, several, or None for all; `name_prefix`
+        matches case-insensitively; `cursor` is the value returned with the
+        previous page and is None once the last page was returned.
+        """
+        if isinstance(status, str):
+            status = (status,) if status else None
+        statuses = set(status) if status else set(STATUSES)
+        unknown = statuses - set(STATUSES)
+        if unknown:
+            raise ValueError(f"unknown mission status {sorted(unknown)}")
+        lo = hi = None
+        if name_prefix:
+            prefix = name_prefix.casefold()
+            lo, hi = (prefix,), (prefix + _MAX_CHAR,)
+        after = tuple(json.loads(cursor)) if cursor else None
+        limit = max(1, int(limit))
+
+        with self._lock:
+            ranges = []
+            total = 0
+            for (s, o), bucket in self._buckets.items():
+                if s not in statuses or (over_max is not None and o != over_max):
+                    continue
+                start = bisect_left(bucket, lo) if lo else 0
+                end = bisect_left(bucket, hi) if hi else len(bucket)
+                total += max(0, end - start)
+                if after is not None:
+                    if descending:
+                        end = min(end, bisect_left(bucket, after))
+                    else:
+                        start = max(start, bisect_right(bucket, after))
+                if start < end:
+                    ranges.append((bucket, start, end))
+
+            runs = [_run(bucket, start, end, descending) for bucket, start, end in ranges]
+            page = []
+            for key in heapq.merge(*runs, reverse=descending):
+                page.append(key)
+                if len(page) > limit:
+                    break
+
+        next_cursor = None
+        if len(page) > limit:
+            page.pop()
+            next_cursor = json.dumps(list(page[-1]))
+        return [mission_id for _, mission_id in page], next_cursor, total
@@ -1,64 +1,202 @@
+import math
 import threading
-import time
 import uuid
 import os
 import logging
 from typing import Optional, List
 
+from backend.common.clock import SYSTEM_CLOCK
 from backend.common.mqtt import MQTTClient
-from backend.common.topics import TRICORDER_MISSION_COMMANDS, TRICORDER_MISSION_STATE
-from .models import Mission, Task
+from backend.common.topics import (
+    TRICORDER_MISSION_COMMANDS,
+    TRICORDER_MISSION_STATE,
+    TRICORDER_MISSION_ACKS,
+    TRICORDER_MISSION_CATALOG,
+    TRICORDER_MISSION_SYNC,
+)
+from backend.common.tracing import tracer
+from .models import Mission, MissionSummary, Task
+from .archive import MissionArchive
+from .commands import CommandCache
+from .index import MissionIndex
 from .persistence import PersistenceManager
-from .mqtt_adapter import configure_client, start_loop_if_connected, publish_state
+from .mqtt_adapter import configure_client, start_loop_if_connected, start_loop_async, publish_state
 
 
 class MissionManager:
 
     STATE_TOPIC = TRICORDER_MISSION_STATE
     COMMAND_TOPIC = TRICORDER_MISSION_COMMANDS
+    ACK_TOPIC = TRICORDER_MISSION_ACKS
+    CATALOG_TOPIC = TRICORDER_MISSION_CATALOG
+    SYNC_TOPIC = TRICORDER_MISSION_SYNC
+    # the retained catalog is refreshed at least this often while missions tick
+    CATALOG_INTERVAL = 10.0
+    SYNC_PAGE_SIZE = 100
+    MAX_SYNC_PAGE_SIZE = 1000
+    # how often the ticker looks for finished missions to move to the archive
+    ARCHIVE_INTERVAL = 60.0
 
-    def __init__(self, mqtt_host: Optional[str] = "localhost", mqtt_port: int = 1883, client_id: Optional[str] = "mission-manager", state_change_callback=None, persistence_file: Optional[str] = None):
+    def __init__(self, mqtt_host: Optional[str] = "localhost", mqtt_port: int = 1883, client_id: Optional[str] = "mission-manager", state_change_callback=None, persistence_file: Optional[str] = None, fast_startup: bool = False, recorder=None,
+                 archive_dir: Optional[str] = None, archive_after: Optional[float] = None, clock=None):
         self._logger = logging.getLogger(__name__)
+        # paces the ticker and timestamps changes; a VirtualClock runs long
+        # missions faster than real time
+        self._clock = clock or SYSTEM_CLOCK
+
+        # Missions are copy-on-write: a published Mission object is never
+        # mutated, writers swap in a modified copy under that mission's own
+        # lock, so readers take snapshots without locking at all.
+        self._missions = {}
+        self._mission_locks = {}
+        # guards adding/removing catalog entries, never held while mutating one
+        self._catalog_lock = threading.Lock()
+        # sorted secondary indexes behind query_missions, kept in step with
+        # every snapshot swap
+        self._index = MissionIndex()
+        # ids of started missions (paused or not); the ticker only visits these
+        self._started = set()
+        # monotonic time of each mission's last change, for the archive policy
+        self._changed_at = {}
+        # bumped on every change so clients can tell catalog snapshots apart
+        self._catalog_version = 0
+        self._catalog_published_at = 0.0
+        self._running = True
+        # recently seen command ids and their acknowledgements
+        self._dedupe = CommandCache(clock=self._clock.monotonic)
+        self._duplicate_commands = 0
+        self._batch = threading.local()
+        self._save_lock = threading.Lock()
+
+        # optional common.recorder.Recorder receiving one row per mission change
+        self._recorder = recorder
+
+        # optional callback that will be invoked when state is published
+        self._state_change_callback = state_change_callback
+
+        # persistence manager (optional)
+        default_path = os.path.join(os.path.dirname(__file__), 'missions.json')
+        persistence_path = persistence_file if persistence_file is not None else default_path
+        self._persistence = PersistenceManager(persistence_path)
+        self._loaded = threading.Event()
+
+        # opt-in: finished missions idle for `archive_after` seconds move to
+        # compressed cold storage, keeping the hot set proportional to active
+        # missions
+        self._archive_after = archive_after
+        self._archived_at = self._clock.monotonic()
+        self._archive = None
+        if archive_after is not None:
+            try:
+                if archive_dir is None:
+                    archive_dir = os.path.join(os.path.dirname(os.path.abspath(persistence_path)), 'archive')
+                self._archive = MissionArchive(archive_dir)
+            except Exception:
+                self._logger.exception("Failed to open mission archive; finished missions stay in memory")
 
         # Only create and configure MQTT client if a host is provided.
         if mqtt_host is not None and client_id is not None:
             try:
                 self._mqtt = MQTTClient(mqtt_host, mqtt_port, client_id)
-                configure_client(self._mqtt, self.COMMAND_TOPIC, self._on_mqtt_message)
-                start_loop_if_connected(self._mqtt)
+                configure_client(self._mqtt, self.COMMAND_TOPIC, self._on_mqtt_message, self._on_mqtt_connect)
+                if fast_startup:
+                    start_loop_async(self._mqtt)
+                else:
+                    start_loop_if_connected(self._mqtt)
             except Exception:
                 self._logger.exception("Failed to initialize MQTT client; continuing without MQTT")
                 self._mqtt = None
         else:
             self._mqtt = None
 
-        self._missions = {}
-        self._lock = threading.Lock()
-        self._running = True
-        # optional callback that will be invoked when state is published
-        self._state_change_callback = state_change_callback
+        if fast_startup:
+            # parse the catalog off the caller's thread; the ticker starts once
+            # loading is done and a full-state publish tells listeners to refresh
+            self._loader = threading.Thread(target=self._load_and_start, args=(True,), daemon=True)
+            self._loader.start()
+        else:
+            self._load_and_start(False)
 
-        # persistence manager (optional)
-        default_path = os.path.join(os.path.dirname(__file__), 'missions.json')
-        persistence_path = persistence_file if persistence_file is not None else default_path
-        self._persistence = PersistenceManager(persistence_path)
+    def _load_and_start(self, announce: bool):
         try:
-            for m in self._persistence.load():
-                with self._lock:
-                    self._missions[m.id] = m
+            # inactive missions arrive as summaries; tasks load on first access
+            for m in self._persistence.load_catalog():
+                self._add_mission(m)
         except Exception:
             self._logger.exception("Failed loading persisted missions")
         else:
             # log number of missions loaded for diagnostics
             try:
-                self._logger.info("Loaded %d missions from persistence", len(self._missions))
+                lazy = sum(1 for m in self._missions.values() if isinstance(m, MissionSummary))
+                self._logger.info("Loaded %d missions from persistence (%d summarized)", len(self._missions), lazy)
             except Exception:
                 pass
+        self._loaded.set()
+        if announce:
+            self._publish_state()
+        self._publish_catalog()
 
         # start ticker after loading persisted state
         self._ticker = threading.Thread(target=self._ticker_loop, daemon=True)
         self._ticker.start()
 
+    def _add_mission(self, mission):
+        with self._catalog_lock:
+            self._mission_locks.setdefault(mission.id, threading.Lock())
+            self._missions[mission.id] = mission
+            self._index.update(mission)
+            self._changed_at[mission.id] = self._clock.monotonic()
+            self._catalog_version += 1
+            if mission.started:
+                self._started.add(mission.id)
+            else:
+                self._started.discard(mission.id)
+
+    def _mutate(self, mission_id: str, fn):
+        """Apply `fn` to the current snapshot of one mission under its lock.
+
+        `fn` returns (result, replacement); a non-None replacement is
+        published in place of the old snapshot. Returns `fn`'s result, or
+        None when the mission does not exist.
+        """
+        lock = self._mission_locks.get(mission_id)
+        if lock is None:
+            return None
+        with lock:
+            current = self._load_locked(mission_id)
+            if current is None:
+                return None
+            result, replacement = fn(current)
+            if replacement is not None:
+                # per-mission locks do not exclude each other; the catalog
+                # lock keeps the version count and shared maps consistent
+                with self._catalog_lock:
+                    self._missions[mission_id] = replacement
+                    self._index.update(replacement)
+                    self._changed_at[mission_id] = self._clock.monotonic()
+                    self._catalog_version += 1
+                    if replacement.started:
+                        self._started.add(mission_id)
+                    else:
+                        self._started.discard(mission_id)
+            return result
+
+    def _load_locked(self, mission_id: str) -> Optional[Mission]:
+        # caller holds the mission's lock; swaps a summary for the full mission
+        current = self._missions.get(mission_id)
+        if isinstance(current, MissionSummary):
+            full = self._persistence.load_mission(mission_id)
+            if full is None:
+                self._logger.warning("Could not load tasks for mission %s", mission_id)
+                return None
+            self._missions[mission_id] = full
+            self._index.update(full)
+            current = full
+        return current
+
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        return self._loaded.wait(timeout)
+
     def shutdown(self):
         self._running = False
         try:
@@ -66,214 +204,439 @@ class MissionManager:
                 self._mqtt.disconnect()
         except Exception:
             pass
+        if self._archive is not None:
+            self._archive.close()
 
     def start_mission(self, mission_id: str) -> bool:
-        with self._lock:
-            m = self._missions.get(mission_id)
-            if not m:
-                self._logger.info("start_mission: mission %s not found", mission_id)
-                return False
+        def apply(m):
             if m.started:
                 self._logger.info("start_mission: mission %s already started", mission_id)
-                return False
-            m.started = True
-            m.paused = False
-            self._logger.info("start_mission: mission %s started", mission_id)
-        self._publish_state(mission_id)
-        try:
-            ok = self._persistence.save(list(self._missions.values()))
-            if ok:
-                self._logger.info("start_mission: persisted missions after starting %s", mission_id)
-            else:
-                self._logger.warning("start_mission: failed to persist missions after starting %s", mission_id)
-        except Exception:
-            self._logger.exception("Failed saving mission after start")
+                return False, None
+            return True, m.copy(started=True, paused=False)
+
+        if not self._mutate(mission_id, apply):
+            if mission_id not in self._missions:
+                self._logger.info("start_mission: mission %s not found", mission_id)
+            return False
+        self._logger.info("start_mission: mission %s started", mission_id)
+        self._commit(mission_id, "start_mission")
         return True
 
     def pause_mission(self, mission_id: str) -> bool:
-        with self._lock:
-            m = self._missions.get(mission_id)
-            if not m or not m.started or m.paused:
-                return False
-            m.paused = True
-        self._publish_state(mission_id)
-        try:
-            ok = self._persistence.save(list(self._missions.values()))
-            if ok:
-                self._logger.info("pause_mission: persisted missions after pausing %s", mission_id)
-            else:
-                self._logger.warning("pause_mission: failed to persist missions after pausing %s", mission_id)
-        except Exception:
-            self._logger.exception("Failed saving mission after pause")
+        def apply(m):
+            if not m.started or m.paused:
+                return False, None
+            return True, m.copy(paused=True)
+
+        if not self._mutate(mission_id, apply):
+            return False
+        self._commit(mission_id, "pause_mission")
         return True
 
     def resume_mission(self, mission_id: str) -> bool:
-        with self._lock:
-            m = self._missions.get(mission_id)
-            if not m or not m.started or not m.paused:
-                return False
-            m.paused = False
-            self._logger.info("resume_mission: mission %s resumed", mission_id)
-        self._publish_state(mission_id)
-        try:
-            ok = self._persistence.save(list(self._missions.values()))
-            if ok:
-                self._logger.info("resume_mission: persisted missions after resuming %s", mission_id)
-            else:
-                self._logger.warning("resume_mission: failed to persist missions after resuming %s", mission_id)
-        except Exception:
-            self._logger.exception("Failed saving mission after resume")
+        def apply(m):
+            if not m.started or not m.paused:
+                return False, None
+            return True, m.copy(paused=False)
+
+        if not self._mutate(mission_id, apply):
+            return False
+        self._logger.info("resume_mission: mission %s resumed", mission_id)
+        self._commit(mission_id, "resume_mission")
         return True
 
     def stop_mission(self, mission_id: str) -> bool:
-        with self._lock:
-            m = self._missions.get(mission_id)
-            if not m:
-                return False
-            m.started = False
-            m.paused = False
-        self._publish_state(mission_id)
-        try:
-            ok = self._persistence.save(list(self._missions.values()))
-            if ok:
-                self._logger.info("stop_mission: persisted missions after stopping %s", mission_id)
-            else:
-                self._logger.warning("stop_mission: failed to persist missions after stopping %s", mission_id)
-        except Exception:
-            self._logger.exception("Failed saving mission after stop")
+        if not self._mutate(mission_id, lambda m: (True, m.copy(started=False, paused=False))):
+            return False
+        self._commit(mission_id, "stop_mission")
         return True
 
     def complete_task(self, mission_id: str, task_id: str) -> bool:
-        changed = False
-        with self._lock:
-            m = self._missions.get(mission_id)
-            if not m:
-                self._logger.info("complete_task: mission %s not found", mission_id)
-                return False
-            for t in m.tasks:
-                if t.id == task_id:
-                    t.completed = True
-                    changed = True
-                    break
+        def apply(m):
+            task = m.get_task(task_id)
+            if task is None:
+                return (False, False), None
+            # completing an already completed task is a no-op
+            if task.completed:
+                return (True, False), None
+            return (True, True), m.with_task(task_id, completed=True)
 
+        outcome = self._mutate(mission_id, apply)
+        if outcome is None:
+            self._logger.info("complete_task: mission %s not found", mission_id)
+            return False
+        found, changed = outcome
         if changed:
-            # publish and persist after releasing lock to avoid deadlock
             self._logger.info("complete_task: task %s marked complete in mission %s", task_id, mission_id)
-            self._publish_state(mission_id)
-            try:
-                self._persistence.save(list(self._missions.values()))
-            except Exception:
-                self._logger.exception("Failed saving mission after complete_task")
-            return True
-
-        return False
+            self._commit(mission_id, "complete_task", task_id)
+        return found
 
     def set_task_completion(self, mission_id: str, task_id: str, completed: bool) -> bool:
         """Set the completed flag for a task to True or False."""
-        changed = False
-        with self._lock:
-            m = self._missions.get(mission_id)
-            if not m:
-                self._logger.info("set_task_completion: mission %s not found", mission_id)
-                return False
-            for t in m.tasks:
-                if t.id == task_id:
-                    if t.completed != bool(completed):
-                        t.completed = bool(completed)
-                        changed = True
-                    break
+        completed = bool(completed)
 
+        def apply(m):
+            task = m.get_task(task_id)
+            if task is None or task.completed == completed:
+                return False, None
+            return True, m.with_task(task_id, completed=completed)
+
+        changed = self._mutate(mission_id, apply)
+        if changed is None:
+            self._logger.info("set_task_completion: mission %s not found", mission_id)
+            return False
         if changed:
             self._logger.info("set_task_completion: task %s set to %s in mission %s", task_id, completed, mission_id)
-            # publish and persist after releasing lock to avoid deadlock
-            self._publish_state(mission_id)
-            try:
-                ok = self._persistence.save(list(self._missions.values()))
-                if ok:
-                    self._logger.info("set_task_completion: persisted missions after updating task %s", task_id)
-                else:
-                    self._logger.warning("set_task_completion: failed to persist missions after updating task %s", task_id)
-            except Exception:
-                self._logger.exception("Failed saving mission after set_task_completion")
+            self._commit(mission_id, "set_task_completion", task_id)
             return True
 
         return False
 
-    def _publish_state(self, mission_id: Optional[str] = None):
-        payload = {}
-        with self._lock:
-            if mission_id:
-                m = self._missions.get(mission_id)
-                if not m:
-                    return
-                payload = {"mission": m.to_dict()}
-            else:
-                payload = {"missions": [m.to_dict() for m in self._missions.values()]}
+    def _commit(self, mission_id: str, op: str, detail: Optional[str] = None):
+        if self._recorder is not None:
+            m = self._missions.get(mission_id)
+            if m is not None:
+                self._recorder.record_mission(op, m, detail)
+        # publish and persist after releasing the lock to avoid deadlock; inside
+        # a command batch both are deferred until the batch finishes
+        touched = getattr(self._batch, "touched", None)
+        if touched is not None:
+            touched[mission_id] = op
+            return
+        self._publish_state(mission_id)
+        self._publish_catalog()
+        self._save(op)
+
+    def _save(self, op: str, quiet: bool = False) -> bool:
         try:
-            if self._mqtt:
-                publish_state(self._mqtt, self.STATE_TOPIC, payload)
+            # snapshot and write under one lock, so an older snapshot (say,
+            # the ticker's) can never be written over a newer one
+            with self._save_lock:
+                ok = self._persistence.save(list(self._missions.values()))
+            if not ok:
+                self._logger.warning("%s: failed to persist missions", op)
+            elif quiet:
+                self._logger.debug("%s: persisted missions", op)
+            else:
+                self._logger.info("%s: persisted missions", op)
+            return ok
         except Exception:
-            self._logger.exception("Failed publishing mission state to MQTT")
+            self._logger.exception("Failed saving missions after %s", op)
+            return False
 
-        # call local state-change callback if provided
-        if self._state_change_callback:
+    def _publish_state(self, mission_id: Optional[str] = None):
+        with tracer.span("MissionManager._publish_state", mission_id=mission_id):
+            # snapshots are immutable, so serializing needs no lock
+            with tracer.span("mission.serialize"):
+                if mission_id:
+                    m = self._missions.get(mission_id)
+                    if not m:
+                        return
+                    payload = {"mission": m.to_dict()}
+                else:
+                    payload = {"missions": [m.to_dict() for m in self.get_missions()]}
             try:
-                self._state_change_callback(payload)
+                if self._mqtt:
+                    with tracer.span("mqtt.publish"):
+                        publish_state(self._mqtt, self.STATE_TOPIC, payload)
             except Exception:
-                self._logger.exception("State change callback raised an exception")
+                self._logger.exception("Failed publishing mission state to MQTT")
+
+            # call local state-change callback if provided
+            if self._state_change_callback:
+                try:
+                    with tracer.span("mission.state_callback"):
+                        self._state_change_callback(payload)
+                except Exception:
+                    self._logger.exception("State change callback raised an exception")
+
+    def _publish_catalog(self):
+        """Publish the compact catalog as a retained message for late joiners."""
+        if not self._mqtt:
+            return
+        with tracer.span("mission.publish_catalog"):
+            payload = {
+                "version": self._catalog_version,
+                "timestamp": self._clock.time(),
+                "missions": [m.summary() for m in self.get_missions()],
+            }
+            # a publish skipped while disconnected is retried on connect
+            if publish_state(self._mqtt, self.CATALOG_TOPIC, payload, retain=True):
+                self._catalog_published_at = self._clock.monotonic()
+
+    def _on_mqtt_connect(self):
+        # the retained catalog may predate the connection or be missing;
+        # before loading finishes, _load_and_start publishes it instead
+        if self._loaded.is_set():
+            self._publish_catalog()
+
+    def _handle_sync(self, command: dict) -> bool:
+        """Answer a sync request with the full catalog, split into pages.
+
+        All pages from `cursor` (a page index) onwards are sent in response
+        to the single request, so a late joiner converges in one round trip.
+        """
+        if not self._mqtt:
+            return False
+        try:
+            page_size = int(command.get("page_size") or self.SYNC_PAGE_SIZE)
+            cursor = int(command.get("cursor") or 0)
+        except (TypeError, ValueError):
+            return False
+        page_size = max(1, min(page_size, self.MAX_SYNC_PAGE_SIZE))
+        reply_to = command.get("reply_to") or self.SYNC_TOPIC
+        request_id = command.get("request_id") or command.get("command_id") or command.get("id")
+
+        version = self._catalog_version
+        missions = self.get_missions()
+        total = len(missions)
+        pages = max(1, math.ceil(total / page_size))
+        for page in range(max(0, cursor), pages):
+            chunk = missions[page * page_size:(page + 1) * page_size]
+            publish_state(self._mqtt, reply_to, {
+                "request_id": request_id,
+                "version": version,
+                "page": page,
+                "pages": pages,
+                "total": total,
+                "missions": [m.to_dict() for m in chunk],
+            })
+        return True
 
     def _on_mqtt_message(self, topic, payload):
-        action = payload.get("action")
-        if not action:
+        # a message holds one command, a list of commands or {"commands": [...]}
+        if isinstance(payload, dict) and isinstance(payload.get("commands"), list):
+            reply_to = payload.get("reply_to")
+            commands = payload["commands"]
+        elif isinstance(payload, list):
+            reply_to = None
+            commands = payload
+        elif isinstance(payload, dict):
+            reply_to = payload.get("reply_to")
+            commands = [payload]
+        else:
             return
-        if action == "start":
-            self.start_mission(payload.get("mission_id"))
-        elif action == "pause":
-            self.pause_mission(payload.get("mission_id"))
-        elif action == "stop":
-            self.stop_mission(payload.get("mission_id"))
-        elif action == "complete_task":
-            self.complete_task(payload.get("mission_id"), payload.get("task_id"))
+        if not commands:
+            return
+
+        acks = []
+        self._batch.touched = {}
+        try:
+            for command in commands:
+                ack = self._handle_command(command)
+                if ack is not None:
+                    acks.append(ack)
+        finally:
+            touched, self._batch.touched = self._batch.touched, None
+        # one publish per touched mission and a single save for the whole batch
+        for mission_id in touched:
+            self._publish_state(mission_id)
+        if touched:
+            self._publish_catalog()
+            self._save("command batch")
+
+        if acks and self._mqtt:
+            ack_payload = acks[0] if len(acks) == 1 else {"acks": acks}
+            try:
+                self._mqtt.publish(reply_to or self.ACK_TOPIC, ack_payload)
+            except Exception:
+                self._logger.exception("Failed publishing command acknowledgement")
+
+    def _handle_command(self, command) -> Optional[dict]:
+        if not isinstance(command, dict):
+            return {"command_id": None, "ok": False, "error": "invalid command"}
+        action = command.get("action")
+        if not action:
+            return None
+        command_id = command.get("command_id") or command.get("id")
+        if command_id is not None and (isinstance(command_id, bool) or not isinstance(command_id, (str, int))):
+            # ids key the dedupe cache; refuse lists, dicts and the like
+            return {"command_id": None, "action": action, "ok": False, "error": "invalid command_id", "duplicate": False}
+        if command_id is not None:
+            cached = self._dedupe.get(command_id)
+            if cached is not None:
+                # redelivered or sent by several consoles: answer from cache
+                self._duplicate_commands += 1
+                return {**cached, "duplicate": True}
+
+        handler = self._COMMANDS.get(action)
+        if handler is None:
+            ack = {"command_id": command_id, "action": action, "ok": False, "error": "unknown action"}
+        else:
+            try:
+                ok = bool(handler(self, command))
+                ack = {"command_id": command_id, "action": action, "ok": ok}
+            except Exception as e:
+                self._logger.exception("Mission command %s failed", action)
+                ack = {"command_id": command_id, "action": action, "ok": False, "error": str(e)}
+        if command_id is not None:
+            self._dedupe.put(command_id, ack)
+        return {**ack, "duplicate": False}
+
+    _COMMANDS = {
+        "start": lambda self, c: self.start_mission(c.get("mission_id")),
+        "pause": lambda self, c: self.pause_mission(c.get("mission_id")),
+        "resume": lambda self, c: self.resume_mission(c.get("mission_id")),
+        "stop": lambda self, c: self.stop_mission(c.get("mission_id")),
+        "complete_task": lambda self, c: self.complete_task(c.get("mission_id"), c.get("task_id")),
+        "set_task_completion": lambda self, c: self.set_task_completion(c.get("mission_id"), c.get("task_id"), bool(c.get("completed", True))),
+        "sync": lambda self, c: self._handle_sync(c),
+        "restore": lambda self, c: self.restore_mission(c.get("mission_id")),
+    }
 
     def _ticker_loop(self):
+        def tick(m):
+            if not m.started or m.paused:
+                return False, None
+            return True, m.copy(elapsed_seconds=m.elapsed_seconds + 1)
+
         while self._running:
-            time.sleep(1)
-            updated = []
-            with self._lock:
-                for m in self._missions.values():
-                    # log mission state occasionally for diagnostics
-                    try:
-                        self._logger.debug("ticker: checking mission %s started=%s paused=%s elapsed=%s", m.id, m.started, m.paused, m.elapsed_seconds)
-                    except Exception:
-                        pass
-                    if m.started and not m.paused:
-                        m.elapsed_seconds += 1
-                        updated.append(m.id)
+            self._clock.sleep(1)
+            # each mission is advanced under its own lock, so a command on one
+            # mission never waits for bookkeeping on the others
+            updated = [mid for mid in list(self._started) if self._mutate(mid, tick)]
             # publish state for each updated mission; persist once per tick
             if updated:
-                try:
-                    self._logger.info("ticker: updated missions %s", updated)
-                except Exception:
-                    pass
+                self._logger.debug("ticker: updated missions %s", updated)
                 for mid in updated:
                     self._publish_state(mid)
-                try:
-                    ok = self._persistence.save(list(self._missions.values()))
-                    if ok:
-                        self._logger.debug("ticker: persisted missions after update")
-                    else:
-                        self._logger.warning("ticker: failed to persist missions after update")
-                except Exception:
-                    self._logger.exception("Failed saving missions in ticker loop")
+                if self._clock.monotonic() - self._catalog_published_at >= self.CATALOG_INTERVAL:
+                    self._publish_catalog()
+                self._save("ticker", quiet=True)
+            if self._archive is not None and self._clock.monotonic() - self._archived_at >= self.ARCHIVE_INTERVAL:
+                self._archived_at = self._clock.monotonic()
+                self.archive_finished()
 
+    def archive_finished(self, min_idle: Optional[float] = None) -> int:
+        """Move finished missions unchanged for `min_idle` seconds (default
+        `archive_after`) to the archive. Returns how many were archived."""
+        if self._archive is None:
+            return 0
+        min_idle = self._archive_after if min_idle is None else min_idle
+        now = self._clock.monotonic()
+        candidates = sorted(mid for mid, m in list(self._missions.items())
+                            if m.is_finished() and now - self._changed_at.get(mid, now) >= min_idle)
+        locks = [lock for lock in (self._mission_locks.get(mid) for mid in candidates) if lock is not None]
+        if not locks:
+            return 0
+        # locks are taken in id order; every other path holds at most one
+        for lock in locks:
+            lock.acquire()
+        try:
+            missions = []
+            for mid in candidates:
+                m = self._load_locked(mid)
+                if m is not None and m.is_finished():
+                    missions.append(m)
+            if not missions:
+                return 0
+            try:
+                self._archive.archive(missions)
+            except Exception:
+                self._logger.exception("Failed archiving %d missions", len(missions))
+                return 0
+            with self._catalog_lock:
+                for m in missions:
+                    self._missions.pop(m.id, None)
+                    self._index.remove(m.id)
+                    self._mission_locks.pop(m.id, None)
+                    self._changed_at.pop(m.id, None)
+                    self._started.discard(m.id)
+                self._catalog_version += 1
+        finally:
+            for lock in locks:
+                lock.release()
+        if self._recorder is not None:
+            for m in missions:
+                self._recorder.record_mission("archive_mission", m)
+        self._publish_state()
+        self._publish_catalog()
+        self._save("archive")
+        return len(missions)
+
+    def restore_mission(self, mission_id: str) -> bool:
+        """Bring an archived mission back into the hot set."""
+        if self._archive is None or not mission_id or mission_id in self._missions:
+            return False
+        m = self._archive.get(mission_id)
+        if m is None:
+            return False
+        self._add_mission(m)
+        self._commit(mission_id, "restore_mission")
+        # only forget the archived copy once the hot catalog has it
+        self._archive.remove(mission_id)
+        return True
+
+    def query_archive(self, name_prefix: Optional[str] = None, since: Optional[float] = None,
+                      until: Optional[float] = None, limit: int = 100, offset: int = 0) -> List[dict]:
+        """Summaries of archived missions, newest first (epoch `since`/`until`)."""
+        if self._archive is None:
+            return []
+        return self._archive.query(name_prefix, since, until, limit, offset)
+
+    def get_archived_mission(self, mission_id: str) -> Optional[Mission]:
+        if self._archive is None:
+            return None
+        return self._archive.get(mission_id)
+
+    def time_remaining(self) -> Optional[float]:
+        """Seconds left in the started mission that ends soonest, or None.
+
+        A mission's budget is its max duration, or the sum of its task
+        estimates when no maximum is set.
+        """
+        remaining = None
+        for mid in list(self._started):
+            m = self._missions.get(mid)
+            if m is None or not m.started:
+                continue
+            budget = m.max_duration_seconds or m.projected_seconds()
+            if not budget:
+                continue
+            left = max(0, int(budget) - m.elapsed_seconds)
+            if remaining is None or left < remaining:
+                remaining = left
+        return remaining
 
     def get_missions(self) -> List[Mission]:
-        """Return the stored Mission model objects.
+        """Return a snapshot of the stored Mission model objects.
+
+        Missions whose tasks have not been loaded yet are returned as
+        `MissionSummary` entries; use `get_mission` for the full record.
 
         The frontend expects a list of dicts, so callers that need
         serializable data (e.g. QML) should call `to_dict()` on each
         Mission. Keeping the manager API returning model objects makes
         server-side logic easier to test and reuse.
+
+        Snapshots are never mutated by the manager, so the list is
+        consistent without blocking writers; treat it as read-only.
         """
-        with self._lock:
-            return list(self._missions.values())
\ No newline at end of file
+        # list() over a dict view runs without releasing the GIL
+        return list(self._missions.values())
+
+    def query_missions(self, status=None, name_prefix: Optional[str] = None, over_max: Optional[bool] = None,
+                       descending: bool = False, limit: int = 50, cursor: Optional[str] = None) -> dict:
+        """One page of missions ordered by name, from the secondary indexes.
+
+        Filters by status ("running", "paused", "idle", "finished", or a
+        list of them), case-insensitive name prefix and over-max flag.
+        Returns {"missions": [...], "next_cursor": str or None, "total": n,
+        "counts": {...}}; pass `next_cursor` back to get the following page.
+        Like `get_missions`, entries may be `MissionSummary` snapshots.
+        """
+        ids, next_cursor, total = self._index.query(status, name_prefix, over_max, descending, limit, cursor)
+        missions = [m for m in (self._missions.get(mid) for mid in ids) if m is not None]
+        return {"missions": missions, "next_cursor": next_cursor, "total": total, "counts": self._index.counts()}
+
+    def get_mission(self, mission_id: str) -> Optional[Mission]:
+        """Return the full mission, loading its tasks on first access."""
+        m = self._missions.get(mission_id)
+        if not isinstance(m, MissionSummary):
+            return m
+        # deleted or archived since the lookup above
+        lock = self._mission_locks.get(mission_id)
+        if lock is None:
+            return None
+        with lock:
+            return self._load_locked(mission_id)
\ No newline at end of file
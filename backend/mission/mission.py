@@ -11,11 +11,11 @@ logger = logging.getLogger(__name__)
 class MissionBackend(QObject):
     missionsUpdated = Signal()
 
-    def __init__(self, mqtt_host=None, mqtt_port=1883, client_id=None):
+    def __init__(self, mqtt_host=None, mqtt_port=1883, client_id=None, fast_startup=False, recorder=None):
         super().__init__()
         try:
             # Create manager without MQTT by default (simpler, single in-memory source)
-            self._manager = MissionManager(mqtt_host, mqtt_port, client_id, state_change_callback=self._on_state_change)
+            self._manager = MissionManager(mqtt_host, mqtt_port, client_id, state_change_callback=self._on_state_change, fast_startup=fast_startup, recorder=recorder)
             try:
                 logger.debug("MissionBackend: created MissionManager, mqtt_configured=%s", bool(getattr(self._manager, '_mqtt', None)))
             except Exception:
@@ -45,6 +45,49 @@ class MissionBackend(QObject):
             logger.exception("Error fetching missions")
         return []
 
+    @Slot(str, str, int, bool, int, str, result='QVariant')
+    def queryMissions(self, status: str = "", name_prefix: str = "", over_max: int = -1, descending: bool = False,
+                      limit: int = 50, cursor: str = ""):
+        # over_max: -1 any, 0 within budget, 1 over budget; status may be
+        # comma separated. Returns {missions, nextCursor, total, counts}.
+        try:
+            if self._manager:
+                page = self._manager.query_missions(
+                    [s for s in status.split(",") if s] or None, name_prefix or None,
+                    None if over_max < 0 else bool(over_max), descending, limit, cursor or None)
+                return {
+                    "missions": [m.to_dict() for m in page["missions"]],
+                    "nextCursor": page["next_cursor"] or "",
+                    "total": page["total"],
+                    "counts": page["counts"],
+                }
+        except Exception:
+            logger.exception("Error querying missions")
+        return {"missions": [], "nextCursor": "", "total": 0, "counts": {}}
+
+    @Slot(str, result='QVariant')
+    def getMission(self, mission_id: str):
+        # full mission with tasks; getMissions may only carry summaries
+        try:
+            if self._manager:
+                m = self._manager.get_mission(mission_id)
+                if m is not None:
+                    return m.to_dict()
+        except Exception:
+            logger.exception("Error fetching mission %s", mission_id)
+        return None
+
+    @Slot(result=float)
+    def getMissionTimeRemaining(self):
+        try:
+            if self._manager:
+                remaining = self._manager.time_remaining()
+                if remaining is not None:
+                    return float(remaining)
+        except Exception:
+            logger.exception("Error computing mission time remaining")
+        return -1.0
+
     @Slot(str, str, result=bool)
     def completeTask(self, mission_id: str, task_id: str):
         try:
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from typing import Optional, List, Dict, Any
 
 
@@ -45,6 +45,21 @@ class Mission:
         data["over_max"] = self.is_over_max()
         return data
 
+    def summary(self) -> Dict[str, Any]:
+        """Compact status without task details."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "started": self.started,
+            "paused": self.paused,
+            "elapsed_seconds": self.elapsed_seconds,
+            "max_duration_seconds": self.max_duration_seconds,
+            "progress": self.progress(),
+            "over_max": self.is_over_max(),
+            "task_count": len(self.tasks),
+            "completed_tasks": sum(1 for t in self.tasks if t.completed),
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Mission":
         tasks = [Task.from_dict(t) for t in data.get("tasks", [])]
@@ -59,6 +74,25 @@ class Mission:
             elapsed_seconds=data.get("elapsed_seconds", 0),
         )
 
+    def copy(self, **changes) -> "Mission":
+        """Return a modified copy; the task list is shared unless replaced."""
+        return replace(self, **changes)
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        for t in self.tasks:
+            if t.id == task_id:
+                return t
+        return None
+
+    def with_task(self, task_id: str, **changes) -> Optional["Mission"]:
+        """Return a copy with one task replaced by a modified copy of it."""
+        for i, t in enumerate(self.tasks):
+            if t.id == task_id:
+                tasks = list(self.tasks)
+                tasks[i] = replace(t, **changes)
+                return replace(self, tasks=tasks)
+        return None
+
     def projected_seconds(self) -> int:
         total = 0
         for t in self.tasks:
@@ -77,3 +111,106 @@ class Mission:
         if self.max_duration_seconds is None:
             return False
         return self.projected_seconds() > int(self.max_duration_seconds)
+
+    def is_finished(self) -> bool:
+        """Not running and every task completed; a stopped or paused mission
+        with work left is not finished."""
+        if self.started:
+            return False
+        return bool(self.tasks) and all(t.completed for t in self.tasks)
+
+
+@dataclass
+class MissionSummary:
+    """Catalog entry for a mission whose task list has not been loaded.
+
+    Built from the persisted JSON without creating `Task` objects and
+    exposing the same status API as `Mission` (`summary`, `to_dict`,
+    `progress`, ...). Like `Mission` snapshots it is never mutated; the
+    manager swaps in the full `Mission` the first time the mission is
+    accessed or changed.
+    """
+    id: str
+    name: str
+    description: Optional[str] = None
+    max_duration_seconds: Optional[int] = None
+    started: bool = False
+    paused: bool = False
+    elapsed_seconds: int = 0
+    task_count: int = 0
+    completed_tasks: int = 0
+    total_projected_seconds: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MissionSummary":
+        tasks = data.get("tasks") or []
+        projected = 0
+        completed = 0
+        for t in tasks:
+            if t.get("projected_seconds"):
+                projected += int(t["projected_seconds"])
+            if t.get("completed"):
+                completed += 1
+        return cls(
+            id=data.get("id"),
+            name=data.get("name") or data.get("title") or "",
+            description=data.get("description"),
+            max_duration_seconds=data.get("max_duration_seconds"),
+            started=data.get("started", False),
+            paused=data.get("paused", False),
+            elapsed_seconds=data.get("elapsed_seconds", 0),
+            task_count=len(tasks),
+            completed_tasks=completed,
+            total_projected_seconds=projected,
+        )
+
+    def projected_seconds(self) -> int:
+        return self.total_projected_seconds
+
+    def progress(self) -> float:
+        # same rule as Mission.progress
+        if self.total_projected_seconds == 0 or not self.task_count:
+            return 0.0
+        return round((self.completed_tasks / self.task_count) * 100.0, 2)
+
+    def is_over_max(self) -> bool:
+        if self.max_duration_seconds is None:
+            return False
+        return self.total_projected_seconds > int(self.max_duration_seconds)
+
+    def is_finished(self) -> bool:
+        if self.started:
+            return False
+        return self.task_count > 0 and self.completed_tasks == self.task_count
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "started": self.started,
+            "paused": self.paused,
+            "elapsed_seconds": self.elapsed_seconds,
+            "max_duration_seconds": self.max_duration_seconds,
+            "progress": self.progress(),
+            "over_max": self.is_over_max(),
+            "task_count": self.task_count,
+            "completed_tasks": self.completed_tasks,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mission.to_dict shape without `tasks`; `tasks_loaded` is False."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "max_duration_seconds": self.max_duration_seconds,
+            "started": self.started,
+            "paused": self.paused,
+            "elapsed_seconds": self.elapsed_seconds,
+            "projected_seconds": self.total_projected_seconds,
+            "progress": self.progress(),
+            "over_max": self.is_over_max(),
+            "task_count": self.task_count,
+            "completed_tasks": self.completed_tasks,
+            "tasks_loaded": False,
+        }
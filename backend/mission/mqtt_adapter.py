@@ -1,13 +1,15 @@
 import logging
-from typing import Callable
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 
-def configure_client(mqtt_client, command_topic: str, on_message_callback: Callable):
+def configure_client(mqtt_client, command_topic: str, on_message_callback: Callable,
+                     on_connect_callback: Optional[Callable] = None):
     try:
         mqtt_client.DEFAULT_TOPIC = command_topic
         mqtt_client.on_message_callback = on_message_callback
+        mqtt_client.on_connect_callback = on_connect_callback
     except Exception:
         logger.exception("Failed to configure MQTT client callbacks")
 
@@ -23,8 +25,19 @@ def start_loop_if_connected(mqtt_client):
         logger.exception("MQTT client failed to connect")
 
 
-def publish_state(mqtt_client, topic: str, payload: dict):
+def start_loop_async(mqtt_client):
     try:
-        mqtt_client.publish(topic, payload)
+        if not mqtt_client.connect_async():
+            logger.warning("MQTT async connect could not be started")
+    except Exception:
+        logger.exception("MQTT client failed to start async connect")
+
+
+def publish_state(mqtt_client, topic: str, payload: dict, retain: bool = False):
+    try:
+        if retain:
+            return mqtt_client.publish(topic, payload, retain=True)
+        return mqtt_client.publish(topic, payload)
     except Exception:
         logger.exception("Failed publishing mission state to MQTT")
+        return False
@@ -1,59 +1,212 @@
 import json
 import os
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from itertools import chain
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 
-from .models import Mission, Task
+from .models import Mission, MissionSummary, Task
 
 logger = logging.getLogger(__name__)
 
+_WS = " \t\r\n"
+
+
+def _decode_prefix(buf: bytes) -> str:
+    # a read may stop in the middle of a multi-byte character; decode up to it
+    try:
+        return buf.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return buf[:e.start].decode("utf-8")
+
+
+def iter_json_array(f, chunk_size: int = 1 << 16) -> Iterator[Tuple[int, int, Any]]:
+    """Yield (byte offset, byte length, value) for each element of the
+    top-level JSON array in the binary file `f`, reading it in chunks.
+
+    Only the element being decoded is held in memory, and the offsets let
+    a caller re-read one element later with a single seek.
+    """
+    decoder = json.JSONDecoder()
+    buf = b""
+    base = 0  # file offset of buf[0]
+    started = False
+    eof = False
+    while True:
+        text = _decode_prefix(buf)
+        pos = 0   # character index into text
+        bpos = 0  # matching byte index into buf
+        while True:
+            # separators and brackets are ASCII, so one char is one byte
+            while pos < len(text) and (text[pos] in _WS or (started and text[pos] == ",")):
+                pos += 1
+                bpos += 1
+            if pos >= len(text):
+                break
+            if not started:
+                if text[pos] != "[":
+                    raise ValueError("expected a JSON array")
+                started = True
+                pos += 1
+                bpos += 1
+                continue
+            if text[pos] == "]":
+                return
+            try:
+                value, end = decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                break
+            if end == len(text) and not eof:
+                # a scalar at the end of the buffer may continue in the next chunk
+                break
+            nbytes = len(text[pos:end].encode("utf-8"))
+            yield base + bpos, nbytes, value
+            pos = end
+            bpos += nbytes
+        buf = buf[bpos:]
+        base += bpos
+        if eof:
+            if started or buf.strip():
+                raise ValueError("truncated JSON array")
+            return
+        chunk = f.read(max(chunk_size, len(buf)))
+        if not chunk:
+            eof = True
+        buf += chunk
+
+
+def _is_legacy_task(item) -> bool:
+    return isinstance(item, dict) and 'title' in item and 'name' not in item and 'tasks' not in item
+
 
 class PersistenceManager:
+    """Stores the mission catalog as a JSON array in `persistence_file`.
+
+    `load_catalog` streams the file and returns full `Mission`s only for
+    started missions; every other entry becomes a `MissionSummary` whose
+    byte range is remembered, so `load_mission` can materialize it later
+    with one seek. `save` copies those ranges verbatim instead of
+    re-serializing missions that were never loaded.
+    """
+
     def __init__(self, persistence_file: Optional[str]):
         self.path = persistence_file
+        # saves can come from the ticker and from command threads at once;
+        # also held while reading an entry so offsets never go stale mid-read
+        self._save_lock = threading.Lock()
+        # mission id -> (offset, length) of its entry in the current file
+        self._index: Dict[str, Tuple[int, int]] = {}
 
-    def save(self, missions: List[Mission]):
+    def save(self, missions: List[Union[Mission, MissionSummary]]):
         if not self.path:
             logger.debug("PersistenceManager.save: no path configured, skipping save")
             return False
         try:
-            data = [m.to_dict() for m in missions]
             d = os.path.dirname(self.path)
             if d and not os.path.exists(d):
                 os.makedirs(d, exist_ok=True)
-            with open(self.path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            with self._save_lock:
+                # write-then-rename so a crash never leaves a truncated catalog
+                tmp = f"{self.path}.tmp"
+                index = {}
+                source = None
+                try:
+                    with open(tmp, 'wb') as f:
+                        f.write(b"[\n")
+                        offset = 2
+                        for i, m in enumerate(missions):
+                            if isinstance(m, MissionSummary):
+                                if source is None:
+                                    source = open(self.path, 'rb')
+                                start, length = self._index[m.id]
+                                source.seek(start)
+                                raw = source.read(length)
+                            else:
+                                raw = json.dumps(m.to_dict(), indent=2).encode("utf-8")
+                            if i:
+                                f.write(b",\n")
+                                offset += 2
+                            f.write(raw)
+                            index[m.id] = (offset, len(raw))
+                            offset += len(raw)
+                        f.write(b"\n]\n")
+                finally:
+                    if source is not None:
+                        source.close()
+                os.replace(tmp, self.path)
+                self._index = index
             logger.debug("Saved %d missions to %s", len(missions), self.path)
             return True
         except Exception:
             logger.exception("Failed saving missions to file: %s", self.path)
             return False
 
+    def iter_missions(self) -> Iterator[Mission]:
+        """Stream every persisted mission as a full `Mission`."""
+        for _, _, mission in self._iter_entries(summarize=False):
+            yield mission
+
     def load(self) -> List[Mission]:
-        result: List[Mission] = []
+        return list(self.iter_missions())
+
+    def load_catalog(self) -> List[Union[Mission, MissionSummary]]:
+        """Full missions for started entries, summaries for the rest."""
+        result = []
+        index = {}
+        for offset, length, mission in self._iter_entries(summarize=True):
+            result.append(mission)
+            if offset is not None:
+                index[mission.id] = (offset, length)
+        with self._save_lock:
+            self._index = index
+        return result
+
+    def load_mission(self, mission_id: str) -> Optional[Mission]:
+        """Materialize one mission from its byte range in the file."""
+        with self._save_lock:
+            entry = self._index.get(mission_id)
+            if entry is None or not self.path:
+                return None
+            try:
+                with open(self.path, 'rb') as f:
+                    f.seek(entry[0])
+                    raw = f.read(entry[1])
+                return Mission.from_dict(json.loads(raw.decode("utf-8")))
+            except Exception:
+                logger.exception("Failed loading mission %s from %s", mission_id, self.path)
+                return None
+
+    def _iter_entries(self, summarize: bool) -> Iterator[Tuple[Optional[int], Optional[int], Any]]:
         if not self.path or not os.path.exists(self.path):
-            return result
+            return
         try:
-            with open(self.path, 'r', encoding='utf-8') as f:
-                raw = json.load(f)
-            # If raw is a list of task dicts (legacy), wrap into one mission
-            if isinstance(raw, list) and raw and all(isinstance(i, dict) for i in raw):
-                first = raw[0]
-                if 'title' in first and 'name' not in first and 'tasks' not in first:
+            with open(self.path, 'rb') as f:
+                entries = iter_json_array(f)
+                first = next(entries, None)
+                if first is None:
+                    return
+                # If the file is a list of task dicts (legacy), wrap into one mission
+                if _is_legacy_task(first[2]):
                     m = Mission(id=str(os.urandom(16).hex()), name="Imported Mission")
-                    for t in raw:
+                    for _, _, t in [first, *entries]:
                         try:
                             m.tasks.append(Task.from_dict(t))
                         except Exception:
                             logger.exception("Skipping invalid task entry during load")
-                    result.append(m)
-                    return result
+                    yield None, None, m
+                    return
                 # Otherwise decode as list of missions
-                for item in raw:
+                for offset, length, item in chain([first], entries):
                     try:
-                        result.append(Mission.from_dict(item))
+                        if not isinstance(item, dict):
+                            raise ValueError("mission entry is not an object")
+                        if summarize and not item.get("started", False):
+                            yield offset, length, MissionSummary.from_dict(item)
+                        else:
+                            yield offset, length, Mission.from_dict(item)
                     except Exception:
                         logger.exception("Skipping invalid mission entry during load")
         except Exception:
             logger.exception("Failed loading missions from file: %s", self.path)
-        return result
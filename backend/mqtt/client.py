@@ -4,6 +4,7 @@ import time
 import logging
 from typing import Any
 import paho.mqtt.client as mqtt
+from backend.common.tracing import tracer
 try:
     from backend.common.topics import TRICORDER_TELEMETRY
 except Exception:
@@ -22,6 +23,11 @@ class MQTTClient:
         self._connected = False
         self._stop_reconnect = False
         self.on_message_callback = None
+        # called after every successful (re)connect, from paho's thread
+        self.on_connect_callback = None
+        # topics whose payloads are binary: not JSON-encoded on publish or
+        # decoded on receipt; also subscribed to on connect
+        self.raw_topics = set()
         self._reconnect_thread = None
         self._logger = logging.getLogger(__name__)
         
@@ -40,6 +46,22 @@ class MQTTClient:
             self._logger.exception("MQTT connect error")
             return False
 
+    def connect_async(self):
+        """Start connecting in the background and return immediately.
+
+        The paho network loop is started here and keeps retrying the first
+        connection, so this must not be combined with `loop_start()`.
+        """
+        try:
+            self._logger.debug("MQTT connecting asynchronously to %s:%s as client_id=%s", self.host, self.port, getattr(self, 'client_id', '<unknown>'))
+            self._stop_reconnect = False
+            self._client.connect_async(self.host, self.port, 60)
+            self._client.loop_start()
+            return True
+        except Exception:
+            self._logger.exception("MQTT async connect error")
+            return False
+
     def disconnect(self):
         # signal reconnect attempts to stop and disconnect cleanly
         self._stop_reconnect = True
@@ -65,9 +87,25 @@ class MQTTClient:
             self._connected = True
             self._logger.debug("Connected to MQTT at %s:%s (client_id=%s)", self.host, self.port, getattr(self, 'client_id', '<unknown>'))
             client.subscribe(self.DEFAULT_TOPIC)
+            for topic in self.raw_topics:
+                client.subscribe(topic)
+            if self.on_connect_callback:
+                try:
+                    self.on_connect_callback()
+                except Exception:
+                    self._logger.exception("Connect callback error")
         else:
             self._logger.warning("Connection failed: %s (client_id=%s)", rc, getattr(self, 'client_id', '<unknown>'))
 
+    def subscribe_raw(self, topic):
+        """Also receive `topic`, handing its payloads to the callback as bytes."""
+        self.raw_topics.add(topic)
+        if self._connected:
+            try:
+                self._client.subscribe(topic)
+            except Exception:
+                self._logger.exception("Subscribe error: %s", topic)
+
     def _on_disconnect(self, client, userdata, rc):
         self._connected = False
         if rc != 0:
@@ -99,19 +137,28 @@ class MQTTClient:
 
     def _on_message(self, client, userdata, msg):
         try:
-            payload = json.loads(msg.payload.decode())
-            if self.on_message_callback:
-                self.on_message_callback(msg.topic, payload)
+            with tracer.span("MQTTClient._on_message", topic=msg.topic):
+                if msg.topic in self.raw_topics:
+                    payload = msg.payload
+                else:
+                    with tracer.span("mqtt.decode"):
+                        payload = json.loads(msg.payload.decode())
+                if self.on_message_callback:
+                    self.on_message_callback(msg.topic, payload)
         except Exception as e:
             self._logger.exception("Message error")
 
-    def publish(self, topic, payload):
+    def publish(self, topic, payload, qos=0, retain=False):
+        return self.publish_raw(topic, json.dumps(payload), qos=qos, retain=retain)
+
+    def publish_raw(self, topic, data, qos=0, retain=False):
+        """Publish an already encoded payload (str or bytes) as is."""
         if not self._connected:
             self._logger.debug("Publish skipped, not connected: %s", topic)
             return False
         try:
             with self._lock:
-                result = self._client.publish(topic, json.dumps(payload))
+                result = self._client.publish(topic, data, qos=qos, retain=retain)
                 ok = result.rc == mqtt.MQTT_ERR_SUCCESS
                 if not ok:
                     self._logger.warning("Publish returned error code: %s", result.rc)
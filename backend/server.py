@@ -0,0 +1,164 @@
+"""Headless Helios server: telemetry ingest, warning evaluation and mission
+services on a plain asyncio loop, without PySide6.
+
+    python -m backend.server --host localhost --port 1883
+
+MQTT callbacks arrive on paho's network threads and mission ticks on the
+manager's ticker thread; anything that touches server state is handed to the
+event loop, either by an event bus subscription bound to the loop or with
+`call_soon_threadsafe`. SIGINT/SIGTERM stop the loop and shut
+the services down cleanly.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+_START = time.perf_counter()
+
+_repo_root = Path(__file__).resolve().parents[1]
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from backend.common.tracing import tracer, configure_from_env
+from backend.common.recorder import DEFAULT_PATH as RECORDINGS, Recorder
+from backend.mission.manager import MissionManager
+from backend.telemetry.service import BUS_CLEARED, BUS_RAISED, TelemetryService
+
+logger = logging.getLogger("helios.server")
+
+
+class HeliosServer:
+    # how often ingest counters are written to the log
+    STATS_INTERVAL = 60.0
+
+    def __init__(self, broker_host="localhost", broker_port=1883, client_id="helios-server",
+                 mission_file=None, fast_startup=True, record_path=None, archive_after=None):
+        self.broker_host = broker_host
+        self.broker_port = broker_port
+        self.client_id = client_id
+        self.mission_file = mission_file
+        self.fast_startup = fast_startup
+        self.archive_after = archive_after
+        self.recorder = Recorder(record_path) if record_path else None
+        self.telemetry = TelemetryService(broker_host, broker_port, client_id, recorder=self.recorder)
+        self.missions = None
+        self._loop = None
+        self._stop = None
+
+    def _call_in_loop(self, fn, *args):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            # loop closed between the check and the call during shutdown
+            pass
+
+    def _on_warning(self, topic, payload):
+        # raises and clears share one queue so they are logged in order
+        if topic == BUS_RAISED:
+            logger.warning("RAISED %s [%s] %s", payload.get('id'), payload.get('severity'), payload.get('message'))
+        elif topic == BUS_CLEARED:
+            logger.info("CLEARED %s", payload)
+
+    def _sync_mission_time(self):
+        if self.missions is None:
+            return
+        remaining = self.missions.time_remaining()
+        self.telemetry.set_mission_time_remaining(-1.0 if remaining is None else remaining)
+
+    async def _report_stats(self):
+        while True:
+            await asyncio.sleep(self.STATS_INTERVAL)
+            logger.info("Ingest %s, %d active warnings",
+                        self.telemetry.ingest_stats(), len(self.telemetry.get_active_warnings()))
+
+    def request_stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run(self, duration=None):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self.request_stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows: fall back to a plain handler that hops onto the loop
+                signal.signal(sig, lambda *_: self._call_in_loop(self.request_stop))
+
+        self.telemetry.bus.subscribe("warning/#", self._on_warning, name="server-warnings", loop=self._loop)
+        self.missions = MissionManager(
+            self.broker_host, self.broker_port, f"{self.client_id}-missions",
+            state_change_callback=lambda _payload: self._call_in_loop(self._sync_mission_time),
+            persistence_file=self.mission_file, fast_startup=self.fast_startup, recorder=self.recorder,
+            archive_after=self.archive_after)
+        self.telemetry.start(fast_startup=self.fast_startup)
+        self._sync_mission_time()
+        logger.info("Helios server ready in %.1f ms (broker %s:%s)",
+                    (time.perf_counter() - _START) * 1000.0, self.broker_host, self.broker_port)
+
+        stats = asyncio.ensure_future(self._report_stats())
+        try:
+            if duration is None:
+                await self._stop.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), duration)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            stats.cancel()
+            self.shutdown()
+
+    def shutdown(self):
+        logger.info("Shutting down")
+        if self.missions is not None:
+            self.missions.shutdown()
+        self.telemetry.shutdown()
+        if self.recorder is not None:
+            self.recorder.close()
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Helios headless server (no Qt)")
+    parser.add_argument("--host", default=os.environ.get("HELIOS_MQTT_HOST", "localhost"), help="MQTT broker host")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("HELIOS_MQTT_PORT", "1883")), help="MQTT broker port")
+    parser.add_argument("--client-id", default="helios-server")
+    parser.add_argument("--missions", default=None, help="mission catalog file (default: backend/mission/missions.json)")
+    parser.add_argument("--record", default=None if os.environ.get("HELIOS_RECORD", "1") in ("", "0") else RECORDINGS,
+                        help="recordings database for export (default: backend/recordings.db; set HELIOS_RECORD=0 to disable)")
+    parser.add_argument("--archive-after", type=float, default=None,
+                        help="archive finished missions unchanged for this many seconds (default: never)")
+    parser.add_argument("--duration", type=float, default=None, help="stop after this many seconds")
+    parser.add_argument("--log-level", default="INFO")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    trace_path = configure_from_env()
+    server = HeliosServer(args.host, args.port, args.client_id, mission_file=args.missions, record_path=args.record,
+                          archive_after=args.archive_after)
+    try:
+        asyncio.run(server.run(duration=args.duration))
+    finally:
+        if trace_path:
+            try:
+                count = tracer.dump_chrome(trace_path)
+                logger.info("Wrote %d trace events to %s", count, trace_path)
+            except Exception:
+                logger.exception("Failed writing trace to %s", trace_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
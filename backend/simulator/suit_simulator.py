@@ -6,9 +6,12 @@ import os
 import socket
 
 try:
-    from backend.common.topics import TRICORDER_TELEMETRY
+    from backend.common.topics import TRICORDER_TELEMETRY, TRICORDER_TELEMETRY_FRAMES
+    from backend.common.clock import SYSTEM_CLOCK
     from backend.common.mqtt import MQTTClient
     from backend.common.utils import safe_publish
+    from backend.telemetry.publish_policy import AdaptivePublishPolicy
+    from backend.telemetry.frames import FrameBatcher
 except Exception:
     # fall back to previous imports if common helpers are not available
     try:
@@ -20,6 +23,10 @@ except Exception:
         from mqtt import MQTTClient
     # provide fallback constants/helpers
     TRICORDER_TELEMETRY = "tricorder/telemetry"
+    TRICORDER_TELEMETRY_FRAMES = "tricorder/telemetry/frames"
+    AdaptivePublishPolicy = None
+    FrameBatcher = None
+    SYSTEM_CLOCK = None
     def safe_publish(mqtt_client, topic, payload):
         try:
             return mqtt_client.publish(topic, payload)
@@ -34,7 +41,8 @@ class SuitSimulator:
     BATTERY_SPIKE_CHANCE = 0.001
     
     def __init__(self, mqtt_client=None, broker_host="localhost", 
-                 broker_port=1883, client_id="tricorder-sim", interval=1.0):
+                 broker_port=1883, client_id="tricorder-sim", interval=1.0, adaptive=False, policy=None, clock=None,
+                 frame_size=1, frame_max_age=5.0):
 
         self.mqtt = mqtt_client or MQTTClient(broker_host, broker_port, client_id)
         if not mqtt_client and self.mqtt.connect():
@@ -44,6 +52,20 @@ class SuitSimulator:
         self.suit_temp, self.external_temp = 20.0, -40.0
         self.battery, self.leak = 95.0, False
         self.telemetry_interval = interval
+        # sample timestamps and pacing; a VirtualClock speeds up long runs
+        self.clock = clock or SYSTEM_CLOCK or time
+        # opt-in report by exception: sample every `min_interval` instead of
+        # `interval`, but only publish on change, heartbeat or when a warning
+        # threshold is near
+        if policy is None and adaptive and AdaptivePublishPolicy is not None:
+            policy = AdaptivePublishPolicy(clock=self.clock.monotonic)
+        self.policy = policy
+        # with frame_size > 1, samples are batched into compressed frames on
+        # TRICORDER_TELEMETRY_FRAMES; urgent samples flush the batch at once
+        self.frames = None
+        if frame_size > 1 and FrameBatcher is not None:
+            self.frames = FrameBatcher(frame_size, max_age=frame_max_age, clock=self.clock.monotonic)
+        self.suit_id = client_id
         self._running = False
         self._thread = None
 
@@ -59,8 +81,11 @@ class SuitSimulator:
             self._thread.join(timeout)
 
     def _run(self):
+        # with a policy the sensors are sampled at its fastest rate and the
+        # random walk is scaled so the drift per second stays the same
+        tick = self.policy.min_interval if self.policy else self.telemetry_interval
         while self._running:
-            self._update_sensors()
+            self._update_sensors(tick)
             payload = {
                 "o2": round(self.o2, 2),
                 "co2": round(self.co2, 3),
@@ -68,8 +93,20 @@ class SuitSimulator:
                 "external_temp": round(self.external_temp, 2),
                 "battery": round(self.battery, 2),
                 "leak": self.leak,
-                "timestamp": int(time.time())
+                "suit_id": self.suit_id,
+                "timestamp": round(self.clock.time(), 3) if self.policy else int(self.clock.time())
             }
+            publish, reason = self.policy.should_publish(payload) if self.policy is not None else (True, None)
+            if self.frames is not None:
+                ready = self.frames.add(payload, flush=reason == "urgent") if publish else []
+                ready.extend(self.frames.due())
+                for frame in ready:
+                    self._publish_frame(frame)
+                self.clock.sleep(tick)
+                continue
+            if not publish:
+                self.clock.sleep(tick)
+                continue
             # use safe_publish from common utils when available
             try:
                 safe_publish(self.mqtt, TRICORDER_TELEMETRY, payload)
@@ -79,24 +116,44 @@ class SuitSimulator:
                     self.mqtt.publish(TRICORDER_TELEMETRY, payload)
                 except Exception:
                     pass
-            time.sleep(self.telemetry_interval)
+            self.clock.sleep(tick)
 
-    def _update_sensors(self):
+        if self.frames is not None:
+            for frame in self.frames.flush():
+                self._publish_frame(frame)
+
+    def _publish_frame(self, frame):
+        publish_raw = getattr(self.mqtt, "publish_raw", None) or self.mqtt.publish
+        try:
+            publish_raw(TRICORDER_TELEMETRY_FRAMES, frame)
+        except Exception:
+            pass
+
+    def stats(self):
+        """Publish-policy statistics, or None when publishing every sample."""
+        return self.policy.stats() if self.policy else None
+
+    def frame_stats(self):
+        """Frame count and compression ratio, or None when not batching."""
+        return self.frames.stats() if self.frames is not None else None
+
+    def _update_sensors(self, scale=1.0):
+        # `scale` is the step length in seconds; drift and event odds are per second
         if not self.leak:
-            self.o2 -= random.uniform(0.01, 0.05)
-            self.co2 += random.uniform(-0.01, 0.05)
+            self.o2 -= random.uniform(0.01, 0.05) * scale
+            self.co2 += random.uniform(-0.01, 0.05) * scale
         else:
-            self.o2 -= random.uniform(0.3, 1.0)
-            self.co2 += random.uniform(0.05, 0.15)
+            self.o2 -= random.uniform(0.3, 1.0) * scale
+            self.co2 += random.uniform(0.05, 0.15) * scale
 
-        self.battery -= random.uniform(0.01, 0.05)
-        if random.random() < self.BATTERY_SPIKE_CHANCE:
+        self.battery -= random.uniform(0.01, 0.05) * scale
+        if random.random() < self.BATTERY_SPIKE_CHANCE * scale:
             self.battery -= random.uniform(5, 20)
 
-        self.suit_temp += random.uniform(-0.02, 0.02)
-        self.external_temp += random.uniform(-0.1, 0.1)
+        self.suit_temp += random.uniform(-0.02, 0.02) * scale
+        self.external_temp += random.uniform(-0.1, 0.1) * scale
 
-        if self.battery < self.LOW_BATTERY_THRESHOLD and random.random() < self.LEAK_PROBABILITY:
+        if self.battery < self.LOW_BATTERY_THRESHOLD and random.random() < self.LEAK_PROBABILITY * scale:
             self.leak = True
 
         self.o2 = max(0, min(100, self.o2))
@@ -119,8 +176,11 @@ if __name__ == "__main__":
         print("Simulator is already running on port 50000. Only one instance allowed.")
         sys.exit(1)
 
-    # Instantiate with default client id (can be overridden by callers)
-    sim = SuitSimulator()
+    # Instantiate with default client id (can be overridden by callers);
+    # HELIOS_ADAPTIVE=1 publishes by exception, HELIOS_FRAME_SIZE=20 batches
+    # samples into compressed frames
+    sim = SuitSimulator(adaptive=os.environ.get("HELIOS_ADAPTIVE", "0") not in ("", "0"),
+                        frame_size=int(os.environ.get("HELIOS_FRAME_SIZE", "1")))
     sim.start()
     print("Simulator running... Press Ctrl+C to stop.")
     try:
@@ -129,6 +189,14 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\nStopping...")
         sim._running = False
+        stats = sim.stats()
+        if stats:
+            print(f"Published {stats['published']}/{stats['samples']} samples "
+                  f"({stats['reduction']:.0%} fewer, {stats['bytes_published']}/{stats['bytes_sampled']} bytes): {stats['reasons']}")
+        frames = sim.frame_stats()
+        if frames:
+            print(f"Sent {frames['samples']} samples in {frames['frames']} frames, "
+                  f"{frames['frame_bytes']}/{frames['json_bytes']} bytes ({frames['ratio']}x smaller)")
         print("Stopped.")
     finally:
         try:
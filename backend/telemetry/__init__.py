@@ -1,4 +1,4 @@
-from .models import Telemetry
+from .models import Telemetry, TelemetryError
 from .producer import WarningEngine
 
-__all__ = ["Telemetry", "WarningEngine"]
+__all__ = ["Telemetry", "TelemetryError", "WarningEngine"]
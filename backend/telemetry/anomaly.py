@@ -0,0 +1,124 @@
+import math
+from typing import Dict, Optional
+
+from backend.common.clock import SYSTEM_CLOCK
+
+
+class _ChannelStats:
+    __slots__ = ("count", "mean", "var", "last", "ts", "message", "active_until")
+
+    def __init__(self, value: float, ts: float):
+        self.count = 1
+        self.mean = value
+        self.var = 0.0
+        self.last = value
+        self.ts = ts
+        self.message = None
+        self.active_until = 0.0
+
+
+class AnomalyDetector:
+    """Per-suit, per-channel streaming anomaly detection.
+
+    Every channel keeps a Welford running mean/variance that turns into an
+    exponentially weighted one after `window` samples, plus the previous
+    value for a rate-of-change limit. State is a fixed handful of numbers
+    per channel, so memory stays O(1) per channel per suit. A detection
+    stays active for `hold_seconds` so the resulting warning does not
+    flicker off on the next in-range sample.
+    """
+
+    LABELS = {
+        "o2": "O2",
+        "co2": "CO2",
+        "battery": "BATTERY",
+        "suit_temp": "SUIT TEMP",
+        "external_temp": "EXT TEMP",
+    }
+    # largest plausible change per second for each channel
+    RATE_LIMITS = {
+        "o2": 2.0,
+        "co2": 0.5,
+        "battery": 2.0,
+        "suit_temp": 1.0,
+        "external_temp": 5.0,
+    }
+    # floor for the standard deviation so quiet channels do not alarm on noise
+    MIN_STD = {
+        "o2": 0.5,
+        "co2": 0.05,
+        "battery": 0.5,
+        "suit_temp": 0.25,
+        "external_temp": 1.0,
+    }
+
+    def __init__(self, z_threshold: float = 6.0, window: int = 60, warmup: int = 20,
+                 hold_seconds: float = 30.0, rate_limits: Optional[Dict[str, float]] = None, clock=None):
+        self.z_threshold = z_threshold
+        self.window = window
+        self.warmup = warmup
+        self.hold_seconds = hold_seconds
+        self.rate_limits = {**self.RATE_LIMITS, **(rate_limits or {})}
+        # stamps samples that arrive without a timestamp
+        self.clock = clock or SYSTEM_CLOCK
+        self.detections = 0
+        self._suits: Dict[str, Dict[str, _ChannelStats]] = {}
+
+    def update(self, data) -> Dict[str, str]:
+        """Fold one sample in and return {channel: message} for active anomalies."""
+        suit_id = data.get("suit_id") or "default"
+        ts = data.get("timestamp")
+        ts = float(ts) if ts is not None else self.clock.time()
+        channels = self._suits.get(suit_id)
+        if channels is None:
+            channels = self._suits[suit_id] = {}
+
+        active = {}
+        for channel, limit in self.rate_limits.items():
+            value = data.get(channel)
+            st = channels.get(channel)
+            if value is None:
+                if st is not None and st.message and st.active_until >= ts:
+                    active[channel] = st.message
+                continue
+            value = float(value)
+            if st is None:
+                channels[channel] = _ChannelStats(value, ts)
+                continue
+
+            label = self.LABELS.get(channel, channel.upper())
+            message = None
+            dt = ts - st.ts
+            if dt > 0:
+                rate = (value - st.last) / dt
+                if abs(rate) > limit:
+                    message = f"{label} ANOMALY ({rate:+.2f}/s)"
+            if message is None and st.count >= self.warmup:
+                std = max(math.sqrt(st.var), self.MIN_STD.get(channel, 0.0))
+                z = (value - st.mean) / std
+                if abs(z) > self.z_threshold:
+                    message = f"{label} ANOMALY ({z:+.0f} SIGMA)"
+
+            # Welford update; alpha is 1/n until the window fills, then fixed
+            st.count += 1
+            alpha = 1.0 / min(st.count, self.window)
+            diff = value - st.mean
+            incr = alpha * diff
+            st.mean += incr
+            st.var = (1.0 - alpha) * (st.var + diff * incr)
+            st.last = value
+            if dt > 0:
+                st.ts = ts
+
+            if message is not None:
+                self.detections += 1
+                st.message = message
+                st.active_until = ts + self.hold_seconds
+            if st.message and st.active_until >= ts:
+                active[channel] = st.message
+            else:
+                st.message = None
+        return active
+
+    def forget(self, suit_id: str):
+        self._suits.pop(suit_id, None)
@@ -0,0 +1,93 @@
+from typing import Dict, FrozenSet, Optional
+
+from .producer import WarningEngine
+
+CHANNELS = frozenset(("o2", "battery", "co2", "leak", "suit_temp", "external_temp"))
+
+
+class _SuitState:
+    __slots__ = ("values", "emitted_at")
+
+    def __init__(self):
+        self.values: Dict[str, object] = {}
+        self.emitted_at = None
+
+
+class DeadbandFilter:
+    """Per-suit, per-channel deadband applied at ingest.
+
+    `update(record)` returns the set of channels that moved by more than
+    their deadband since the value last reported for that suit; an empty
+    set means the sample can be dropped. A channel also counts as changed
+    when it crosses a `WarningEngine` threshold, however small the step,
+    and every channel is reported again after `max_silence` seconds of
+    sample time so downstream state keeps refreshing.
+    """
+
+    DEADBANDS = {"o2": 0.05, "co2": 0.01, "battery": 0.1, "suit_temp": 0.1, "external_temp": 0.5}
+
+    def __init__(self, deadbands: Optional[Dict[str, float]] = None, thresholds: Optional[Dict[str, float]] = None,
+                 max_silence: float = 5.0):
+        self.deadbands = {**self.DEADBANDS, **(deadbands or {})}
+        self.thresholds = {**WarningEngine.THRESHOLDS, **(thresholds or {})}
+        self.max_silence = max_silence
+        self._suits: Dict[Optional[str], _SuitState] = {}
+        self.passed = 0
+        self.suppressed = 0
+        self.heartbeats = 0
+        # per channel: samples where it moved but stayed inside its deadband
+        self.suppressed_by_field: Dict[str, int] = {}
+
+    def _crossed(self, channel: str, old, new) -> bool:
+        for key, _ in WarningEngine.THRESHOLD_CHANNELS.get(channel, ()):
+            limit = self.thresholds.get(key)
+            if limit is not None and (old < limit) != (new < limit):
+                return True
+        return False
+
+    def update(self, record) -> FrozenSet[str]:
+        state = self._suits.get(record.suit_id)
+        if state is None:
+            state = self._suits[record.suit_id] = _SuitState()
+        ts = record.timestamp
+        values = state.values
+        heartbeat = state.emitted_at is None or (ts is not None and ts - state.emitted_at >= self.max_silence)
+
+        changed = set()
+        for channel in CHANNELS:
+            value = getattr(record, channel)
+            if value is None:
+                continue
+            previous = values.get(channel)
+            if heartbeat or previous is None or isinstance(value, bool):
+                moved = heartbeat or previous is None or value != previous
+            else:
+                delta = abs(value - previous)
+                moved = delta > self.deadbands.get(channel, 0.0) or self._crossed(channel, previous, value)
+                if not moved and delta:
+                    self.suppressed_by_field[channel] = self.suppressed_by_field.get(channel, 0) + 1
+            if moved:
+                # only reported values become the new reference, so slow
+                # drift accumulates until it leaves the deadband
+                values[channel] = value
+                changed.add(channel)
+
+        if heartbeat:
+            self.heartbeats += 1
+        if changed:
+            self.passed += 1
+            state.emitted_at = ts
+        else:
+            self.suppressed += 1
+        return frozenset(changed)
+
+    def forget(self, suit_id):
+        self._suits.pop(suit_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "passed": self.passed,
+            "suppressed": self.suppressed,
+            "heartbeats": self.heartbeats,
+            "suppressed_by_field": dict(self.suppressed_by_field),
+        }
@@ -0,0 +1,211 @@
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from backend.common.clock import SYSTEM_CLOCK
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS warning_events (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        ts REAL NOT NULL,
+        kind TEXT NOT NULL,
+        warning_id TEXT NOT NULL,
+        severity TEXT,
+        suit_id TEXT,
+        message TEXT,
+        data TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_warning_events_ts ON warning_events (ts)",
+    "CREATE INDEX IF NOT EXISTS idx_warning_events_wid_ts ON warning_events (warning_id, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_warning_events_sev_ts ON warning_events (severity, ts)",
+)
+
+_STOP = object()
+
+
+class WarningEventLog:
+    """Append-only SQLite log of warning raise/clear/ack/escalate events.
+
+    `append` only enqueues; a single writer thread batches inserts and
+    enforces retention (`max_age_seconds` and `max_rows`). Queries use the
+    time, warning-id and severity indexes, so range lookups never scan the
+    whole table.
+
+    `readonly=True` opens an existing log for queries only (no schema, no
+    writer thread), for a process that reads another process's log.
+    """
+
+    KINDS = ("raise", "clear", "ack", "escalate")
+
+    def __init__(self, path: str, max_age_seconds: Optional[float] = 30 * 24 * 3600, max_rows: Optional[int] = 1_000_000,
+                 batch_size: int = 256, prune_interval: float = 60.0, queue_size: int = 10000,
+                 readonly: bool = False, clock=None):
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self.max_rows = max_rows
+        self.batch_size = batch_size
+        self.prune_interval = prune_interval
+        # event timestamps and the retention cutoff follow this clock
+        self.clock = clock or SYSTEM_CLOCK
+        self.dropped = 0
+        self.written = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._read_lock = threading.Lock()
+        self._writer = None
+
+        if readonly:
+            self._reader = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False, timeout=10.0)
+            return
+        d = os.path.dirname(path)
+        if d and not os.path.exists(d):
+            os.makedirs(d, exist_ok=True)
+        conn = self._connect()
+        try:
+            for stmt in _SCHEMA:
+                conn.execute(stmt)
+            conn.commit()
+        finally:
+            conn.close()
+        self._reader = self._connect()
+        self._writer = threading.Thread(target=self._writer_loop, name="warning-event-log", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10.0)
+        # WAL lets queries run while the writer thread appends
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def append(self, kind: str, warning_id: str, severity: Optional[str] = None, suit_id: Optional[str] = None,
+               message: Optional[str] = None, data: Optional[Dict[str, Any]] = None, ts: Optional[float] = None):
+        row = (self.clock.time() if ts is None else ts, kind, warning_id, severity, suit_id, message,
+               json.dumps(data, separators=(",", ":")) if data else None)
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def _writer_loop(self):
+        conn = self._connect()
+        last_prune = 0.0
+        try:
+            while True:
+                item = self._queue.get()
+                stop = item is _STOP
+                rows = [] if stop else [item]
+                while not stop and len(rows) < self.batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    rows.append(item)
+                if rows:
+                    try:
+                        conn.executemany(
+                            "INSERT INTO warning_events (ts, kind, warning_id, severity, suit_id, message, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            rows)
+                        conn.commit()
+                        self.written += len(rows)
+                    except Exception:
+                        logger.exception("Failed writing %d warning events", len(rows))
+                    for _ in rows:
+                        self._queue.task_done()
+                now = time.monotonic()
+                if stop or now - last_prune >= self.prune_interval:
+                    last_prune = now
+                    self._prune(conn)
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _prune(self, conn: sqlite3.Connection):
+        try:
+            if self.max_age_seconds is not None:
+                conn.execute("DELETE FROM warning_events WHERE ts < ?", (self.clock.time() - self.max_age_seconds,))
+            if self.max_rows is not None:
+                conn.execute("DELETE FROM warning_events WHERE seq <= (SELECT MAX(seq) FROM warning_events) - ?", (self.max_rows,))
+            conn.commit()
+        except Exception:
+            logger.exception("Failed pruning warning event log")
+
+    def query(self, since: Optional[float] = None, until: Optional[float] = None, severity: Optional[str] = None,
+              warning_id: Optional[str] = None, kind: Optional[str] = None, suit_id: Optional[str] = None,
+              limit: int = 1000) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if warning_id is not None:
+            clauses.append("warning_id = ?")
+            params.append(warning_id)
+        if severity is not None:
+            clauses.append("severity = ?")
+            params.append(severity)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        if kind is not None:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if suit_id is not None:
+            clauses.append("suit_id = ?")
+            params.append(suit_id)
+        sql = "SELECT seq, ts, kind, warning_id, severity, suit_id, message, data FROM warning_events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts DESC LIMIT ?"
+        params.append(int(limit))
+        with self._read_lock:
+            rows = self._reader.execute(sql, params).fetchall()
+        return [
+            {
+                "seq": seq,
+                "timestamp": ts,
+                "kind": kind_,
+                "warning_id": wid,
+                "severity": sev,
+                "suit_id": sid,
+                "message": msg,
+                "data": json.loads(data) if data else None,
+            }
+            for seq, ts, kind_, wid, sev, sid, msg, data in rows
+        ]
+
+    def recent(self, seconds: float, severity: Optional[str] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+        return self.query(since=self.clock.time() - seconds, severity=severity, limit=limit)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = 5.0):
+        if self._writer is None:
+            with self._read_lock:
+                self._reader.close()
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Warning event log queue full on close; pending events dropped")
+        self._writer.join(timeout)
+        with self._read_lock:
+            try:
+                self._reader.close()
+            except Exception:
+                pass
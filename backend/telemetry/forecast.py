@@ -0,0 +1,93 @@
+import math
+from typing import Any, Dict, Optional
+
+from backend.common.clock import SYSTEM_CLOCK
+
+
+class _ChannelEstimate:
+    __slots__ = ("value", "rate", "ts", "samples")
+
+    def __init__(self, value: float, ts: float):
+        self.value = value
+        self.rate = 0.0
+        self.ts = ts
+        self.samples = 1
+
+
+class DepletionForecaster:
+    """Streaming time-to-threshold estimates for consumables, per suit.
+
+    Each channel keeps only its last value, timestamp and an exponentially
+    weighted rate of change, so an update is O(1) regardless of how long
+    the suit has been transmitting. The smoothing weight depends on the
+    gap between samples (time constant `tau` seconds), which keeps the
+    estimate stable when the publish rate changes.
+    """
+
+    # channel -> (threshold key, direction the value moves when depleting)
+    CHANNELS = {
+        "o2": ("o2_low", -1),
+        "battery": ("battery_low", -1),
+        "co2": ("co2_high", 1),
+    }
+
+    def __init__(self, thresholds: Dict[str, float], tau: float = 30.0, min_samples: int = 5, clock=None):
+        self.thresholds = thresholds
+        self.tau = tau
+        self.min_samples = min_samples
+        # stamps samples that arrive without a timestamp
+        self.clock = clock or SYSTEM_CLOCK
+        self._suits: Dict[str, Dict[str, _ChannelEstimate]] = {}
+
+    def update(self, data) -> Dict[str, Any]:
+        """Fold one telemetry sample in and return the suit's current forecast."""
+        suit_id = data.get("suit_id") or "default"
+        ts = data.get("timestamp")
+        ts = float(ts) if ts is not None else self.clock.time()
+        channels = self._suits.get(suit_id)
+        if channels is None:
+            channels = self._suits[suit_id] = {}
+
+        forecast: Dict[str, Any] = {"suit_id": suit_id, "timestamp": ts}
+        for channel, (threshold_key, direction) in self.CHANNELS.items():
+            value = data.get(channel)
+            est = channels.get(channel)
+            if value is not None:
+                value = float(value)
+                if est is None:
+                    est = channels[channel] = _ChannelEstimate(value, ts)
+                else:
+                    dt = ts - est.ts
+                    # samples sharing a timestamp are folded into the next one
+                    if dt > 0:
+                        alpha = 1.0 - math.exp(-dt / self.tau)
+                        est.rate += alpha * ((value - est.value) / dt - est.rate)
+                        est.value = value
+                        est.ts = ts
+                        est.samples += 1
+            forecast[channel] = self._time_to_threshold(est, self.thresholds[threshold_key], direction)
+        return forecast
+
+    def _time_to_threshold(self, est: Optional[_ChannelEstimate], threshold: float, direction: int) -> Optional[float]:
+        if est is None or est.samples < self.min_samples:
+            return None
+        margin = (threshold - est.value) * direction
+        if margin <= 0:
+            return 0.0
+        # only a trend towards the threshold produces a finite estimate
+        toward = est.rate * direction
+        if toward <= 1e-9:
+            return None
+        return margin / toward
+
+    def forget(self, suit_id: str):
+        self._suits.pop(suit_id, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        for suit_id, channels in self._suits.items():
+            entry = {}
+            for channel, (threshold_key, direction) in self.CHANNELS.items():
+                entry[channel] = self._time_to_threshold(channels.get(channel), self.thresholds[threshold_key], direction)
+            result[suit_id] = entry
+        return result
@@ -0,0 +1,308 @@
+import json
+import math
+import struct
+import time
+from typing import Any, Dict, List, Optional
+
+# b"HF" + format version
+MAGIC = b"HF\x01"
+
+# float channels, one XOR-compressed column each, in frame order
+FLOAT_CHANNELS = ("o2", "battery", "co2", "suit_temp", "external_temp")
+
+# a frame carries at most this many samples
+MAX_SAMPLES = 0xFFFF
+
+_HEADER = struct.Struct("<3sB")     # magic, suit id length
+_COUNT = struct.Struct("<H")
+_DOUBLE = struct.Struct("<d")
+_U64 = struct.Struct("<Q")
+_MASK64 = (1 << 64) - 1
+
+# delta-of-delta buckets: (prefix, prefix bits, value bits); the value is
+# stored offset by 2**(bits-1)-1 so [-(2**(bits-1)-1), 2**(bits-1)] fits
+_DOD_BUCKETS = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12))
+
+# leak column codes
+_LEAK_CODES = {False: 0, True: 1, None: 2}
+_LEAK_VALUES = (False, True, None)
+
+
+class FrameError(ValueError):
+    """Raised when a telemetry frame cannot be encoded or decoded."""
+
+
+class _BitWriter:
+    __slots__ = ("_acc", "_bits")
+
+    def __init__(self):
+        self._acc = 0
+        self._bits = 0
+
+    def write(self, value: int, bits: int):
+        self._acc = (self._acc << bits) | (value & ((1 << bits) - 1))
+        self._bits += bits
+
+    def to_bytes(self) -> bytes:
+        pad = -self._bits % 8
+        return (self._acc << pad).to_bytes((self._bits + pad) // 8, "big")
+
+
+class _BitReader:
+    __slots__ = ("_value", "_left")
+
+    def __init__(self, data: bytes):
+        self._value = int.from_bytes(data, "big")
+        self._left = len(data) * 8
+
+    def read(self, bits: int) -> int:
+        if bits > self._left:
+            raise FrameError("truncated frame")
+        self._left -= bits
+        return (self._value >> self._left) & ((1 << bits) - 1)
+
+
+def _float_bits(value) -> int:
+    # a missing channel travels as NaN
+    number = math.nan if value is None else float(value)
+    return _U64.unpack(_DOUBLE.pack(number))[0]
+
+
+def _bits_float(bits: int) -> Optional[float]:
+    number = _DOUBLE.unpack(_U64.pack(bits))[0]
+    return None if math.isnan(number) else number
+
+
+def _write_timestamps(out: _BitWriter, stamps: List[int]):
+    out.write(stamps[0], 64)
+    prev, delta = stamps[0], 0
+    for stamp in stamps[1:]:
+        dod = (stamp - prev) - delta
+        delta = stamp - prev
+        prev = stamp
+        if dod == 0:
+            out.write(0, 1)
+            continue
+        for prefix, prefix_bits, bits in _DOD_BUCKETS:
+            offset = (1 << (bits - 1)) - 1
+            if -offset <= dod <= offset + 1:
+                out.write(prefix, prefix_bits)
+                out.write(dod + offset, bits)
+                break
+        else:
+            out.write(0b1111, 4)
+            out.write(dod & _MASK64, 64)
+
+
+def _read_timestamps(src: _BitReader, count: int) -> List[int]:
+    stamps = [src.read(64)]
+    delta = 0
+    for _ in range(count - 1):
+        dod = 0
+        if src.read(1):
+            for _prefix, prefix_bits, bits in _DOD_BUCKETS:
+                if not src.read(1):
+                    dod = src.read(bits) - ((1 << (bits - 1)) - 1)
+                    break
+            else:
+                dod = src.read(64)
+                if dod >> 63:
+                    dod -= 1 << 64
+        delta += dod
+        stamps.append(stamps[-1] + delta)
+    return stamps
+
+
+def _write_floats(out: _BitWriter, values: List[int]):
+    prev = values[0]
+    out.write(prev, 64)
+    lead = trail = -1
+    for bits in values[1:]:
+        xor = bits ^ prev
+        prev = bits
+        if not xor:
+            out.write(0, 1)
+            continue
+        out.write(1, 1)
+        new_lead = min(31, 64 - xor.bit_length())
+        new_trail = (xor & -xor).bit_length() - 1
+        if lead >= 0 and new_lead >= lead and new_trail >= trail:
+            # fits in the previous meaningful-bits window
+            out.write(0, 1)
+            out.write(xor >> trail, 64 - lead - trail)
+            continue
+        lead, trail = new_lead, new_trail
+        size = 64 - lead - trail
+        out.write(1, 1)
+        out.write(lead, 5)
+        out.write(size - 1, 6)
+        out.write(xor >> trail, size)
+
+
+def _read_floats(src: _BitReader, count: int) -> List[int]:
+    values = [src.read(64)]
+    lead = trail = 0
+    for _ in range(count - 1):
+        if not src.read(1):
+            values.append(values[-1])
+            continue
+        if src.read(1):
+            lead = src.read(5)
+            trail = 64 - lead - (src.read(6) + 1)
+        values.append(values[-1] ^ (src.read(64 - lead - trail) << trail))
+    return values
+
+
+def encode_frame(samples: List[Dict[str, Any]]) -> bytes:
+    """Pack consecutive samples of one suit into a compressed frame.
+
+    Timestamps are kept to the millisecond and stored as delta-of-deltas,
+    so a steady sample rate costs one bit per sample; every float channel
+    is a column of XORs against the previous value (Gorilla encoding), so
+    an unchanged reading also costs one bit. Leak costs a bit unless it
+    changes. Field names and the suit id are written once per frame.
+    """
+    if not samples:
+        raise FrameError("no samples")
+    if len(samples) > MAX_SAMPLES:
+        raise FrameError(f"at most {MAX_SAMPLES} samples per frame")
+    suit_id = samples[0].get("suit_id")
+    suit = b"" if suit_id is None else str(suit_id).encode("utf-8")
+    if len(suit) > 255:
+        raise FrameError("suit_id too long")
+    stamps = []
+    for sample in samples:
+        if sample.get("suit_id") != suit_id:
+            raise FrameError("a frame carries a single suit")
+        ts = sample.get("timestamp")
+        if ts is None or ts <= 0:
+            raise FrameError(f"bad timestamp {ts!r}")
+        stamps.append(int(round(ts * 1000)))
+
+    out = _BitWriter()
+    _write_timestamps(out, stamps)
+    for channel in FLOAT_CHANNELS:
+        _write_floats(out, [_float_bits(sample.get(channel)) for sample in samples])
+    prev = None
+    for i, sample in enumerate(samples):
+        leak = sample.get("leak")
+        leak = None if leak is None else bool(leak)
+        if i and leak == prev:
+            out.write(0, 1)
+        else:
+            out.write(1, 1)
+            out.write(_LEAK_CODES[leak], 2)
+        prev = leak
+    return _HEADER.pack(MAGIC, len(suit)) + suit + _COUNT.pack(len(samples)) + out.to_bytes()
+
+
+def decode_frame(data: bytes) -> List[Dict[str, Any]]:
+    """Unpack a frame into sample payloads, oldest first; raises FrameError."""
+    data = bytes(data)
+    if len(data) < _HEADER.size or data[:3] != MAGIC:
+        raise FrameError("not a telemetry frame")
+    suit_len = data[3]
+    offset = _HEADER.size + suit_len
+    if len(data) < offset + _COUNT.size:
+        raise FrameError("truncated frame")
+    suit_id = data[_HEADER.size:offset].decode("utf-8") or None
+    count = _COUNT.unpack_from(data, offset)[0]
+    if not count:
+        raise FrameError("empty frame")
+
+    src = _BitReader(data[offset + _COUNT.size:])
+    stamps = _read_timestamps(src, count)
+    columns = [_read_floats(src, count) for _ in FLOAT_CHANNELS]
+    leaks = []
+    prev = None
+    for _ in range(count):
+        if src.read(1):
+            code = src.read(2)
+            if code >= len(_LEAK_VALUES):
+                raise FrameError(f"bad leak code {code}")
+            prev = _LEAK_VALUES[code]
+        leaks.append(prev)
+
+    samples = []
+    for i in range(count):
+        ms = stamps[i]
+        sample = {"timestamp": ms // 1000 if ms % 1000 == 0 else ms / 1000.0, "suit_id": suit_id, "leak": leaks[i]}
+        for channel, column in zip(FLOAT_CHANNELS, columns):
+            sample[channel] = _bits_float(column[i])
+        samples.append(sample)
+    return samples
+
+
+def json_size(samples: List[Dict[str, Any]]) -> int:
+    """Bytes the samples take as one JSON message each, for ratio reporting."""
+    return sum(len(json.dumps(sample)) for sample in samples)
+
+
+class FrameBatcher:
+    """Collects one suit's samples and emits a frame every `size` samples.
+
+    `add` returns the encoded frame once `size` samples are buffered, or
+    straight away with `flush=True` (e.g. for an urgent sample); `due`
+    returns a partial frame once its oldest sample is `max_age` seconds
+    old, so a slow or quiet producer never holds samples back for long.
+    `stats()` reports frames, samples and the compression ratio against
+    sending every sample as its own JSON message.
+    """
+
+    def __init__(self, size: int = 20, max_age: float = 5.0, clock=time.monotonic):
+        if not 1 <= size <= MAX_SAMPLES:
+            raise ValueError(f"size must be between 1 and {MAX_SAMPLES}")
+        self.size = size
+        self.max_age = max_age
+        self._clock = clock
+        self._pending: List[Dict[str, Any]] = []
+        self._first_at = 0.0
+        self.frames = 0
+        self.samples = 0
+        self.frame_bytes = 0
+        self.json_bytes = 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, sample: Dict[str, Any], flush: bool = False) -> List[bytes]:
+        """Buffer a sample; returns the frames that became ready (usually none or one)."""
+        ready = []
+        if self._pending and self._pending[0].get("suit_id") != sample.get("suit_id"):
+            ready.extend(self.flush())
+        if not self._pending:
+            self._first_at = self._clock()
+        self._pending.append(sample)
+        if flush or len(self._pending) >= self.size:
+            ready.extend(self.flush())
+        return ready
+
+    def due(self, now: Optional[float] = None) -> List[bytes]:
+        """Flush a partial frame whose oldest sample has waited `max_age`."""
+        if not self._pending:
+            return []
+        now = self._clock() if now is None else now
+        if now - self._first_at < self.max_age:
+            return []
+        return self.flush()
+
+    def flush(self) -> List[bytes]:
+        if not self._pending:
+            return []
+        samples, self._pending = self._pending, []
+        frame = encode_frame(samples)
+        self.frames += 1
+        self.samples += len(samples)
+        self.frame_bytes += len(frame)
+        self.json_bytes += json_size(samples)
+        return [frame]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "samples": self.samples,
+            "frame_bytes": self.frame_bytes,
+            "json_bytes": self.json_bytes,
+            "ratio": round(self.json_bytes / self.frame_bytes, 2) if self.frame_bytes else None,
+            "samples_per_frame": round(self.samples / self.frames, 2) if self.frames else None,
+        }
@@ -1,23 +1,57 @@
 import wave
 import math
+import sys
 import logging
+from array import array
+from itertools import accumulate
+from typing import Optional
+
+try:
+    import numpy as np
+except Exception:
+    np = None
 
 logger = logging.getLogger(__name__)
 
-def _make_beep(path, freq=880, duration=0.4, volume=0.3, rate=44100):
+
+def synthesize_tone(freq: float, duration: float, volume: float = 0.3, rate: int = 44100,
+                    freq2: Optional[float] = None, warble_hz: float = 0.0) -> bytes:
+    """Return 16-bit little-endian mono PCM for a sine tone.
+
+    With `freq2` and `warble_hz` the tone alternates between the two
+    frequencies with a continuous phase (a two-tone siren).
+    """
     n_samples = int(rate * duration)
     amplitude = int(32767 * volume)
-    try:
-        with wave.open(str(path), 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(rate)
-            frames = bytearray()
-            for i in range(n_samples):
-                t = i / rate
-                sample = int(amplitude * math.sin(2 * math.pi * freq * t))
-                frames += sample.to_bytes(2, 'little', signed=True)
-            wf.writeframes(frames)
-    except Exception:
-        logger.exception("Failed to create alert sound at %s", path)
-        raise
+    step = 2 * math.pi / rate
+    warble = bool(freq2) and warble_hz > 0
+    half_period = max(1, int(rate / (2 * warble_hz))) if warble else 0
+
+    if np is not None:
+        if warble:
+            idx = np.arange(n_samples)
+            freqs = np.where((idx // half_period) % 2 == 0, freq, freq2)
+            phase = np.cumsum(freqs * step)
+        else:
+            phase = np.arange(n_samples) * (freq * step)
+        return (amplitude * np.sin(phase)).astype('<i2').tobytes()
+
+    if warble:
+        f1, f2 = freq * step, freq2 * step
+        phases = accumulate(f1 if (i // half_period) % 2 == 0 else f2 for i in range(n_samples))
+    else:
+        k = freq * step
+        phases = (k * i for i in range(n_samples))
+    sin = math.sin
+    samples = array('h', [int(amplitude * sin(p)) for p in phases])
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def write_wav(path, pcm: bytes, rate: int = 44100):
+    with wave.open(str(path), 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm)
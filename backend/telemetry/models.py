@@ -1,16 +1,105 @@
-from dataclasses import dataclass
+import math
 from typing import Optional, Dict, Any
 
 
-@dataclass
+class TelemetryError(ValueError):
+    """Raised when a telemetry payload fails decoding or validation."""
+
+    def __init__(self, field: str, message: str):
+        super().__init__(f"{field}: {message}")
+        self.field = field
+
+
+# numeric channel -> (min, max) accepted range
+_NUMERIC_RANGES = (
+    ("o2", 0.0, 100.0),
+    ("battery", 0.0, 100.0),
+    ("co2", 0.0, 100.0),
+    ("suit_temp", -100.0, 150.0),
+    ("external_temp", -273.15, 300.0),
+)
+
+# longest accepted suit_id, in characters
+MAX_SUIT_ID = 128
+
+_TRUE = frozenset(("1", "true", "yes", "on"))
+_FALSE = frozenset(("0", "false", "no", "off", ""))
+
+
+def _coerce_number(field: str, value) -> float:
+    if isinstance(value, bool):
+        raise TelemetryError(field, "expected a number, got a boolean")
+    if isinstance(value, (int, float)):
+        number = float(value)
+    elif isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            raise TelemetryError(field, f"expected a number, got {value!r}") from None
+    else:
+        raise TelemetryError(field, f"expected a number, got {type(value).__name__}")
+    if not math.isfinite(number):
+        raise TelemetryError(field, "must be finite")
+    return number
+
+
+def _coerce_bool(field: str, value) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise TelemetryError(field, f"expected a boolean, got {value!r}")
+
+
 class Telemetry:
-    o2: Optional[float] = None
-    battery: Optional[float] = None
-    co2: Optional[float] = None
-    leak: Optional[bool] = None
-    suit_temp: Optional[float] = None
-    external_temp: Optional[float] = None
-    timestamp: Optional[int] = None
+    """Immutable, slotted telemetry sample.
+
+    `from_payload` is the validating constructor used on the ingest path.
+    `get` mirrors `dict.get` so consumers such as `WarningEngine` accept
+    either a record or a plain dict, and `as_dict` builds (once) the dict
+    handed to QML.
+    """
+
+    __slots__ = ("o2", "battery", "co2", "leak", "suit_temp", "external_temp", "timestamp", "suit_id", "_dict")
+
+    FIELDS = ("o2", "battery", "co2", "leak", "suit_temp", "external_temp", "timestamp", "suit_id")
+
+    def __init__(self, o2: Optional[float] = None, battery: Optional[float] = None, co2: Optional[float] = None,
+                 leak: Optional[bool] = None, suit_temp: Optional[float] = None, external_temp: Optional[float] = None,
+                 timestamp: Optional[float] = None, suit_id: Optional[str] = None):
+        _set = object.__setattr__
+        _set(self, "o2", o2)
+        _set(self, "battery", battery)
+        _set(self, "co2", co2)
+        _set(self, "leak", leak)
+        _set(self, "suit_temp", suit_temp)
+        _set(self, "external_temp", external_temp)
+        _set(self, "timestamp", timestamp)
+        _set(self, "suit_id", suit_id)
+        _set(self, "_dict", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Telemetry records are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Telemetry records are immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, Telemetry):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self.FIELDS if getattr(self, f) is not None)
+        return f"Telemetry({fields})"
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]):
@@ -22,15 +111,71 @@ class Telemetry:
             suit_temp=d.get("suit_temp"),
             external_temp=d.get("external_temp"),
             timestamp=d.get("timestamp"),
+            suit_id=d.get("suit_id"),
         )
 
+    @classmethod
+    def from_payload(cls, payload) -> "Telemetry":
+        """Coerce and range-check a decoded payload; raises TelemetryError."""
+        if not isinstance(payload, dict):
+            raise TelemetryError("payload", f"expected an object, got {type(payload).__name__}")
+        get = payload.get
+
+        ts = get("timestamp")
+        if ts is None:
+            raise TelemetryError("timestamp", "missing")
+        ts = _coerce_number("timestamp", ts)
+        if ts <= 0:
+            raise TelemetryError("timestamp", f"out of range ({ts})")
+        if ts.is_integer():
+            ts = int(ts)
+
+        values = {}
+        present = 0
+        for field, lo, hi in _NUMERIC_RANGES:
+            raw = get(field)
+            if raw is None:
+                values[field] = None
+                continue
+            number = _coerce_number(field, raw)
+            if number < lo or number > hi:
+                raise TelemetryError(field, f"out of range ({number})")
+            values[field] = number
+            present += 1
+
+        leak = get("leak")
+        if leak is not None:
+            leak = _coerce_bool("leak", leak)
+            present += 1
+        if not present:
+            raise TelemetryError("payload", "no telemetry channels")
+
+        suit_id = get("suit_id")
+        if suit_id is not None:
+            suit_id = str(suit_id)
+            if len(suit_id) > MAX_SUIT_ID:
+                raise TelemetryError("suit_id", "too long")
+
+        return cls(leak=leak, timestamp=ts, suit_id=suit_id, **values)
+
+    def get(self, key: str, default=None):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        return default
+
     def as_dict(self) -> Dict[str, Any]:
-        return {
-            "o2": self.o2,
-            "battery": self.battery,
-            "co2": self.co2,
-            "leak": self.leak,
-            "suit_temp": self.suit_temp,
-            "external_temp": self.external_temp,
-            "timestamp": self.timestamp,
-        }
+        d = self._dict
+        if d is None:
+            d = {
+                "o2": self.o2,
+                "battery": self.battery,
+                "co2": self.co2,
+                "leak": self.leak,
+                "suit_temp": self.suit_temp,
+                "external_temp": self.external_temp,
+                "timestamp": self.timestamp,
+                "suit_id": self.suit_id,
+            }
+            object.__setattr__(self, "_dict", d)
+        return d
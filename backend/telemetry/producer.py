@@ -1,7 +1,36 @@
-import time
+import threading
+from contextlib import contextmanager
+
+from backend.common.clock import SYSTEM_CLOCK
+from backend.common.timing_wheel import TimingWheel
+from backend.common.tracing import tracer
+from .anomaly import AnomalyDetector
+from .forecast import DepletionForecaster
+
+
+def _format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{(seconds % 3600) // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m"
+    return f"{seconds}s"
 
 
 class WarningEngine:
+    """Evaluates telemetry samples into active warnings.
+
+    Changes to the active set are transactional: `process`, `acknowledge`
+    and the signal watchdog each run in a `transaction()`, which collects
+    raises, clears, acknowledgements and severity changes into one net
+    diff. On commit `on_raise` and `on_clear` fire for what was actually
+    added and removed, then `on_update` fires exactly once with
+    {"added": [warning], "removed": [id], "changed": [warning],
+    "active": [warning]}, so consumers never need to refetch. Nothing
+    fires when the active set did not change. Transactions nest, so a
+    caller can wrap several samples (e.g. a batched frame) in one.
+    """
+
     THRESHOLDS = {
         "o2_low": 19.0,
         "battery_low": 15.0,
@@ -10,71 +39,260 @@ class WarningEngine:
         "suit_temp_low": -20.0,
         "suit_temp_high": 45.0,
     }
+    # channel -> ((threshold key, direction), ...); -1 warns below, +1 above
+    THRESHOLD_CHANNELS = {
+        "o2": (("o2_low", -1),),
+        "battery": (("battery_low", -1),),
+        "co2": (("co2_warning", +1), ("co2_high", +1)),
+        "suit_temp": (("suit_temp_low", -1), ("suit_temp_high", +1)),
+    }
+    # fields the rules read; samples changing none of them can be skipped
+    INPUT_FIELDS = frozenset(("o2", "battery", "co2", "leak", "suit_temp"))
+    FORECAST_LABELS = {"o2": "O2", "battery": "BATTERY", "co2": "CO2"}
+    # a warning raised while one of its precursors is active is logged as an escalation
+    ESCALATIONS = {"atm_loss": ("low_o2", "suit_leak"), "critical_co2": ("high_co2",)}
+    LOGGED_CHANNELS = ("o2", "battery", "co2", "leak", "suit_temp", "external_temp", "timestamp")
+    # seconds without any sample before a suit is reported as lost; the
+    # simulator heartbeats every 10 s even when nothing changes
+    SIGNAL_TIMEOUT = 30.0
+    SIGNAL_LOST = "signal_lost"
 
-    def __init__(self, thresholds=None):
+    def __init__(self, thresholds=None, clock=None, signal_timeout=SIGNAL_TIMEOUT):
+        # warning timestamps and the mission countdown follow this clock
+        self.clock = clock or SYSTEM_CLOCK
+        # process() runs on the ingest thread, the signal watchdog on its own
+        self.lock = threading.RLock()
+        self.signal_timeout = signal_timeout
+        # per-suit loss-of-signal deadlines, re-armed by every sample
+        self.watchdog = TimingWheel(tick=0.5, clock=self.clock) if signal_timeout else None
         self.thresholds = {**self.THRESHOLDS, **(thresholds or {})}
         self.active_warnings = {}
         self.on_raise = None
         self.on_clear = None
         self.on_update = None
+        # called with the per-suit time-to-threshold forecast after each sample
+        self.on_forecast = None
+        self.forecaster = DepletionForecaster(self.thresholds, clock=self.clock)
+        self.anomalies = AnomalyDetector(clock=self.clock)
+        self.latest_forecasts = {}
+        self._mission_remaining = None
+        self._mission_remaining_at = 0.0
+        # optional WarningEventLog receiving raise/clear/ack/escalate events
+        self.event_log = None
+        self._frame = None
+        # open transaction: nesting depth and the pending diff
+        self._depth = 0
+        self._added = {}
+        self._removed = {}
+        self._changed = {}
+
+    def _log_event(self, kind, warning, extra=None, from_frame=True):
+        if self.event_log is None:
+            return
+        suit_id = None
+        values = None
+        frame = self._frame if from_frame else None
+        if frame is not None:
+            suit_id = frame.get('suit_id')
+            values = {k: frame.get(k) for k in self.LOGGED_CHANNELS if frame.get(k) is not None}
+        if extra:
+            values = {**(values or {}), **extra}
+        try:
+            self.event_log.append(kind, warning['id'], warning.get('severity'), suit_id, warning.get('message'), values)
+        except Exception as e:
+            print(f"Error appending to warning event log: {e}")
+
+    @contextmanager
+    def transaction(self):
+        """Group changes into a single diff, delivered when the outermost
+        transaction exits."""
+        with self.lock:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+                if not self._depth:
+                    self._commit()
+
+    def _commit(self):
+        # called with the lock held when the outermost transaction ends
+        added, removed, changed = self._added, self._removed, self._changed
+        if not (added or removed or changed):
+            return
+        self._added, self._removed, self._changed = {}, {}, {}
+        if not (self.on_raise or self.on_clear or self.on_update):
+            return
+        # copies, so consumers on other threads see the state at commit
+        added = [dict(w) for w in added.values()]
+        changed = [dict(w) for w in changed.values()]
+        for warning in added:
+            if self.on_raise:
+                try:
+                    self.on_raise(warning)
+                except Exception as e:
+                    print(f"Error in on_raise callback: {e}")
+        for wid in removed:
+            if self.on_clear:
+                try:
+                    self.on_clear(wid)
+                except Exception as e:
+                    print(f"Error in on_clear callback: {e}")
+        if self.on_update:
+            diff = {
+                'added': added,
+                'removed': list(removed),
+                'changed': changed,
+                'active': [dict(w) for w in self.active_warnings.values()],
+            }
+            try:
+                self.on_update(diff)
+            except Exception as e:
+                print(f"Error in on_update callback: {e}")
+
+    def _mark_changed(self, wid, warning):
+        if wid not in self._added:
+            self._changed[wid] = warning
+
+    # _raise_warning, _clear_warning and _acknowledge run inside a transaction
 
     def _raise_warning(self, wid, message, severity="critical"):
-        if wid in self.active_warnings:
-            self.active_warnings[wid]['last_seen'] = time.time()
+        active = self.active_warnings.get(wid)
+        if active is not None:
+            active['last_seen'] = self.clock.time()
+            # a new reading in the text alone is not worth an update; it is
+            # picked up by the next diff's active list
+            active['message'] = message
+            if active['severity'] != severity:
+                active['severity'] = severity
+                self._mark_changed(wid, active)
             return
 
         warning = {
             'id': wid,
             'message': message,
             'severity': severity,
-            'timestamp': time.time(),
+            'timestamp': self.clock.time(),
             'acknowledged': False,
+            # the suit whose samples raise and clear it
+            'suit_id': self._frame.get('suit_id') if self._frame is not None else None,
         }
+        precursors = [p for p in self.ESCALATIONS.get(wid, ()) if p in self.active_warnings]
         self.active_warnings[wid] = warning
-        if self.on_raise:
-            try:
-                self.on_raise(warning)
-            except Exception as e:
-                print(f"Error in on_raise callback: {e}")
-        if self.on_update:
-            try:
-                self.on_update()
-            except Exception as e:
-                print(f"Error in on_update callback: {e}")
+        self._log_event('raise', warning)
+        if precursors:
+            self._log_event('escalate', warning, {'from': precursors})
+        if self._removed.pop(wid, None) is not None:
+            # cleared and raised again within one transaction
+            self._changed[wid] = warning
+        else:
+            self._added[wid] = warning
 
     def _clear_warning(self, wid):
         if wid in self.active_warnings:
-            del self.active_warnings[wid]
-            if self.on_clear:
-                try:
-                    self.on_clear(wid)
-                except Exception as e:
-                    print(f"Error in on_clear callback: {e}")
-            if self.on_update:
-                try:
-                    self.on_update()
-                except Exception as e:
-                    print(f"Error in on_update callback: {e}")
+            warning = self.active_warnings.pop(wid)
+            self._log_event('clear', warning)
+            self._changed.pop(wid, None)
+            if self._added.pop(wid, None) is None:
+                self._removed[wid] = warning
 
     def acknowledge(self, wid):
+        with self.transaction():
+            self._acknowledge(wid)
+
+    def _acknowledge(self, wid):
         if wid in self.active_warnings:
-            self.active_warnings[wid]['acknowledged'] = True
-            if self.on_update:
-                try:
-                    self.on_update()
-                except Exception as e:
-                    print(f"Error in on_update callback: {e}")
+            warning = self.active_warnings[wid]
+            if warning['acknowledged']:
+                return
+            self._log_event('ack', warning, from_frame=False)
+            warning['acknowledged'] = True
+            self._mark_changed(wid, warning)
+
+    def set_mission_time_remaining(self, seconds):
+        self._mission_remaining = None if seconds is None or seconds < 0 else float(seconds)
+        self._mission_remaining_at = self.clock.monotonic()
+
+    def mission_time_remaining(self):
+        if self._mission_remaining is None:
+            return None
+        return max(0.0, self._mission_remaining - (self.clock.monotonic() - self._mission_remaining_at))
+
+    def get_forecasts(self):
+        return list(self.latest_forecasts.values())
 
     def get_active_warnings(self):
         return list(self.active_warnings.values())
 
+    @tracer.traced("WarningEngine.process")
     def process(self, data):
+        # transaction() inlined: this runs for every sample
+        with self.lock:
+            self._depth += 1
+            self._frame = data
+            try:
+                self._process(data)
+            finally:
+                self._frame = None
+                self._depth -= 1
+                if not self._depth:
+                    self._commit()
+
+    @staticmethod
+    def suit_warning_id(base, suit_id):
+        """Id of a per-suit warning, e.g. forecast_o2:<suit>."""
+        return base if suit_id is None else f"{base}:{suit_id}"
+
+    def signal_warning_id(self, suit_id):
+        return self.suit_warning_id(self.SIGNAL_LOST, suit_id)
+
+    def signal_seen(self, suit_id):
+        """Re-arm `suit_id`'s loss-of-signal deadline; call for every received
+        sample, including ones that skip `process`. Clears a signal_lost
+        warning for the suit."""
+        if self.watchdog is None:
+            return
+        with self.transaction():
+            self.watchdog.schedule(suit_id, self.signal_timeout)
+            wid = self.signal_warning_id(suit_id)
+            if wid in self.active_warnings:
+                self._clear_warning(wid)
+
+    def forget_suit(self, suit_id):
+        """Stop watching a suit that left on purpose."""
+        if self.watchdog is None:
+            return
+        with self.transaction():
+            self.watchdog.cancel(suit_id)
+            wid = self.signal_warning_id(suit_id)
+            if wid in self.active_warnings:
+                self._clear_warning(wid)
+
+    def check_signal(self, now=None):
+        """Advance the watchdog and raise signal_lost for suits past their
+        deadline. Returns the suit ids that expired."""
+        if self.watchdog is None:
+            return []
+        with self.transaction():
+            lost = [suit_id for suit_id, _ in self.watchdog.advance(now)]
+            for suit_id in lost:
+                self._frame = {'suit_id': suit_id}
+                try:
+                    self._raise_warning(self.signal_warning_id(suit_id),
+                                        f"SIGNAL LOST ({suit_id})" if suit_id is not None else "SIGNAL LOST",
+                                        'critical')
+                finally:
+                    self._frame = None
+            return lost
+
+    def _process(self, data):
         warnings = {}
         o2 = data.get('o2')
         battery = data.get('battery')
         co2 = data.get('co2')
         leak = data.get('leak')
         temp = data.get('suit_temp')
+        suit_id = data.get('suit_id')
         
         if o2 is not None and o2 < self.thresholds['o2_low']:
             warnings['low_o2'] = (f"LOW O2 ({o2}%)", 'critical')
@@ -93,6 +311,27 @@ class WarningEngine:
             elif temp > self.thresholds['suit_temp_high']:
                 warnings['temp_high'] = (f"TEMP HIGH ({temp}°C)", 'warning')
         
+        # faults and sudden jumps that stay inside the fixed thresholds
+        for channel, message in self.anomalies.update(data).items():
+            warnings[self.suit_warning_id(f'anomaly_{channel}', suit_id)] = (message, 'warning')
+
+        forecast = self.forecaster.update(data)
+        self.latest_forecasts[forecast['suit_id']] = forecast
+        remaining = self.mission_time_remaining()
+        if remaining is not None:
+            # warn while there is still time to act: the consumable runs out
+            # before the mission is scheduled to end
+            for channel, label in self.FORECAST_LABELS.items():
+                eta = forecast.get(channel)
+                if eta is not None and 0 < eta < remaining:
+                    warnings[self.suit_warning_id(f'forecast_{channel}', suit_id)] = (
+                        f"{label} LIMIT IN {_format_duration(eta)} ({_format_duration(remaining)} MISSION LEFT)", 'warning')
+        if self.on_forecast:
+            try:
+                self.on_forecast(forecast)
+            except Exception as e:
+                print(f"Error in on_forecast callback: {e}")
+
         # Consolidate leak + low O2
         if 'suit_leak' in warnings and 'low_o2' in warnings:
             warnings['atm_loss'] = ("ATMOSPHERE LOSS", 'critical')
@@ -102,6 +341,8 @@ class WarningEngine:
         for wid, (msg, sev) in warnings.items():
             self._raise_warning(wid, msg, sev)
         
-        for wid in list(self.active_warnings.keys()):
-            if wid not in warnings:
+        for wid, warning in list(self.active_warnings.items()):
+            # only this suit's samples clear its warnings; signal_lost
+            # belongs to the watchdog
+            if wid not in warnings and warning.get('suit_id') == suit_id and not wid.startswith(self.SIGNAL_LOST):
                 self._clear_warning(wid)
@@ -0,0 +1,116 @@
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .producer import WarningEngine
+
+
+class AdaptivePublishPolicy:
+    """Report-by-exception publish decision for telemetry producers.
+
+    A sample is published when any channel moved by more than its deadband
+    since the last published sample, when a boolean channel (leak) flips,
+    or when nothing has been sent for `heartbeat` seconds. Near a
+    `WarningEngine` threshold the policy gets more eager: within `margins`
+    of it the deadband shrinks and the heartbeat falls towards
+    `min_interval`, and past the threshold every sample is sent.
+
+    Call `should_publish` once per sampled payload; `stats()` reports the
+    achieved reduction against publishing every sample.
+    """
+
+    DEADBANDS = {"o2": 0.25, "co2": 0.05, "battery": 0.5, "suit_temp": 0.5, "external_temp": 2.0}
+    # distance from a threshold at which the rate starts to rise
+    MARGINS = {"o2": 5.0, "battery": 10.0, "co2": 0.5, "suit_temp": 5.0}
+
+    def __init__(self, heartbeat: float = 10.0, min_interval: float = 0.25,
+                 deadbands: Optional[Dict[str, float]] = None, margins: Optional[Dict[str, float]] = None,
+                 thresholds: Optional[Dict[str, float]] = None, clock=time.monotonic):
+        self.heartbeat = heartbeat
+        self.min_interval = min_interval
+        self.deadbands = {**self.DEADBANDS, **(deadbands or {})}
+        self.margins = {**self.MARGINS, **(margins or {})}
+        self.thresholds = {**WarningEngine.THRESHOLDS, **(thresholds or {})}
+        self._clock = clock
+        self._last: Optional[Dict[str, Any]] = None
+        self._last_at = 0.0
+        self.samples = 0
+        self.published = 0
+        self.reasons = {"first": 0, "change": 0, "heartbeat": 0, "urgent": 0}
+        self.bytes_sampled = 0
+        self.bytes_published = 0
+
+    def urgency(self, payload: Dict[str, Any]) -> float:
+        """0.0 when every channel is far from its thresholds, 1.0 at or past one."""
+        worst = 0.0
+        for channel, limits in WarningEngine.THRESHOLD_CHANNELS.items():
+            value = payload.get(channel)
+            if value is None:
+                continue
+            margin = self.margins.get(channel)
+            for key, direction in limits:
+                limit = self.thresholds.get(key)
+                if limit is None:
+                    continue
+                distance = (value - limit) * -direction
+                if distance <= 0:
+                    return 1.0
+                if margin:
+                    worst = max(worst, 1.0 - distance / margin)
+        return worst
+
+    def should_publish(self, payload: Dict[str, Any], now: Optional[float] = None) -> Tuple[bool, Optional[str]]:
+        """Decide for one sample; returns (publish, reason)."""
+        now = self._clock() if now is None else now
+        size = len(json.dumps(payload, separators=(",", ":")))
+        self.samples += 1
+        self.bytes_sampled += size
+
+        reason = None
+        if self._last is None:
+            reason = "first"
+        else:
+            urgency = self.urgency(payload)
+            elapsed = now - self._last_at
+            heartbeat = self.heartbeat - (self.heartbeat - self.min_interval) * urgency
+            if urgency >= 1.0 and elapsed >= self.min_interval:
+                reason = "urgent"
+            elif self._changed(payload, 1.0 - urgency):
+                reason = "change"
+            elif elapsed >= heartbeat:
+                reason = "heartbeat"
+        if reason is None:
+            return False, None
+
+        self._last = dict(payload)
+        self._last_at = now
+        self.published += 1
+        self.bytes_published += size
+        self.reasons[reason] += 1
+        return True, reason
+
+    def _changed(self, payload: Dict[str, Any], scale: float) -> bool:
+        last = self._last
+        for key, value in payload.items():
+            if key in ("timestamp", "suit_id"):
+                continue
+            previous = last.get(key)
+            if isinstance(value, bool) or value is None or previous is None:
+                if value != previous:
+                    return True
+                continue
+            deadband = self.deadbands.get(key, 0.0) * scale
+            if abs(value - previous) > deadband:
+                return True
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "published": self.published,
+            "suppressed": self.samples - self.published,
+            "reduction": 1.0 - self.published / self.samples if self.samples else 0.0,
+            "bytes_sampled": self.bytes_sampled,
+            "bytes_published": self.bytes_published,
+            "reasons": dict(self.reasons),
+        }
@@ -0,0 +1,189 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class _Bucket:
+    __slots__ = ("start", "count", "total", "min", "max")
+
+    def __init__(self, start: float):
+        self.start = start
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "_Bucket"):
+        self.count += other.count
+        self.total += other.total
+        if other.min < self.min:
+            self.min = other.min
+        if other.max > self.max:
+            self.max = other.max
+
+    def copy(self) -> "_Bucket":
+        b = _Bucket(self.start)
+        b.merge(self)
+        return b
+
+    def as_point(self) -> Dict[str, Any]:
+        return {"t": self.start, "min": self.min, "max": self.max,
+                "mean": self.total / self.count, "count": self.count}
+
+
+class _Tier:
+    __slots__ = ("resolution", "closed", "current")
+
+    def __init__(self, resolution: float, retention: float):
+        self.resolution = resolution
+        # closed buckets, oldest first; maxlen enforces the retention
+        self.closed = deque(maxlen=max(1, int(math.ceil(retention / resolution))))
+        self.current: Optional[_Bucket] = None
+
+
+class _Series:
+    """Cascading tiers for one (suit, channel): raw samples only touch the
+    finest tier; a bucket is merged into the next tier when it closes."""
+
+    __slots__ = ("tiers",)
+
+    def __init__(self, tiers: Sequence[Tuple[float, float]]):
+        self.tiers = [_Tier(res, ret) for res, ret in tiers]
+
+    def add(self, ts: float, value: float):
+        tier = self.tiers[0]
+        start = ts - ts % tier.resolution
+        current = tier.current
+        # a late sample for an already closed bucket is folded into the open one
+        if current is None or start > current.start:
+            if current is not None:
+                self._close(0, current)
+            current = tier.current = _Bucket(start)
+        current.add(value)
+
+    def _close(self, level: int, bucket: _Bucket):
+        self.tiers[level].closed.append(bucket)
+        if level + 1 >= len(self.tiers):
+            return
+        parent = self.tiers[level + 1]
+        start = bucket.start - bucket.start % parent.resolution
+        current = parent.current
+        if current is None or start > current.start:
+            if current is not None:
+                self._close(level + 1, current)
+            current = parent.current = _Bucket(start)
+        current.merge(bucket)
+
+    def open_buckets(self, level: int) -> List[_Bucket]:
+        """The tier's not yet closed data as buckets of its resolution, oldest first.
+
+        Besides the tier's own open bucket this merges the open buckets of
+        the finer tiers, which have not cascaded yet: before a coarse tier's
+        first cascade they hold all of its data, and after a period boundary
+        they may already start the next bucket.
+        """
+        resolution = self.tiers[level].resolution
+        merged: Dict[float, _Bucket] = {}
+        for tier in self.tiers[:level + 1]:
+            b = tier.current
+            if b is None:
+                continue
+            start = b.start - b.start % resolution
+            bucket = merged.get(start)
+            if bucket is None:
+                bucket = merged[start] = _Bucket(start)
+            bucket.merge(b)
+        return [merged[start] for start in sorted(merged)]
+
+
+class TelemetryRollups:
+    """Incrementally maintained min/max/mean/count rollups per suit and channel.
+
+    Every sample costs O(1): it lands in the open bucket of the finest
+    tier, and closed buckets cascade into the next coarser tier. Each tier
+    keeps its own retention. `query` picks, for a time window, the finest
+    tier that retains the whole window and returns at most `max_points`
+    buckets (the coarsest tier if none does).
+    """
+
+    # (resolution seconds, retention seconds)
+    TIERS = ((1.0, 3600.0), (10.0, 6 * 3600.0), (60.0, 24 * 3600.0), (600.0, 7 * 24 * 3600.0))
+    CHANNELS = ("o2", "battery", "co2", "suit_temp", "external_temp")
+
+    def __init__(self, tiers: Optional[Sequence[Tuple[float, float]]] = None,
+                 channels: Optional[Sequence[str]] = None):
+        tiers = tuple(tiers or self.TIERS)
+        for (finer, _), (coarser, _) in zip(tiers, tiers[1:]):
+            if coarser % finer:
+                raise ValueError("each tier's resolution must be a multiple of the previous one")
+        self.tiers = tiers
+        self.channels = tuple(channels or self.CHANNELS)
+        self._series: Dict[Tuple[Optional[str], str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        """Fold one validated `Telemetry` sample into every channel's series."""
+        ts = record.timestamp
+        if ts is None:
+            return
+        suit_id = record.suit_id
+        with self._lock:
+            for channel in self.channels:
+                value = getattr(record, channel)
+                if value is None:
+                    continue
+                series = self._series.get((suit_id, channel))
+                if series is None:
+                    series = self._series[(suit_id, channel)] = _Series(self.tiers)
+                series.add(ts, float(value))
+
+    def suits(self) -> List[Optional[str]]:
+        with self._lock:
+            return sorted({suit for suit, _ in self._series}, key=lambda s: (s is None, s or ""))
+
+    def pick_tier(self, span: float, max_points: int) -> int:
+        for level, (resolution, retention) in enumerate(self.tiers):
+            # a tier that does not keep the whole span would cut the window short
+            if retention < span:
+                continue
+            # an unaligned window touches one extra, partial bucket
+            if math.ceil(span / resolution) + 1 <= max_points:
+                return level
+        return len(self.tiers) - 1
+
+    def query(self, channel: str, start: Optional[float] = None, end: Optional[float] = None,
+              max_points: int = 500, suit_id: Optional[str] = None) -> Dict[str, Any]:
+        """Buckets for `channel` in [start, end) from the best fitting tier.
+
+        Defaults to the last hour up to now. Returns
+        {"channel", "suit_id", "resolution", "points": [{t, min, max, mean, count}]}.
+        """
+        end = time.time() if end is None else end
+        start = end - 3600.0 if start is None else start
+        level = self.pick_tier(max(0.0, end - start), max(1, int(max_points)))
+        resolution = self.tiers[level][0]
+        points = []
+        with self._lock:
+            series = self._series.get((suit_id, channel))
+            if series is not None:
+                # walk back from the newest bucket; deques are time ordered
+                for bucket in reversed(series.tiers[level].closed):
+                    if bucket.start + resolution <= start:
+                        break
+                    if bucket.start < end:
+                        points.append(bucket.as_point())
+                points.reverse()
+                for current in series.open_buckets(level):
+                    if current.start < end and current.start + resolution > start:
+                        points.append(current.as_point())
+        return {"channel": channel, "suit_id": suit_id, "resolution": resolution, "points": points}
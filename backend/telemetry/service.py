@@ -0,0 +1,302 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+from backend.common.clock import SYSTEM_CLOCK
+from backend.common.event_bus import DROP_OLDEST, EventBus
+from backend.common.events import Signal
+from backend.common.topics import TRICORDER_FORECAST, TRICORDER_TELEMETRY_FRAMES
+from backend.common.tracing import tracer
+from .deadband import CHANNELS, DeadbandFilter
+from .event_log import WarningEventLog
+from .frames import FrameError, decode_frame, json_size
+from .models import Telemetry, TelemetryError
+from .producer import WarningEngine
+from .rollups import TelemetryRollups
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EVENT_LOG = str(Path(__file__).resolve().parent / "warning_events.db")
+
+# event bus topics
+BUS_INGEST = "telemetry/ingest"      # (mqtt topic, decoded payload) from the network thread
+BUS_SAMPLE = "telemetry/sample"      # (Telemetry) accepted and past the deadband
+BUS_RAISED = "warning/raised"        # (warning dict)
+BUS_CLEARED = "warning/cleared"      # (warning id)
+BUS_UPDATED = "warning/updated"      # (diff dict) once per change of the active set
+
+
+class TelemetryService:
+    """Telemetry ingest and warning evaluation without any Qt dependency.
+
+    Owns the MQTT consumer, the event `bus`, deadband filter, rollups,
+    `WarningEngine` and warning event log, and reports through plain
+    `Signal`s; the Qt `TricorderBackend`, the headless server and the engine
+    worker all sit on top of it. `lock` serialises ingest against calls
+    from other threads, and signals are emitted while it is held.
+    """
+
+    def __init__(self, broker_host="localhost", broker_port=1883, client_id="tricorder-app",
+                 event_log_path: Optional[str] = DEFAULT_EVENT_LOG, publish_forecasts: bool = True, recorder=None,
+                 deadband=True, rollups=True, clock=None, ingest_queue: int = 4096):
+        self.broker_host = broker_host
+        self.broker_port = broker_port
+        self.client_id = client_id
+        self.publish_forecasts = publish_forecasts
+        # optional common.recorder.Recorder; accepted samples are appended to it
+        self.recorder = recorder
+        self.lock = threading.RLock()
+        self.clock = clock or SYSTEM_CLOCK
+        self.bus = EventBus()
+        self.ingest_queue = ingest_queue
+        self._ingest = None
+
+        self.telemetry = Signal("telemetry")      # (Telemetry)
+        self.raised = Signal("raised")            # (warning dict)
+        self.cleared = Signal("cleared")          # (warning id)
+        self.updated = Signal("updated")          # (diff dict, see WarningEngine)
+        self.forecast = Signal("forecast")        # (forecast dict)
+        self.processed = Signal("processed")      # () after every message, accepted or not
+
+        if deadband is True:
+            deadband = DeadbandFilter()
+        self.deadband = deadband or None
+        if rollups is True:
+            rollups = TelemetryRollups()
+        self.rollups = rollups or None
+        # (fields, callback(record, changed_fields)) registered with subscribe()
+        self._subscribers = []
+
+        # ingest counters; rejected payloads are counted per offending field
+        self.accepted_count = 0
+        self.rejected_count = 0
+        self.rejected_by_field = {}
+        self.frame_count = 0
+        self.frame_samples = 0
+        self.frame_bytes = 0
+        self.frame_json_bytes = 0
+
+        self.engine = WarningEngine(clock=self.clock)
+        self.event_log = None
+        if event_log_path:
+            try:
+                self.event_log = WarningEventLog(event_log_path, clock=self.clock)
+                self.engine.event_log = self.event_log
+            except Exception:
+                logger.exception("Failed to open warning event log; history will not be recorded")
+        self.engine.on_raise = self._on_raise
+        self.engine.on_clear = self._on_clear
+        self.engine.on_update = self._on_update
+        self.engine.on_forecast = self._on_forecast
+
+        self.mqtt = None
+        self._watchdog_thread = None
+        self._watchdog_running = False
+
+    def start(self, fast_startup: bool = False):
+        """Connect the MQTT consumer; with fast_startup the connect never blocks."""
+        from backend.common.mqtt import MQTTClient
+
+        self.start_watchdog()
+        self.mqtt = MQTTClient(self.broker_host, self.broker_port, self.client_id)
+        self.mqtt.subscribe_raw(TRICORDER_TELEMETRY_FRAMES)
+        if self.ingest_queue > 0:
+            if self._ingest is None:
+                self._ingest = self.bus.subscribe(BUS_INGEST, self._on_ingest, name="ingest",
+                                                  maxsize=self.ingest_queue, overflow=DROP_OLDEST)
+            self.mqtt.on_message_callback = self.enqueue_message
+        else:
+            self.mqtt.on_message_callback = self.handle_message
+        if fast_startup:
+            # paho retries the first connect in its own loop thread
+            self.mqtt.connect_async()
+        elif self.mqtt.connect():
+            try:
+                self.mqtt.loop_start()
+            except Exception:
+                pass
+
+    def start_watchdog(self):
+        if self.engine.watchdog is None or self._watchdog_thread is not None:
+            return
+        self._watchdog_running = True
+        self._watchdog_thread = threading.Thread(target=self._watchdog_loop, name="signal-watchdog", daemon=True)
+        self._watchdog_thread.start()
+
+    def _watchdog_loop(self):
+        while self._watchdog_running:
+            self.clock.sleep(self.engine.watchdog.tick)
+            try:
+                with self.lock:
+                    self.engine.check_signal()
+            except Exception:
+                logger.exception("Error checking for lost telemetry signal")
+
+    def _on_raise(self, warning: dict):
+        self.raised.emit(warning)
+        self.bus.publish(BUS_RAISED, warning)
+
+    def _on_clear(self, wid: str):
+        self.cleared.emit(wid)
+        self.bus.publish(BUS_CLEARED, wid)
+
+    def _on_update(self, diff: dict):
+        self.updated.emit(diff)
+        self.bus.publish(BUS_UPDATED, diff)
+
+    def _on_forecast(self, forecast: dict):
+        self.forecast.emit(forecast)
+        try:
+            if self.publish_forecasts and self.mqtt is not None and self.mqtt.is_connected():
+                self.mqtt.publish(TRICORDER_FORECAST, forecast)
+        except Exception:
+            logger.exception("Error publishing forecast")
+
+    def enqueue_message(self, topic, payload):
+        """Queue a received message for the ingest worker; safe on any thread."""
+        self.bus.publish(BUS_INGEST, (topic, payload))
+
+    def _on_ingest(self, _bus_topic, message):
+        self.handle_message(*message)
+
+    def handle_message(self, topic, payload):
+        if topic == TRICORDER_TELEMETRY_FRAMES:
+            self.handle_frame(payload)
+            return
+        logger.debug("Telemetry: %s", payload)
+        with self.lock:
+            self._ingest_sample(payload)
+            self.processed.emit()
+
+    def handle_frame(self, data: bytes):
+        """Ingest every sample of a batched frame, oldest first."""
+        try:
+            with tracer.span("telemetry.decode_frame"):
+                samples = decode_frame(data)
+        except (FrameError, UnicodeDecodeError) as e:
+            with self.lock:
+                self.rejected_count += 1
+                self.rejected_by_field["frame"] = self.rejected_by_field.get("frame", 0) + 1
+                logger.warning("Rejected telemetry frame (%d so far): %s", self.rejected_count, e)
+                self.processed.emit()
+            return
+        json_bytes = json_size(samples)
+        with self.lock:
+            self.frame_count += 1
+            self.frame_samples += len(samples)
+            self.frame_bytes += len(data)
+            self.frame_json_bytes += json_bytes
+            with self.engine.transaction():
+                for payload in samples:
+                    self._ingest_sample(payload)
+            self.processed.emit()
+
+    def _ingest_sample(self, payload):
+        # called with the lock held
+        try:
+            with tracer.span("telemetry.validate"):
+                record = Telemetry.from_payload(payload)
+        except TelemetryError as e:
+            self.rejected_count += 1
+            self.rejected_by_field[e.field] = self.rejected_by_field.get(e.field, 0) + 1
+            logger.warning("Rejected telemetry (%d so far): %s", self.rejected_count, e)
+            return
+        self.accepted_count += 1
+        self.engine.signal_seen(record.suit_id)
+        if self.rollups is not None:
+            self.rollups.add(record)
+        changed = self.deadband.update(record) if self.deadband is not None else CHANNELS
+        if not changed:
+            return
+        if self.recorder is not None:
+            self.recorder.record_telemetry(record)
+        self.telemetry.emit(record)
+        self.bus.publish(BUS_SAMPLE, record)
+        for fields, callback in self._subscribers:
+            if changed & fields:
+                try:
+                    callback(record, changed)
+                except Exception:
+                    logger.exception("Error in telemetry subscriber %r", callback)
+        if changed & WarningEngine.INPUT_FIELDS:
+            try:
+                self.engine.process(record)
+            except Exception:
+                logger.exception("Error processing telemetry payload")
+
+    def subscribe(self, fields, callback):
+        """Call `callback(record, changed)` for samples changing any of `fields`."""
+        self._subscribers = self._subscribers + [(frozenset(fields), callback)]
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(f, cb) for f, cb in self._subscribers if cb != callback]
+
+    def acknowledge(self, wid):
+        with self.lock:
+            self.engine.acknowledge(wid)
+
+    def set_mission_time_remaining(self, seconds):
+        # negative or None means no mission is running
+        with self.lock:
+            self.engine.set_mission_time_remaining(seconds)
+
+    def get_active_warnings(self):
+        return self.engine.get_active_warnings()
+
+    def get_forecasts(self):
+        return self.engine.get_forecasts()
+
+    def ingest_stats(self) -> dict:
+        stats = {
+            "accepted": self.accepted_count,
+            "rejected": self.rejected_count,
+            "rejected_by_field": dict(self.rejected_by_field),
+        }
+        if self.deadband is not None:
+            stats["deadband"] = self.deadband.stats()
+        if self.frame_count:
+            stats["frames"] = {
+                "frames": self.frame_count,
+                "samples": self.frame_samples,
+                "frame_bytes": self.frame_bytes,
+                "json_bytes": self.frame_json_bytes,
+                "ratio": round(self.frame_json_bytes / self.frame_bytes, 2) if self.frame_bytes else None,
+            }
+        stats["bus"] = self.bus.stats()
+        return stats
+
+    def trend(self, channel: str, seconds: float = 3600.0, max_points: int = 500,
+               suit_id: Optional[str] = None, end: Optional[float] = None) -> dict:
+        """Min/max/mean buckets for the last `seconds` of `channel`.
+
+        Without a `suit_id` the first suit seen is used, which is the only
+        one in a single-suit setup.
+        """
+        if self.rollups is None:
+            return {"channel": channel, "suit_id": suit_id, "resolution": None, "points": []}
+        if suit_id is None:
+            suits = self.rollups.suits()
+            suit_id = suits[0] if suits else None
+        end = self.clock.time() if end is None else end
+        return self.rollups.query(channel, end - seconds, end, max_points=max_points, suit_id=suit_id)
+
+    def warning_history(self, hours: float, severity: Optional[str] = None):
+        if self.event_log is None:
+            return []
+        return self.event_log.recent(hours * 3600.0, severity=severity or None)
+
+    def shutdown(self):
+        self._watchdog_running = False
+        try:
+            if self.mqtt is not None:
+                self.mqtt.disconnect()
+        except Exception:
+            logger.exception("Error disconnecting telemetry MQTT client")
+        # let the ingest worker drain what the network thread queued
+        self.bus.close()
+        try:
+            if self.event_log is not None:
+                self.event_log.close()
+        except Exception:
+            logger.exception("Error closing warning event log")
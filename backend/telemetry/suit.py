@@ -1,118 +1,235 @@
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
 from pathlib import Path
-from .helpers import _make_beep, logger
+from .helpers import logger
+from .tones import ToneBank
 
-try:
-    from backend.common.mqtt import MQTTClient
-except ImportError:
-    try:
-        from backend.mqtt import MQTTClient
-    except ImportError:
-        from mqtt import MQTTClient
-
-from .producer import WarningEngine
+from backend.common.clock import SYSTEM_CLOCK
+from backend.common.tracing import tracer
+from .deadband import CHANNELS
+from .event_log import WarningEventLog
+from .rollups import TelemetryRollups
+from .service import DEFAULT_EVENT_LOG, TelemetryService
+from .worker import TelemetryWorker
 
 
 class TricorderBackend(QObject):
+    """Qt adapter over `TelemetryService`: re-emits its callbacks as Qt signals
+    and exposes its queries as slots for QML."""
 
     telemetryUpdated = Signal(dict)
+    # same sample plus the channels that left their deadband, so views can
+    # skip updates for fields they do not show
+    telemetryChanged = Signal(dict, list)
     warningIssued = Signal(str)
     warningRaised = Signal(dict)
     warningCleared = Signal(str)
-    activeWarningsUpdated = Signal()
+    # one per change of the active set: {added, removed, changed, active}
+    activeWarningsUpdated = Signal(dict)
+    forecastUpdated = Signal(dict)
+
+    # how often the UI reads the worker's shared memory in engine-process mode
+    WORKER_POLL_MS = 50
+    # raised locally when the worker process exits: nothing updates any more
+    WORKER_LOST = "engine_worker_lost"
 
-    def __init__(self, broker_host="localhost", broker_port=1883, client_id="tricorder-app"):
+    def __init__(self, broker_host="localhost", broker_port=1883, client_id="tricorder-app", fast_startup=False, engine_process=False, recorder=None):
         super().__init__()
 
-        # Create alert sound
+        # Alert tones are synthesized on first request and cached in assets/
         backend_dir = Path(__file__).resolve().parents[1]
-        assets_dir = backend_dir / "assets"
-        assets_dir.mkdir(parents=True, exist_ok=True)
-        self._alert_sound = assets_dir / "warning.wav"
-        if not self._alert_sound.exists():
+        self.tones = ToneBank(backend_dir / "assets")
+
+        # Out-of-process mode: ingest and the warning engine run in a worker
+        # process; this object only mirrors its shared-memory state, rolls up
+        # the mirrored samples for trends and reads the worker's event log
+        self.service = None
+        self.engine = None
+        self.event_log = None
+        self.rollups = None
+        self._worker = None
+        self._remote_state = None
+        self._history = None
+        if engine_process:
             try:
-                _make_beep(self._alert_sound)
+                self._worker = TelemetryWorker(broker_host, broker_port, client_id,
+                                               record_path=recorder.path if recorder is not None else None)
+                self._worker.start()
+                self._poll_timer = QTimer(self)
+                self._poll_timer.setInterval(self.WORKER_POLL_MS)
+                self._poll_timer.timeout.connect(self._poll_worker)
+                self._poll_timer.start()
+                self._remote_state = {"warnings": [], "forecasts": [], "stats": {}}
+                self.rollups = TelemetryRollups()
+                return
             except Exception:
-                # _make_beep already logged; continue without crashing the UI
-                pass
+                logger.exception("Failed to start telemetry worker; ingesting in-process")
+                self._worker = None
+
+        self.service = TelemetryService(broker_host, broker_port, client_id, recorder=recorder)
+        self.engine = self.service.engine
+        self.event_log = self.service.event_log
+        self.rollups = self.service.rollups
+        self.service.telemetry.connect(self._on_telemetry)
+        self.service.subscribe(CHANNELS, self._on_changed)
+        self.service.raised.connect(self._on_raise)
+        self.service.cleared.connect(self.warningCleared.emit)
+        self.service.updated.connect(self.activeWarningsUpdated.emit)
+        self.service.forecast.connect(self.forecastUpdated.emit)
+        self.service.start(fast_startup=fast_startup)
+
+    @property
+    def mqtt(self):
+        return self.service.mqtt if self.service is not None else None
+
+    def _on_telemetry(self, record):
+        with tracer.span("qt.emit", signal="telemetryUpdated"):
+            self.telemetryUpdated.emit(record.as_dict())
+
+    def _on_changed(self, record, changed):
+        self.telemetryChanged.emit(record.as_dict(), sorted(changed))
+
+    def _on_raise(self, info: dict):
+        # short string for simple UI handlers, structured warning for the rest
+        self.warningIssued.emit(info.get('message', ''))
+        self.warningRaised.emit(info)
 
-        # Warning engine
-        self.engine = WarningEngine()
-        # use explicit methods instead of lambdas for clarity
-        def _on_raise(info: dict):
-            try:
-                # Emit a short string for simple UI handlers
-                self.warningIssued.emit(info.get('message', ''))
-            except Exception:
-                logger.exception("Error emitting warningIssued")
-            try:
-                # Emit structured warning for other consumers
-                self.warningRaised.emit(info)
-            except Exception:
-                logger.exception("Error emitting warningRaised")
+    def _on_message(self, topic, payload):
+        if self.service is not None:
+            self.service.handle_message(topic, payload)
 
-        def _on_clear(wid: str):
-            try:
-                self.warningCleared.emit(wid)
-            except Exception:
-                logger.exception("Error emitting warningCleared")
+    def _poll_worker(self):
+        try:
+            records = self._worker.read_new()
+            for record in records:
+                self.rollups.add(record)
+            if records:
+                # the UI only needs the newest sample of each poll
+                self.telemetryUpdated.emit(records[-1].as_dict())
+            state = self._worker.read_state()
+            if state is not None:
+                self._apply_remote_state(state)
+            if not self._worker.is_alive():
+                self._on_worker_exit()
+        except Exception:
+            logger.exception("Error polling telemetry worker")
+
+    def _on_worker_exit(self):
+        self._poll_timer.stop()
+        code = self._worker.exit_code
+        logger.error("Telemetry worker exited with code %s; telemetry and warnings are no longer updated", code)
+        lost = {"id": self.WORKER_LOST, "message": f"TELEMETRY ENGINE STOPPED (exit code {code})",
+                "severity": "critical", "timestamp": SYSTEM_CLOCK.time(), "acknowledged": False, "suit_id": None}
+        self._apply_remote_state({**self._remote_state,
+                                  "warnings": self._remote_state.get("warnings", []) + [lost]})
+
+    def _apply_remote_state(self, state: dict):
+        previous = {w['id']: w for w in self._remote_state.get("warnings", [])}
+        current = {w['id']: w for w in state.get("warnings", [])}
+        old_forecasts = {f.get('suit_id'): f.get('timestamp') for f in self._remote_state.get("forecasts", [])}
+        self._remote_state = state
+        if previous == current:
+            added = removed = None
+        else:
+            added = [w for wid, w in current.items() if wid not in previous]
+            removed = [wid for wid in previous if wid not in current]
+        for warning in added or ():
+            self.warningIssued.emit(warning.get('message', ''))
+            self.warningRaised.emit(warning)
+        for wid in removed or ():
+            self.warningCleared.emit(wid)
+        if added is not None:
+            changed = [w for wid, w in current.items() if wid in previous and previous[wid] != w]
+            self.activeWarningsUpdated.emit({"added": added, "removed": removed, "changed": changed,
+                                             "active": list(current.values())})
+        for forecast in state.get("forecasts", []):
+            if old_forecasts.get(forecast.get('suit_id')) != forecast.get('timestamp'):
+                self.forecastUpdated.emit(forecast)
 
-        def _on_update():
-            try:
-                self.activeWarningsUpdated.emit()
-            except Exception:
-                logger.exception("Error emitting activeWarningsUpdated")
+    @Slot(str)
+    def acknowledgeWarning(self, wid):
+        if self._worker is not None:
+            if wid == self.WORKER_LOST:
+                warnings = [{**w, "acknowledged": True} if w["id"] == wid else w
+                            for w in self._remote_state.get("warnings", [])]
+                self._apply_remote_state({**self._remote_state, "warnings": warnings})
+            else:
+                self._worker.acknowledge(wid)
+            return
+        self.service.acknowledge(wid)
 
-        self.engine.on_raise = _on_raise
-        self.engine.on_clear = _on_clear
-        self.engine.on_update = _on_update
+    @Slot(result='QVariant')
+    def getActiveWarnings(self):
+        if self._worker is not None:
+            return self._remote_state.get("warnings", [])
+        return self.service.get_active_warnings()
 
-        # MQTT connection
-        self.mqtt = MQTTClient(broker_host, broker_port, client_id)
-        try:
-            # wrapper exposes set_on_message_callback; fallback to attribute if direct client
-            if hasattr(self.mqtt, 'set_on_message_callback'):
-                self.mqtt.set_on_message_callback(self._on_message)
-            else:
-                self.mqtt.on_message_callback = self._on_message
-        except Exception:
-            try:
-                self.mqtt.on_message_callback = self._on_message
-            except Exception:
-                pass
-        if hasattr(self.mqtt, 'connect') and self.mqtt.connect():
-            try:
-                self.mqtt.loop_start()
-            except Exception:
-                pass
-    
+    @Slot(result='QVariant')
+    def getIngestStats(self):
+        if self._worker is not None:
+            return {**self._remote_state.get("stats", {}), "lost": self._worker.lost}
+        return self.service.ingest_stats()
 
-    def _on_message(self, topic, payload):
-        logger.debug("Telemetry: %s", payload)
+    @Slot(float, str, result='QVariant')
+    def getWarningHistory(self, hours, severity=""):
         try:
-            self.telemetryUpdated.emit(payload)
+            if self._worker is not None:
+                # the worker owns the log; open it read-only once it exists
+                if self._history is None:
+                    self._history = WarningEventLog(DEFAULT_EVENT_LOG, readonly=True)
+                return self._history.recent(hours * 3600.0, severity=severity or None)
+            return self.service.warning_history(hours, severity or None)
         except Exception:
-            logger.exception("Error emitting telemetryUpdated")
+            logger.exception("Error querying warning history")
+            return []
+
+    @Slot(str, float, int, str, result='QVariant')
+    def getTrend(self, channel, seconds, maxPoints=500, suitId=""):
+        """Rolled-up {resolution, points: [{t, min, max, mean, count}]} for a trend view."""
         try:
-            self.engine.process(payload)
+            if self._worker is not None:
+                suits = self.rollups.suits()
+                end = SYSTEM_CLOCK.time()
+                return self.rollups.query(channel, end - seconds, end, max_points=maxPoints,
+                                          suit_id=suitId or (suits[0] if suits else None))
+            return self.service.trend(channel, seconds, maxPoints, suitId or None)
         except Exception:
-            logger.exception("Error processing telemetry payload")
-
-    @Slot(str)
-    def acknowledgeWarning(self, wid):
-        self.engine.acknowledge(wid)
+            logger.exception("Error querying %s trend", channel)
+            return {"channel": channel, "resolution": None, "points": []}
 
     @Slot(result='QVariant')
-    def getActiveWarnings(self):
-        return self.engine.get_active_warnings()
+    def getForecasts(self):
+        if self._worker is not None:
+            return self._remote_state.get("forecasts", [])
+        return self.service.get_forecasts()
+
+    @Slot(float)
+    def setMissionTimeRemaining(self, seconds):
+        # negative means no mission is running
+        if self._worker is not None:
+            self._worker.set_mission_time_remaining(seconds)
+            return
+        self.service.set_mission_time_remaining(seconds)
 
     @Slot(result=str)
     def getAlertSoundPath(self):
-        return str(self._alert_sound)
+        return self.getAlertSoundPathFor("critical")
+
+    @Slot(str, result=str)
+    def getAlertSoundPathFor(self, severity):
+        try:
+            return self.tones.path(severity)
+        except Exception:
+            logger.exception("Failed to create %s alert tone", severity)
+            return ""
 
     def shutdown(self):
         try:
-            if getattr(self, 'mqtt', None):
-                self.mqtt.disconnect()
+            if self._worker is not None:
+                self._poll_timer.stop()
+                self._worker.stop()
+            if self._history is not None:
+                self._history.close()
         except Exception:
-            logger.exception("Error during backend shutdown")
+            logger.exception("Error stopping telemetry worker")
+        if self.service is not None:
+            self.service.shutdown()
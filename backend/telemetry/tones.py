@@ -0,0 +1,83 @@
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Optional
+
+from .helpers import synthesize_tone, write_wav
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ToneSpec:
+    freq: float
+    duration: float
+    interval_ms: int
+    volume: float = 0.3
+    rate: int = 44100
+    freq2: Optional[float] = None
+    warble_hz: float = 0.0
+
+    def cache_key(self) -> str:
+        raw = repr(sorted(asdict(self).items())).encode('utf-8')
+        return hashlib.sha1(raw).hexdigest()[:12]
+
+
+class ToneBank:
+    """Per-severity alert tones, synthesized once and cached on disk.
+
+    Files are named after a hash of their parameters, so changing a tone
+    definition produces a new file instead of silently reusing a stale one.
+    """
+
+    # highest priority first; the scheduler plays the first one present
+    PRIORITY = ("atm_loss", "critical", "warning")
+
+    DEFAULT_TONES = {
+        "atm_loss": ToneSpec(freq=988, freq2=740, warble_hz=8.0, duration=0.3, interval_ms=400, volume=0.35),
+        "critical": ToneSpec(freq=880, duration=0.4, interval_ms=800),
+        "warning": ToneSpec(freq=660, duration=0.2, interval_ms=2500, volume=0.25),
+    }
+
+    def __init__(self, cache_dir, tones: Optional[Dict[str, ToneSpec]] = None):
+        self.cache_dir = str(cache_dir)
+        self.tones = {**self.DEFAULT_TONES, **(tones or {})}
+        self._paths: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def tone(self, severity: str) -> ToneSpec:
+        return self.tones.get(severity) or self.tones["critical"]
+
+    def path(self, severity: str) -> str:
+        """Return the cached WAV file for `severity`, generating it if needed."""
+        with self._lock:
+            path = self._paths.get(severity)
+            if path is not None:
+                return path
+            spec = self.tone(severity)
+            path = os.path.join(self.cache_dir, f"tone-{severity}-{spec.cache_key()}.wav")
+            if not os.path.exists(path):
+                os.makedirs(self.cache_dir, exist_ok=True)
+                pcm = synthesize_tone(spec.freq, spec.duration, spec.volume, spec.rate, spec.freq2, spec.warble_hz)
+                # write-then-rename so a concurrent reader never sees a partial file
+                tmp = f"{path}.{os.getpid()}.tmp"
+                write_wav(tmp, pcm, spec.rate)
+                os.replace(tmp, path)
+                logger.debug("Generated %s tone at %s", severity, path)
+            self._paths[severity] = path
+            return path
+
+    @staticmethod
+    def severity_of(warning: dict) -> str:
+        if warning.get('id') == 'atm_loss':
+            return "atm_loss"
+        return warning.get('severity') or "critical"
+
+    def select(self, severities: Iterable[str]) -> Optional[str]:
+        present = set(severities)
+        for severity in self.PRIORITY:
+            if severity in present:
+                return severity
+        return "critical" if present else None
@@ -0,0 +1,325 @@
+"""Out-of-process telemetry ingest and warning evaluation.
+
+The worker runs MQTT ingest, validation and `WarningEngine` in its own
+interpreter and hands results to the GUI through a shared-memory block:
+
+* a ring of fixed-size telemetry slots, each stamped with its sequence
+  number so the reader can detect slots overwritten while it was reading;
+* a state region (active warnings, forecasts and ingest counters as JSON)
+  guarded by a seqlock: the sequence is odd while a write is in progress.
+  It is rewritten when the active warnings change and once a second.
+
+The GUI side (`TelemetryWorker`) starts the worker with
+`python -m backend.telemetry.worker`, polls the block from a UI timer and
+sends commands (acknowledge, mission time) as JSON lines on its stdin.
+Closing stdin stops the worker.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import struct
+import subprocess
+import sys
+import threading
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import MAX_SUIT_ID, Telemetry, TelemetryError
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<QII")          # write_seq, capacity, state_capacity
+_HEADER_SIZE = 64
+_SEQ = struct.Struct("<Q")
+# ts, o2, co2, battery, suit_temp, external_temp, leak, suit_id length and
+# UTF-8 bytes; room for any suit_id that passes validation
+_SLOT_BODY = struct.Struct(f"<6dbxH{MAX_SUIT_ID * 4}s")
+_SLOT_SIZE = _SEQ.size + _SLOT_BODY.size
+_STATE_HEADER = struct.Struct("<QI4x")   # seq, length
+_NAN = float("nan")
+
+
+def _opt(value):
+    return _NAN if value is None else float(value)
+
+
+def _unopt(value):
+    return None if math.isnan(value) else value
+
+
+class TelemetryRing:
+    """Single-writer view over the shared-memory layout described above."""
+
+    def __init__(self, buf, capacity: int, state_capacity: int, initialize: bool = False):
+        self.buf = buf
+        self.capacity = capacity
+        self.state_capacity = state_capacity
+        self._state_offset = _HEADER_SIZE + capacity * _SLOT_SIZE
+        self._write_seq = 0
+        self._state_seq = 0
+        if initialize:
+            buf[:self.size(capacity, state_capacity)] = bytes(self.size(capacity, state_capacity))
+            _HEADER.pack_into(buf, 0, 0, capacity, state_capacity)
+
+    @staticmethod
+    def size(capacity: int, state_capacity: int) -> int:
+        return _HEADER_SIZE + capacity * _SLOT_SIZE + _STATE_HEADER.size + state_capacity
+
+    @classmethod
+    def attach(cls, buf) -> "TelemetryRing":
+        _, capacity, state_capacity = _HEADER.unpack_from(buf, 0)
+        ring = cls(buf, capacity, state_capacity)
+        ring._write_seq = _SEQ.unpack_from(buf, 0)[0]
+        ring._state_seq = _SEQ.unpack_from(buf, ring._state_offset)[0]
+        return ring
+
+    def _slot_offset(self, seq: int) -> int:
+        return _HEADER_SIZE + (seq % self.capacity) * _SLOT_SIZE
+
+    # writer side
+
+    def write_sample(self, record: Telemetry):
+        seq = self._write_seq + 1
+        off = self._slot_offset(seq)
+        buf = self.buf
+        # invalidate the slot, fill it, then stamp it with its sequence number
+        _SEQ.pack_into(buf, off, 0)
+        leak = -1 if record.leak is None else int(bool(record.leak))
+        suit_id = (record.suit_id or "").encode("utf-8")
+        _SLOT_BODY.pack_into(buf, off + _SEQ.size, _opt(record.timestamp), _opt(record.o2), _opt(record.co2),
+                             _opt(record.battery), _opt(record.suit_temp), _opt(record.external_temp), leak,
+                             len(suit_id), suit_id)
+        _SEQ.pack_into(buf, off, seq)
+        _SEQ.pack_into(buf, 0, seq)
+        self._write_seq = seq
+
+    def write_state(self, data: bytes) -> bool:
+        if len(data) > self.state_capacity:
+            logger.warning("Worker state of %d bytes exceeds shared capacity %d", len(data), self.state_capacity)
+            return False
+        off = self._state_offset
+        seq = self._state_seq + 1
+        _SEQ.pack_into(self.buf, off, seq)  # odd: write in progress
+        _STATE_HEADER.pack_into(self.buf, off, seq, len(data))
+        start = off + _STATE_HEADER.size
+        self.buf[start:start + len(data)] = data
+        self._state_seq = seq + 1
+        _SEQ.pack_into(self.buf, off, self._state_seq)
+        return True
+
+    # reader side
+
+    def read_since(self, last_seq: int) -> Tuple[List[Telemetry], int, int]:
+        """Return (records newer than last_seq, new last_seq, records lost)."""
+        buf = self.buf
+        head = _SEQ.unpack_from(buf, 0)[0]
+        if head <= last_seq:
+            return [], last_seq, 0
+        start = max(last_seq + 1, head - self.capacity + 1)
+        lost = start - (last_seq + 1)
+        records = []
+        for seq in range(start, head + 1):
+            off = self._slot_offset(seq)
+            if _SEQ.unpack_from(buf, off)[0] != seq:
+                lost += 1
+                continue
+            ts, o2, co2, battery, suit_temp, external_temp, leak, suit_len, suit_id = _SLOT_BODY.unpack_from(buf, off + _SEQ.size)
+            if _SEQ.unpack_from(buf, off)[0] != seq:
+                # overwritten while we were reading it
+                lost += 1
+                continue
+            ts = _unopt(ts)
+            if ts is not None and ts.is_integer():
+                ts = int(ts)
+            records.append(Telemetry(
+                o2=_unopt(o2), battery=_unopt(battery), co2=_unopt(co2),
+                leak=None if leak < 0 else bool(leak),
+                suit_temp=_unopt(suit_temp), external_temp=_unopt(external_temp),
+                timestamp=ts, suit_id=suit_id[:suit_len].decode("utf-8") or None,
+            ))
+        return records, head, lost
+
+    def read_state(self, last_seq: int) -> Optional[Tuple[int, bytes]]:
+        """Return (seq, data) if the state changed since last_seq, else None."""
+        off = self._state_offset
+        for _ in range(16):
+            seq1, length = _STATE_HEADER.unpack_from(self.buf, off)
+            if seq1 == last_seq:
+                return None
+            if seq1 % 2:
+                continue
+            start = off + _STATE_HEADER.size
+            data = bytes(self.buf[start:start + min(length, self.state_capacity)])
+            if _SEQ.unpack_from(self.buf, off)[0] == seq1:
+                return seq1, data
+        return None
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    # the GUI process owns the segment; keep this process's resource tracker
+    # from unlinking it when the worker exits
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+class TelemetryWorker:
+    """GUI-side handle: owns the shared memory and the worker process."""
+
+    def __init__(self, broker_host="localhost", broker_port=1883, client_id="tricorder-engine",
+                 capacity: int = 1024, state_capacity: int = 256 * 1024, record_path: Optional[str] = None):
+        self.broker_host = broker_host
+        self.broker_port = broker_port
+        self.client_id = client_id
+        self.record_path = record_path
+        self.lost = 0
+        self._shm = shared_memory.SharedMemory(create=True, size=TelemetryRing.size(capacity, state_capacity))
+        self.ring = TelemetryRing(self._shm.buf, capacity, state_capacity, initialize=True)
+        self._last_seq = 0
+        self._last_state_seq = 0
+        self._proc = None
+
+    def start(self):
+        repo_root = str(Path(__file__).resolve().parents[2])
+        cmd = [sys.executable, "-m", "backend.telemetry.worker",
+               "--shm", self._shm.name,
+               "--host", str(self.broker_host), "--port", str(self.broker_port),
+               "--client-id", str(self.client_id)]
+        if self.record_path:
+            cmd += ["--record", str(self.record_path)]
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (repo_root, env.get("PYTHONPATH")) if p)
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, cwd=repo_root, env=env, text=True, bufsize=1)
+        logger.info("Started telemetry worker pid=%s", self._proc.pid)
+
+    def is_alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    @property
+    def exit_code(self) -> Optional[int]:
+        return self._proc.poll() if self._proc is not None else None
+
+    def read_new(self) -> List[Telemetry]:
+        records, self._last_seq, lost = self.ring.read_since(self._last_seq)
+        self.lost += lost
+        return records
+
+    def read_state(self) -> Optional[Dict[str, Any]]:
+        result = self.ring.read_state(self._last_state_seq)
+        if result is None:
+            return None
+        self._last_state_seq, data = result
+        return json.loads(data.decode("utf-8")) if data else None
+
+    def send(self, command: Dict[str, Any]) -> bool:
+        if not self.is_alive():
+            return False
+        try:
+            self._proc.stdin.write(json.dumps(command) + "\n")
+            self._proc.stdin.flush()
+            return True
+        except Exception:
+            logger.exception("Failed sending command to telemetry worker")
+            return False
+
+    def acknowledge(self, wid: str) -> bool:
+        return self.send({"cmd": "ack", "id": wid})
+
+    def set_mission_time_remaining(self, seconds) -> bool:
+        return self.send({"cmd": "mission_time", "seconds": seconds})
+
+    def stop(self, timeout: float = 3.0):
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout)
+            except Exception:
+                self._proc.kill()
+            self._proc = None
+        try:
+            self.ring = None
+            self._shm.close()
+            self._shm.unlink()
+        except Exception:
+            logger.exception("Failed releasing telemetry shared memory")
+
+
+def run_worker(shm_name: str, broker_host: str, broker_port: int, client_id: str, commands=None,
+               record_path: Optional[str] = None, state_interval: float = 1.0):
+    from backend.common.recorder import Recorder
+    from .service import TelemetryService
+
+    shm = _attach_untracked(shm_name)
+    ring = TelemetryRing.attach(shm.buf)
+    recorder = Recorder(record_path) if record_path else None
+    service = TelemetryService(broker_host, broker_port, client_id, recorder=recorder)
+
+    # called with service.lock held, so state writes never interleave
+    def publish_state():
+        ring.write_state(json.dumps({
+            "warnings": service.get_active_warnings(),
+            "forecasts": service.get_forecasts(),
+            "stats": service.ingest_stats(),
+        }, separators=(",", ":")).encode("utf-8"))
+
+    # warnings go out as soon as the active set changes (including the
+    # signal watchdog's, between samples); forecasts and counters move with
+    # every sample, so they are only refreshed every `state_interval`
+    stopped = threading.Event()
+
+    def refresh_state():
+        while not stopped.wait(state_interval):
+            with service.lock:
+                publish_state()
+
+    service.telemetry.connect(ring.write_sample)
+    service.updated.connect(lambda _diff: publish_state())
+    with service.lock:
+        publish_state()
+    service.start(fast_startup=True)
+    refresher = threading.Thread(target=refresh_state, name="worker-state", daemon=True)
+    refresher.start()
+
+    commands = commands if commands is not None else sys.stdin
+    try:
+        for line in commands:
+            try:
+                command = json.loads(line)
+            except ValueError:
+                continue
+            with service.lock:
+                if command.get("cmd") == "ack":
+                    service.acknowledge(command.get("id"))
+                elif command.get("cmd") == "mission_time":
+                    service.set_mission_time_remaining(command.get("seconds"))
+                publish_state()
+    finally:
+        stopped.set()
+        refresher.join()
+        service.shutdown()
+        if recorder is not None:
+            recorder.close()
+        ring = None
+        shm.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Helios out-of-process telemetry engine")
+    parser.add_argument("--shm", required=True, help="name of the shared memory block created by the GUI")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=1883)
+    parser.add_argument("--client-id", default="tricorder-engine")
+    parser.add_argument("--record", default=None, help="recordings database to append telemetry to")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    run_worker(args.shm, args.host, args.port, args.client_id, record_path=args.record)
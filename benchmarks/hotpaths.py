@@ -0,0 +1,352 @@
+"""Micro-benchmarks for the telemetry and mission hot paths.
+
+Runs without a broker: a fake `paho.mqtt.client` is installed in
+`sys.modules` before the backend is imported, so `MQTTClient` publishes
+into memory. Each case is timed in several repeats of an auto-sized batch
+and reported as microseconds per operation (median and best repeat).
+
+Results can be written as JSON and compared against a stored baseline;
+a case slower than the baseline by more than the tolerance is reported as
+a regression and makes the exit status 1. The baseline is machine
+specific, so it is not committed; create one locally with --save-baseline.
+
+    python benchmarks/hotpaths.py
+    python benchmarks/hotpaths.py --save-baseline
+    python benchmarks/hotpaths.py --tolerance 0.15 --json hotpaths.json
+    python benchmarks/hotpaths.py --only persistence --sizes 10 1000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_SIZES = (10, 1000, 100000)
+
+
+def install_fake_paho():
+    """Register an in-memory stand-in for paho.mqtt.client."""
+    client_mod = types.ModuleType("paho.mqtt.client")
+    client_mod.MQTT_ERR_SUCCESS = 0
+
+    class _Result:
+        rc = 0
+
+    class Client:
+        def __init__(self, client_id=None, *args, **kwargs):
+            self.client_id = client_id
+            self.on_connect = None
+            self.on_message = None
+            self.on_disconnect = None
+            self.published = 0
+            self.published_bytes = 0
+
+        def connect(self, host, port=1883, keepalive=60):
+            return 0
+
+        def connect_async(self, host, port=1883, keepalive=60):
+            return 0
+
+        def reconnect(self):
+            return 0
+
+        def loop_start(self):
+            return 0
+
+        def loop_stop(self):
+            return 0
+
+        def disconnect(self):
+            return 0
+
+        def subscribe(self, topic, qos=0):
+            return 0, 1
+
+        def publish(self, topic, payload=None, qos=0, retain=False):
+            self.published += 1
+            self.published_bytes += len(payload or "")
+            return _Result()
+
+    client_mod.Client = Client
+    mqtt_mod = types.ModuleType("paho.mqtt")
+    mqtt_mod.client = client_mod
+    paho_mod = types.ModuleType("paho")
+    paho_mod.mqtt = mqtt_mod
+    sys.modules["paho"] = paho_mod
+    sys.modules["paho.mqtt"] = mqtt_mod
+    sys.modules["paho.mqtt.client"] = client_mod
+
+
+def measure(fn, repeats=5, min_time=0.2):
+    """Time `fn(n)` (which performs n operations, or returns how many it
+    actually performed) and return us/op stats."""
+    # size the batch so one repeat takes about `min_time`
+    n = 1
+    while True:
+        start = time.perf_counter()
+        done = fn(n) or n
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or n >= 1 << 24:
+            break
+        n = max(n * 2, int(n * min_time / max(elapsed, 1e-9)))
+    samples = [elapsed / done]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        done = fn(n) or n
+        samples.append((time.perf_counter() - start) / done)
+    return {
+        "ops": done,
+        "repeats": repeats,
+        "median_us": round(statistics.median(samples) * 1e6, 3),
+        "min_us": round(min(samples) * 1e6, 3),
+    }
+
+
+# --- cases -------------------------------------------------------------------
+
+NOMINAL = {"o2": 95.0, "battery": 88.0, "co2": 0.4, "leak": False, "suit_temp": 22.0,
+           "external_temp": -60.0, "suit_id": "bench"}
+ALL_WARNINGS = {"o2": 12.0, "battery": 5.0, "co2": 6.0, "leak": True, "suit_temp": 50.0,
+                "external_temp": -60.0, "suit_id": "bench"}
+
+
+def bench_engine(results, args):
+    from backend.telemetry.models import Telemetry
+    from backend.telemetry.producer import WarningEngine
+
+    def records(payload, count):
+        t0 = time.time()
+        return [Telemetry.from_payload({**payload, "timestamp": t0 + i * 0.1}) for i in range(count)]
+
+    for name, payload in (("nominal", NOMINAL), ("all_warnings", ALL_WARNINGS)):
+        engine = WarningEngine()
+        pool = records(payload, 4096)
+
+        def run(n, engine=engine, pool=pool):
+            process = engine.process
+            for i in range(n):
+                process(pool[i & 4095])
+
+        results[f"engine.process.{name}"] = measure(run, args.repeats, args.min_time)
+
+    # alternating samples raise and clear every warning each time
+    engine = WarningEngine()
+    pool = [r for pair in zip(records(NOMINAL, 2048), records(ALL_WARNINGS, 2048)) for r in pair]
+
+    def churn(n):
+        process = engine.process
+        for i in range(n):
+            process(pool[i & 4095])
+
+    results["engine.process.raise_clear"] = measure(churn, args.repeats, args.min_time)
+
+
+def bench_mqtt_decode(results, args):
+    from backend.common.mqtt import MQTTClient
+    from backend.common.topics import TRICORDER_TELEMETRY
+
+    client = MQTTClient("bench", 1883, "bench-decode")
+    client.on_message_callback = lambda topic, payload: None
+    msg = types.SimpleNamespace(topic=TRICORDER_TELEMETRY,
+                                payload=json.dumps({**NOMINAL, "timestamp": time.time()}).encode())
+
+    def run(n):
+        on_message = client._on_message
+        for _ in range(n):
+            on_message(None, None, msg)
+
+    results["mqtt.on_message"] = measure(run, args.repeats, args.min_time)
+
+
+def bench_frames(results, args):
+    from backend.telemetry.frames import decode_frame, encode_frame
+
+    # a 20-sample batch of a slowly drifting suit, as the simulator sends it
+    t0 = time.time()
+    samples = [{**NOMINAL, "o2": round(NOMINAL["o2"] - i * 0.013, 2), "timestamp": round(t0 + i * 0.25, 3)}
+               for i in range(20)]
+    frame = encode_frame(samples)
+
+    def encode(n):
+        for _ in range(n):
+            encode_frame(samples)
+
+    def decode(n):
+        for _ in range(n):
+            decode_frame(frame)
+
+    results["frames.encode.20"] = measure(encode, args.repeats, args.min_time)
+    results["frames.decode.20"] = measure(decode, args.repeats, args.min_time)
+
+
+def make_mission(task_count, mission_id="bench-mission"):
+    from backend.mission.models import Mission, Task
+
+    tasks = [Task(id=f"t{i}", title=f"Task {i}", description="Collect and stow sample", projected_seconds=60,
+                  completed=i % 3 == 0) for i in range(task_count)]
+    return Mission(id=mission_id, name="Benchmark", description="Synthetic mission", max_duration_seconds=3600,
+                   tasks=tasks, started=True, elapsed_seconds=120)
+
+
+def bench_to_dict(results, args):
+    for size in args.sizes:
+        mission = make_mission(size)
+
+        def run(n, mission=mission):
+            for _ in range(n):
+                mission.to_dict()
+
+        results[f"mission.to_dict.{size}"] = measure(run, args.repeats, args.min_time)
+
+
+def bench_persistence(results, args, workdir):
+    from backend.mission.persistence import PersistenceManager
+
+    for size in args.sizes:
+        path = os.path.join(workdir, f"missions-{size}.json")
+        persistence = PersistenceManager(path)
+        missions = [make_mission(size)]
+
+        def save(n, persistence=persistence, missions=missions):
+            for _ in range(n):
+                persistence.save(missions)
+
+        def load(n, persistence=persistence):
+            for _ in range(n):
+                persistence.load()
+
+        results[f"persistence.save.{size}"] = measure(save, args.repeats, args.min_time)
+        results[f"persistence.load.{size}"] = measure(load, args.repeats, args.min_time)
+
+
+def bench_publish_state(results, args, workdir):
+    from backend.mission.manager import MissionManager
+
+    manager = MissionManager("bench", 1883, "bench-missions", persistence_file=os.path.join(workdir, "contended.json"),
+                             archive_after=None)
+    manager._mqtt._connected = True
+    mission = make_mission(100, "contended")
+    manager._add_mission(mission)
+
+    def run(n):
+        # `threads` publishers share n publishes while a writer keeps
+        # swapping in new snapshots of the same mission
+        stop = threading.Event()
+
+        def writer():
+            while not stop.is_set():
+                manager._mutate("contended", lambda m: (None, m.copy(elapsed_seconds=m.elapsed_seconds + 1)))
+
+        def publisher(count):
+            for _ in range(count):
+                manager._publish_state("contended")
+
+        per_thread = max(1, n // args.threads)
+        w = threading.Thread(target=writer, daemon=True)
+        workers = [threading.Thread(target=publisher, args=(per_thread,)) for _ in range(args.threads)]
+        w.start()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        stop.set()
+        w.join()
+        return per_thread * args.threads
+
+    try:
+        results[f"mission.publish_state.{args.threads}threads"] = measure(run, args.repeats, args.min_time)
+    finally:
+        manager.shutdown()
+
+
+CASES = {
+    "engine": bench_engine,
+    "mqtt": bench_mqtt_decode,
+    "frames": bench_frames,
+    "to_dict": bench_to_dict,
+    "persistence": bench_persistence,
+    "publish_state": bench_publish_state,
+}
+
+
+def compare(results, baseline, tolerance):
+    """Return (name, baseline us, current us, ratio) for every regression."""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        ratio = current["median_us"] / reference["median_us"] if reference["median_us"] else 1.0
+        if ratio > 1.0 + tolerance:
+            regressions.append((name, reference["median_us"], current["median_us"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), help="run only these groups")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES),
+                        help="task counts for to_dict and persistence")
+    parser.add_argument("--threads", type=int, default=4, help="publishers in the contention case")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="target seconds per repeat")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline as a fraction (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    install_fake_paho()
+    sys.path.insert(0, str(REPO_ROOT))
+    import logging
+    logging.disable(logging.WARNING)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="helios-bench-") as workdir:
+        for group in args.only or CASES:
+            fn = CASES[group]
+            if group in ("persistence", "publish_state"):
+                fn(results, args, workdir)
+            else:
+                fn(results, args)
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+
+    width = max(len(name) for name in results)
+    for name, r in results.items():
+        line = f"{name:<{width}}  {r['median_us']:>14.3f} us/op  (best {r['min_us']:.3f}, {r['ops']} ops x {r['repeats']})"
+        reference = baseline.get(name)
+        if reference and reference.get("median_us"):
+            line += f"  {r['median_us'] / reference['median_us'] - 1.0:+.1%} vs baseline"
+        print(line)
+
+    document = {"python": sys.version.split()[0], "platform": sys.platform, "timestamp": time.time(),
+                "results": results}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: {before:.3f} -> {after:.3f} us/op ({ratio - 1.0:+.1%}, tolerance {args.tolerance:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Long-duration soak run on a virtual clock.
+
+Wires a `SuitSimulator`, a `TelemetryService` and a `MissionManager` to one
+`VirtualClock` and steps through many hours of mission time as fast as
+the code allows (or at a fixed --speed). Simulator samples are handed
+straight to the service through a loopback client and paho is replaced by
+the in-memory fake from hotpaths.py, so no broker is needed.
+
+Every --sample-minutes of virtual time it records process RSS, the size of
+the mission catalog and warning event log, active warnings and ingest
+counters; it also keeps a timeline of raised and cleared warnings. At the
+same points the suit's consumables are swapped (as between EVAs) and one
+task per mission is completed, so missions finish and get archived.
+
+    python benchmarks/soak.py --hours 24
+    python benchmarks/soak.py --hours 8 --speed 600 --json soak.json
+"""
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # peak rather than current, in KiB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def file_size(path):
+    total = 0
+    for suffix in ("", "-wal"):
+        try:
+            total += os.path.getsize(path + suffix)
+        except OSError:
+            pass
+    return total
+
+
+class LoopbackClient:
+    """Stands in for the simulator's MQTT client and feeds the service."""
+
+    def __init__(self, service):
+        self.service = service
+
+    def publish(self, topic, payload, qos=0, retain=False):
+        self.service.handle_message(topic, payload)
+        return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=24.0, help="virtual duration")
+    parser.add_argument("--speed", type=float, default=None,
+                        help="virtual seconds per real second (default: step as fast as possible)")
+    parser.add_argument("--missions", type=int, default=3)
+    parser.add_argument("--tasks", type=int, default=20, help="tasks per mission")
+    parser.add_argument("--sample-minutes", type=float, default=30.0)
+    parser.add_argument("--workdir", help="keep the catalog and event log here instead of a temporary directory")
+    parser.add_argument("--json", help="write samples and the warning timeline to this file")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from hotpaths import install_fake_paho
+    install_fake_paho()
+    sys.path.insert(0, str(REPO_ROOT))
+    import logging
+    logging.disable(logging.WARNING)
+
+    from backend.common.clock import VirtualClock
+    from backend.mission.manager import MissionManager
+    from backend.mission.models import Mission, Task
+    from backend.mission.persistence import PersistenceManager
+    from backend.simulator.suit_simulator import SuitSimulator
+    from backend.telemetry.service import TelemetryService
+
+    tmp = None
+    workdir = args.workdir
+    if workdir is None:
+        tmp = tempfile.TemporaryDirectory(prefix="helios-soak-")
+        workdir = tmp.name
+    os.makedirs(workdir, exist_ok=True)
+    catalog = os.path.join(workdir, "missions.json")
+    event_log = os.path.join(workdir, "warning_events.db")
+
+    missions = [Mission(id=f"soak-{i}", name=f"Soak {i}", max_duration_seconds=8 * 3600,
+                        tasks=[Task(id=f"t{j}", title=f"Task {j}", projected_seconds=600) for j in range(args.tasks)])
+                for i in range(args.missions)]
+    PersistenceManager(catalog).save(missions)
+
+    clock = VirtualClock(speed=args.speed)
+    start = clock.time()
+    timeline = []
+    service = TelemetryService(event_log_path=event_log, publish_forecasts=False, clock=clock)
+    service.raised.connect(lambda w: timeline.append({"t": round(clock.time() - start, 3), "event": "raise", "id": w["id"]}))
+    service.cleared.connect(lambda wid: timeline.append({"t": round(clock.time() - start, 3), "event": "clear", "id": wid}))
+    manager = MissionManager(None, client_id=None, persistence_file=catalog, archive_after=3600.0, clock=clock)
+    for m in missions:
+        manager.start_mission(m.id)
+    sim = SuitSimulator(mqtt_client=LoopbackClient(service), client_id="soak-suit", clock=clock, adaptive=True)
+    sim.start()
+    clock.wait_for_sleepers(2)
+
+    samples = []
+    real_start = time.perf_counter()
+    step = args.sample_minutes * 60.0
+    elapsed = 0.0
+    duration = args.hours * 3600.0
+    try:
+        while elapsed < duration:
+            chunk = min(step, duration - elapsed)
+            clock.run_for(chunk)
+            elapsed += chunk
+            with service.lock:
+                stats = service.ingest_stats()
+                active = len(service.get_active_warnings())
+            sample = {
+                "virtual_hours": round(elapsed / 3600.0, 3),
+                "real_seconds": round(time.perf_counter() - real_start, 2),
+                "rss_bytes": rss_bytes(),
+                "catalog_bytes": file_size(catalog),
+                "event_log_bytes": file_size(event_log),
+                "active_warnings": active,
+                "accepted": stats["accepted"],
+                "missions_hot": len(manager.get_missions()),
+                "missions_archived": len(manager.query_archive(limit=1 << 30)),
+            }
+            samples.append(sample)
+            print(f"{sample['virtual_hours']:>7.2f} h  real {sample['real_seconds']:>7.2f} s  "
+                  f"rss {sample['rss_bytes'] / 2**20:7.1f} MiB  catalog {sample['catalog_bytes']:>8} B  "
+                  f"events {sample['event_log_bytes']:>8} B  active {active}  accepted {stats['accepted']}  "
+                  f"missions {sample['missions_hot']}+{sample['missions_archived']} archived")
+            # new EVA: fresh consumables, and some progress on every mission
+            sim.o2, sim.co2, sim.battery, sim.leak = 98.0, 0.04, 95.0, False
+            for m in manager.get_missions():
+                pending = [t for t in m.tasks if not t.completed]
+                if pending:
+                    manager.complete_task(m.id, pending[0].id)
+    finally:
+        clock.stop()
+        sim.stop()
+        manager.shutdown()
+        service.shutdown()
+
+    real = time.perf_counter() - real_start
+    print(f"{args.hours:g} virtual hours in {real:.1f} s ({duration / max(real, 1e-9):.0f}x), "
+          f"{len(timeline)} warning events, RSS growth "
+          f"{(samples[-1]['rss_bytes'] - samples[0]['rss_bytes']) / 2**20:+.1f} MiB" if samples else "no samples")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"hours": args.hours, "speed": args.speed, "real_seconds": real,
+                       "samples": samples, "timeline": timeline}, f, indent=2)
+    if tmp is not None:
+        tmp.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
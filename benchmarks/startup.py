@@ -0,0 +1,94 @@
+"""Measure time-to-first-frame of the GUI in normal and fast startup mode.
+
+Each run launches `backend/main.py --exit-after-first-frame` in a fresh
+interpreter and reads the `STARTUP first_frame_ms=...` line it prints when
+the first frame is swapped. Wall time includes interpreter start-up.
+
+    python benchmarks/startup.py --runs 5
+    QT_QPA_PLATFORM=offscreen python benchmarks/startup.py --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MAIN = REPO_ROOT / "backend" / "main.py"
+
+
+def run_once(fast: bool, timeout: float):
+    cmd = [sys.executable, str(MAIN), "--exit-after-first-frame"]
+    if fast:
+        cmd.append("--fast-startup")
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, cwd=str(REPO_ROOT))
+    first_frame_ms = None
+    wall_ms = None
+    try:
+        for line in proc.stdout:
+            if line.startswith("STARTUP "):
+                wall_ms = (time.perf_counter() - start) * 1000.0
+                fields = dict(part.split("=", 1) for part in line.split()[1:])
+                first_frame_ms = float(fields["first_frame_ms"])
+                break
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        pass
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    return first_frame_ms, wall_ms
+
+
+def summarize(samples):
+    samples = [s for s in samples if s is not None]
+    if not samples:
+        return None
+    return {
+        "runs": len(samples),
+        "median_ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+        "max_ms": round(max(samples), 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--mode", choices=["both", "normal", "fast"], default="both")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    modes = {"both": [False, True], "normal": [False], "fast": [True]}[args.mode]
+    results = {}
+    for fast in modes:
+        name = "fast" if fast else "normal"
+        frames, walls = [], []
+        for _ in range(args.runs):
+            first_frame_ms, wall_ms = run_once(fast, args.timeout)
+            frames.append(first_frame_ms)
+            walls.append(wall_ms)
+        results[name] = {"first_frame": summarize(frames), "wall": summarize(walls)}
+        ff = results[name]["first_frame"]
+        wall = results[name]["wall"]
+        if ff is None:
+            print(f"{name:>6}: no frame rendered (is a display or QT_QPA_PLATFORM=offscreen available?)")
+        else:
+            print(f"{name:>6}: time-to-first-frame median {ff['median_ms']} ms (min {ff['min_ms']}, max {ff['max_ms']}), "
+                  f"process wall median {wall['median_ms']} ms over {ff['runs']} runs")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "platform": sys.platform,
+                       "qpa": os.environ.get("QT_QPA_PLATFORM"), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,9 @@ Rectangle {
     property bool isSelected: false
     property bool isExpanded: false
     property bool initialExpanded: false
+    // a mission summary has no tasks until they are fetched on expand
+    property var loadedTasks: null
+    readonly property var tasks: missionData.tasks ? missionData.tasks : (loadedTasks || [])
     
     signal missionSelected()
     signal startMission()
@@ -20,7 +23,7 @@ Rectangle {
     height: isExpanded ? expandedHeight : collapsedHeight
     
     property int collapsedHeight: 180
-    property int expandedHeight: 260 + (missionData.tasks ? missionData.tasks.length * 80 : 0)
+    property int expandedHeight: 260 + (missionData.tasks ? missionData.tasks.length : (missionData.task_count || 0)) * 80
     
     radius: 12
     color: isSelected ? Qt.rgba(0.08, 0.25, 0.35, 0.9) : Qt.rgba(0.04, 0.12, 0.18, 0.8)
@@ -68,6 +71,18 @@ Rectangle {
         }
     }
     
+    function loadTasks() {
+        if (!isExpanded || missionData.tasks) {
+            loadedTasks = null
+            return
+        }
+        var full = missionBackend.getMission(missionData.id)
+        loadedTasks = full ? full.tasks : []
+    }
+
+    onIsExpandedChanged: loadTasks()
+    onMissionDataChanged: loadTasks()
+
     Component.onCompleted: {
         isExpanded = initialExpanded
     }
@@ -230,7 +245,7 @@ Rectangle {
                 }
                 
                 Repeater {
-                    model: missionData.tasks
+                    model: missionCard.tasks
                     
                     TaskItem {
                         width: tasksColumn.width
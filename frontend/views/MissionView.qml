@@ -9,6 +9,49 @@ Item {
     property int selectedMissionIndex: -1
     property var expandedMissions: ({}) // Track which missions are expanded by ID
 
+    // Server-side filtering and paging: only one page of cards is built
+    property int pageSize: 20
+    property string statusFilter: ""   // "", "running", "paused", "idle" or "finished"
+    property string namePrefix: ""
+    property int overMaxFilter: -1     // -1 any, 1 only missions over their time budget
+    property bool descending: false
+    property var pageCursors: [""]     // cursor of every page up to the current one
+    property string nextCursor: ""
+    property int totalMatches: 0
+    property var missionCounts: ({})
+
+    function fetchPage() {
+        var page = missionBackend.queryMissions(statusFilter, namePrefix, overMaxFilter, descending,
+                                                pageSize, pageCursors[pageCursors.length - 1])
+        nextCursor = page.nextCursor
+        totalMatches = page.total
+        missionCounts = page.counts
+        return page.missions
+    }
+
+    function resetPaging() {
+        pageCursors = [""]
+        selectedMissionIndex = -1
+        updateDebouncer.stop()
+        missions = fetchPage()
+    }
+
+    function nextPage() {
+        if (!nextCursor)
+            return
+        pageCursors = pageCursors.concat([nextCursor])
+        selectedMissionIndex = -1
+        missions = fetchPage()
+    }
+
+    function previousPage() {
+        if (pageCursors.length < 2)
+            return
+        pageCursors = pageCursors.slice(0, -1)
+        selectedMissionIndex = -1
+        missions = fetchPage()
+    }
+
     // Background with space-like gradient
     Rectangle {
         anchors.fill: parent
@@ -139,7 +182,7 @@ Item {
                 }
                 
                 Text {
-                    text: `ACTIVE MISSIONS: ${missions.filter(m => m.started).length} | COMPLETED: ${missions.filter(m => m.progress >= 100).length} | TOTAL: ${missions.length}`
+                    text: `ACTIVE MISSIONS: ${(missionCounts.running || 0) + (missionCounts.paused || 0)} | COMPLETED: ${missionCounts.completed || 0} | TOTAL: ${missionCounts.total || 0}`
                     anchors.bottom: parent.bottom
                     anchors.horizontalCenter: parent.horizontalCenter
                     anchors.bottomMargin: 8
@@ -150,6 +193,64 @@ Item {
             }
         }
 
+        // Filter bar
+        Rectangle {
+            Layout.fillWidth: true
+            height: 52
+            radius: 8
+            color: Qt.rgba(0.02, 0.07, 0.12, 0.85)
+            border.width: 1
+            border.color: "#1a4a6a"
+
+            RowLayout {
+                anchors.fill: parent
+                anchors.margins: 10
+                spacing: 8
+
+                Repeater {
+                    model: [["ALL", ""], ["RUNNING", "running"], ["PAUSED", "paused"], ["IDLE", "idle"], ["FINISHED", "finished"]]
+
+                    SpaceButton {
+                        text: modelData[0]
+                        glowColor: statusFilter === modelData[1] ? "#00ff88" : "#2a6b6f"
+                        onClicked: {
+                            statusFilter = modelData[1]
+                            resetPaging()
+                        }
+                    }
+                }
+
+                SpaceButton {
+                    text: "OVER MAX"
+                    glowColor: overMaxFilter === 1 ? "#ff4444" : "#2a6b6f"
+                    onClicked: {
+                        overMaxFilter = overMaxFilter === 1 ? -1 : 1
+                        resetPaging()
+                    }
+                }
+
+                TextField {
+                    Layout.fillWidth: true
+                    placeholderText: "NAME PREFIX"
+                    color: "#e0ffff"
+                    font.family: "Courier New"
+                    onTextChanged: {
+                        namePrefix = text
+                        resetPaging()
+                    }
+                }
+
+                SpaceButton {
+                    text: descending ? "Z-A" : "A-Z"
+                    glowColor: "#00aaff"
+                    onClicked: {
+                        descending = !descending
+                        resetPaging()
+                    }
+                }
+            }
+        }
+
         // Mission cards container
         ScrollView {
             Layout.fillWidth: true
@@ -219,9 +320,30 @@ Item {
                     text: "REFRESH"
                     glowColor: "#00aaff"
                     onClicked: {
-                        missionView.missions = missionBackend.getMissions()
+                        missionView.missions = fetchPage()
                     }
                 }
+
+                SpaceButton {
+                    text: "PREV"
+                    enabled: pageCursors.length > 1
+                    glowColor: "#00aaff"
+                    onClicked: previousPage()
+                }
+
+                Text {
+                    text: `PAGE ${pageCursors.length} | ${totalMatches} MATCHING`
+                    color: "#88ccdd"
+                    font.pixelSize: 11
+                    font.family: "Courier New"
+                }
+
+                SpaceButton {
+                    text: "NEXT"
+                    enabled: nextCursor !== ""
+                    glowColor: "#00aaff"
+                    onClicked: nextPage()
+                }
                 
                 Rectangle {
                     width: 2
@@ -286,7 +408,8 @@ Item {
     Connections {
         target: missionBackend
         function onMissionsUpdated() {
-            var newMissions = missionBackend.getMissions()
+            // refetch only the page on screen
+            var newMissions = fetchPage()
             updateDebouncer.pendingMissions = newMissions
             
             // For immediate updates (start, stop, pause, task completion), update right away
@@ -308,7 +431,15 @@ Item {
                         break
                     }
                     
-                    // Check for task completion changes
+                    // Check for task completion changes; a summary whose tasks
+                    // are not yet loaded only carries counts
+                    if (!oldMission.tasks || !newMission.tasks) {
+                        if (!oldMission.tasks !== !newMission.tasks ||
+                            oldMission.completed_tasks !== newMission.completed_tasks) {
+                            needsImmediateUpdate = true
+                        }
+                        continue
+                    }
                     if (oldMission.tasks.length !== newMission.tasks.length) {
                         needsImmediateUpdate = true
                         break
@@ -334,6 +465,6 @@ Item {
     }
 
     Component.onCompleted: {
-        missions = missionBackend.getMissions()
+        missions = fetchPage()
     }
 }
\ No newline at end of file
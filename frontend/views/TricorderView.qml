@@ -348,8 +348,9 @@ Item {
 
     Connections {
         target: backend
-        function onActiveWarningsUpdated() {
-            activeWarnings = backend.getActiveWarnings()
+        function onActiveWarningsUpdated(diff) {
+            // the update carries the whole active set; no refetch needed
+            activeWarnings = diff.active
         }
     }
 
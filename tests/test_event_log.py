@@ -0,0 +1,16 @@
+from backend.common.clock import VirtualClock
+from backend.telemetry.event_log import WarningEventLog
+
+
+def test_event_log_follows_injected_clock(tmp_path):
+    clock = VirtualClock(start=1_000_000.0)
+    log = WarningEventLog(str(tmp_path / "events.db"), max_age_seconds=3600, clock=clock)
+    try:
+        log.append("raise", "low_o2", "critical")
+        assert log.flush()
+        # stamped in virtual time, so it is recent in virtual time only
+        assert [e["timestamp"] for e in log.recent(60)] == [1_000_000.0]
+        clock.advance(120)
+        assert log.recent(60) == []
+    finally:
+        log.close()
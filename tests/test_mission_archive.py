@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("paho")
+
+from backend.common.clock import VirtualClock
+from backend.mission.manager import MissionManager
+from backend.mission.models import Mission, Task
+from backend.mission.persistence import PersistenceManager
+
+
+def make_manager(tmp_path, **kwargs):
+    catalog = str(tmp_path / "missions.json")
+    mission = Mission(id="m1", name="EVA", tasks=[Task(id="t1", title="One"), Task(id="t2", title="Two")])
+    PersistenceManager(catalog).save([mission])
+    return MissionManager(None, client_id=None, persistence_file=catalog, clock=VirtualClock(), **kwargs)
+
+
+def test_archiving_is_opt_in(tmp_path):
+    manager = make_manager(tmp_path)
+    try:
+        assert manager.archive_finished(min_idle=0) == 0
+    finally:
+        manager.shutdown()
+
+
+def test_only_completed_missions_are_archived(tmp_path):
+    manager = make_manager(tmp_path, archive_after=3600.0)
+    try:
+        manager.start_mission("m1")
+        manager.complete_task("m1", "t1")
+        manager.stop_mission("m1")
+        # stopped with a task left: not finished
+        assert manager.archive_finished(min_idle=0) == 0
+        manager.complete_task("m1", "t2")
+        assert manager.archive_finished(min_idle=0) == 1
+        assert [m["id"] for m in manager.query_archive()] == ["m1"]
+    finally:
+        manager.shutdown()
@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("paho")
+
+from backend.common.clock import VirtualClock
+from backend.mission.manager import MissionManager
+from backend.mission.models import Mission, Task
+from backend.mission.persistence import PersistenceManager
+
+
+class RecordingClient:
+    def __init__(self, connected=True):
+        self.connected = connected
+        self.published = []
+
+    def publish(self, topic, payload, retain=False):
+        if not self.connected:
+            return False
+        self.published.append((topic, payload))
+        return True
+
+
+def make_manager(tmp_path):
+    catalog = str(tmp_path / "missions.json")
+    PersistenceManager(catalog).save([Mission(id="m1", name="EVA", tasks=[Task(id="t1", title="One")])])
+    manager = MissionManager(None, client_id=None, persistence_file=catalog, clock=VirtualClock())
+    manager._mqtt = RecordingClient()
+    return manager, catalog
+
+
+def test_unhashable_command_id_is_refused(tmp_path):
+    manager, catalog = make_manager(tmp_path)
+    try:
+        manager._on_mqtt_message(MissionManager.COMMAND_TOPIC, [
+            {"action": "start", "mission_id": "m1", "command_id": "a"},
+            {"action": "stop", "mission_id": "m1", "command_id": ["x"]},
+        ])
+        acks = [p for t, p in manager._mqtt.published if t == MissionManager.ACK_TOPIC]
+        assert [(a["command_id"], a["ok"], a.get("error")) for a in acks[0]["acks"]] == [
+            ("a", True, None), (None, False, "invalid command_id")]
+        # the valid command before it was still saved
+        assert manager.get_mission("m1").started
+        assert PersistenceManager(catalog).load()[0].started
+    finally:
+        manager.shutdown()
+
+
+def test_catalog_is_published_once_connected(tmp_path):
+    manager, _ = make_manager(tmp_path)
+    try:
+        manager._mqtt.connected = False
+        manager._clock.advance(5)
+        manager._publish_catalog()
+        assert manager._catalog_published_at == 0.0
+
+        manager._mqtt.connected = True
+        manager._on_mqtt_connect()
+        catalogs = [p for t, p in manager._mqtt.published if t == MissionManager.CATALOG_TOPIC]
+        assert [m["id"] for m in catalogs[0]["missions"]] == ["m1"]
+    finally:
+        manager.shutdown()
@@ -0,0 +1,25 @@
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("paho")
+
+from backend.mission.index import MissionIndex
+from backend.mission.models import Mission, Task
+
+
+def test_completed_count_includes_running_missions():
+    done = [Task(id="t1", title="Egress", projected_seconds=60, completed=True)]
+    index = MissionIndex()
+    index.update(Mission(id="m1", name="Alpha", tasks=done, started=True))
+    index.update(Mission(id="m2", name="Bravo", tasks=done))
+    index.update(Mission(id="m3", name="Charlie", tasks=[replace(done[0], completed=False)]))
+
+    counts = index.counts()
+    # every task done, as the header's COMPLETED always counted it
+    assert counts["completed"] == 2
+    # stopped with every task done
+    assert counts["finished"] == 1
+
+    index.remove("m1")
+    assert index.counts()["completed"] == 1
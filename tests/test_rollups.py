@@ -0,0 +1,32 @@
+from backend.telemetry.models import Telemetry
+from backend.telemetry.rollups import TelemetryRollups
+
+TIERS = ((1.0, 3600.0), (10.0, 3600.0), (60.0, 3600.0))
+
+
+def test_coarse_query_before_first_cascade():
+    rollups = TelemetryRollups(tiers=TIERS, channels=("o2",))
+    for i in range(8):
+        rollups.add(Telemetry(o2=90.0 + i, timestamp=600.0 + i, suit_id="a"))
+
+    # 8 s in: neither the 10 s nor the 1 min tier has had a bucket cascade in
+    result = rollups.query("o2", 0.0, 660.0, max_points=20, suit_id="a")
+    assert result["resolution"] == 60.0
+    assert result["points"] == [{"t": 600.0, "min": 90.0, "max": 97.0, "mean": 93.5, "count": 8}]
+
+
+def test_open_data_across_a_coarse_boundary():
+    rollups = TelemetryRollups(tiers=TIERS, channels=("o2",))
+    for i in range(65):
+        rollups.add(Telemetry(o2=1.0, timestamp=600.0 + i, suit_id="a"))
+
+    points = rollups.query("o2", 600.0, 720.0, max_points=3, suit_id="a")["points"]
+    assert [(p["t"], p["count"]) for p in points] == [(600.0, 60), (660.0, 5)]
+
+
+def test_more_points_never_means_less_history():
+    rollups = TelemetryRollups()
+    span = 8 * 3600.0
+    # a full-resolution answer would need the 1 s tier, which keeps an hour
+    assert rollups.pick_tier(span, 30000) == rollups.pick_tier(span, 3000) == 2
+    assert rollups.pick_tier(3000.0, 30000) == 0
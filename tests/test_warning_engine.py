@@ -0,0 +1,57 @@
+from backend.common.clock import VirtualClock
+from backend.telemetry.producer import WarningEngine
+
+NOMINAL = {"o2": 95.0, "battery": 88.0, "co2": 0.4, "leak": False, "suit_temp": 22.0}
+
+
+def make_engine():
+    clock = VirtualClock(start=1_700_000_000.0)
+    engine = WarningEngine(clock=clock, signal_timeout=None)
+    events = []
+    engine.on_raise = lambda w: events.append(("raise", w["id"]))
+    engine.on_clear = lambda wid: events.append(("clear", wid))
+    return engine, events
+
+
+def test_forecast_warnings_do_not_flap_between_suits():
+    engine, events = make_engine()
+    engine.set_mission_time_remaining(8 * 3600)
+    t0 = 1_700_000_000.0
+    for i in range(40):
+        # suit a loses O2 fast enough to run out before the mission ends,
+        # suit b holds steady; their samples interleave
+        engine.process({**NOMINAL, "o2": 95.0 - i * 0.5, "suit_id": "a", "timestamp": t0 + i})
+        engine.process({**NOMINAL, "suit_id": "b", "timestamp": t0 + i + 0.5})
+
+    forecast = [e for e in events if e[1].startswith("forecast_o2")]
+    assert forecast == [("raise", "forecast_o2:a")]
+    assert "forecast_o2:a" in engine.active_warnings
+    assert engine.active_warnings["forecast_o2:a"]["suit_id"] == "a"
+
+
+def test_anomaly_stays_with_its_suit():
+    engine, events = make_engine()
+    t0 = 1_700_000_000.0
+    for i in range(30):
+        # suit a's O2 jumps once after warming up; suit b stays nominal
+        o2 = 60.0 if i == 25 else 95.0
+        engine.process({**NOMINAL, "o2": o2, "suit_id": "a", "timestamp": t0 + i})
+        engine.process({**NOMINAL, "suit_id": "b", "timestamp": t0 + i + 0.5})
+
+    anomalies = [e for e in events if e[1].startswith("anomaly_o2")]
+    assert anomalies == [("raise", "anomaly_o2:a")]
+    assert engine.active_warnings["anomaly_o2:a"]["suit_id"] == "a"
+
+
+def test_steady_warning_sends_one_update():
+    engine, _ = make_engine()
+    updates = []
+    engine.on_update = updates.append
+    t0 = 1_700_000_000.0
+    for i in range(10):
+        # the reading changes, the warning does not
+        engine.process({**NOMINAL, "o2": round(18.0 - i * 0.01, 2), "suit_id": "a", "timestamp": t0 + i})
+
+    assert len(updates) == 1
+    assert [w["id"] for w in updates[0]["added"]] == ["low_o2"]
+    assert engine.active_warnings["low_o2"]["message"] == "LOW O2 (17.91%)"
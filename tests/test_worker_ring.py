@@ -0,0 +1,15 @@
+from backend.telemetry.models import MAX_SUIT_ID, Telemetry
+from backend.telemetry.worker import TelemetryRing
+
+
+def test_ring_keeps_any_valid_suit_id():
+    buf = bytearray(TelemetryRing.size(4, 1024))
+    ring = TelemetryRing(buf, 4, 1024, initialize=True)
+    # multi-byte characters used to be cut mid-character at 32 bytes
+    suit_id = "ü" * MAX_SUIT_ID
+    ring.write_sample(Telemetry(o2=20.5, timestamp=1.5, suit_id=suit_id))
+    ring.write_sample(Telemetry(o2=20.4, timestamp=2.5))
+
+    records, last, lost = ring.read_since(0)
+    assert [r.suit_id for r in records] == [suit_id, None]
+    assert (last, lost) == (2, 0)